@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+""" Throughput benchmarks of the SandPaper rules.
+
+Run ``python -m benchmarks --help`` from the repository root for usage.
+Peak memory benchmarks of ``.xlsx`` applications are run with
+``python -m benchmarks.memory``.
+"""
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import sys
+import argparse
+
+from . import generate, suite
+
+
+def _parse_args(args):
+    """ Parses the command line arguments of the benchmark runner.
+
+    :param list[str] args: The command line arguments
+    :returns: The parsed arguments
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Benchmarks the throughput of SandPaper rules.'
+    )
+    parser.add_argument(
+        'benchmarks', nargs='*', metavar='BENCHMARK',
+        help='glob patterns of the benchmarks to run (default: all)'
+    )
+    parser.add_argument('--list', action='store_true', help='list benchmarks')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--columns', type=int, default=10)
+    parser.add_argument('--cardinality', type=int, default=1000)
+    parser.add_argument('--min-length', type=int, default=4)
+    parser.add_argument('--max-length', type=int, default=32)
+    parser.add_argument(
+        '--date-format', action='append', dest='date_formats',
+        help='a strftime format of date values (repeatable)'
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--formats', default=','.join(suite.FORMATS),
+        help='comma separated file types (default: %(default)s)'
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument(
+        '--engine', default='row', help='the engine passed to apply'
+    )
+    parser.add_argument(
+        '--save-baseline', metavar='PATH',
+        help='store the results as a baseline'
+    )
+    parser.add_argument(
+        '--baseline', metavar='PATH',
+        help='compare the results to a stored baseline'
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=0.1,
+        help='allowed fraction of lost throughput (default: %(default)s)'
+    )
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    """ Runs the benchmarks from the command line.
+
+    .. note:: Exits with status 1 if any result regressed against the
+        ``--baseline``.
+
+    :param list[str] args: The command line arguments (defaults to
+        ``sys.argv``)
+    :returns: The exit status
+    :rtype: int
+    """
+
+    args = _parse_args(sys.argv[1:] if args is None else args)
+    names = suite.select(args.benchmarks)
+    if args.list:
+        sys.stdout.write(''.join(
+            ('{name}\n').format(**locals()) for name in names
+        ))
+        return 0
+
+    settings = {
+        'table': {
+            'rows': args.rows,
+            'columns': args.columns,
+            'cardinality': args.cardinality,
+            'string_length': [args.min_length, args.max_length],
+            'date_formats': list(
+                args.date_formats or generate.DATE_FORMATS
+            ),
+            'seed': args.seed,
+        },
+        'apply': {'engine': args.engine},
+    }
+    (baseline, baseline_settings,) = (
+        suite.load_baseline(args.baseline)
+        if args.baseline else
+        (None, None,)
+    )
+    if baseline_settings is not None and baseline_settings != settings:
+        sys.stderr.write((
+            'warning: baseline "{args.baseline}" was recorded with different '
+            'settings {baseline_settings}\n'
+        ).format(**locals()))
+
+    def output(key, result):
+        sys.stdout.write((
+            '{key:<32} {result[rows_per_sec]:>14,.0f} rows/sec\n'
+        ).format(**locals()))
+
+    results = suite.run(
+        names=names,
+        formats=[
+            file_type.strip()
+            for file_type in args.formats.split(',')
+            if len(file_type.strip()) > 0
+        ],
+        repeat=args.repeat,
+        apply_kwargs=settings['apply'],
+        table_kwargs=dict(
+            settings['table'],
+            string_length=tuple(settings['table']['string_length'])
+        ),
+        output=output
+    )
+
+    if args.save_baseline:
+        suite.save_baseline(args.save_baseline, results, settings)
+        sys.stdout.write((
+            '... saved baseline to "{args.save_baseline}"\n'
+        ).format(**locals()))
+
+    if baseline is None:
+        return 0
+
+    regressions = 0
+    sys.stdout.write('\n')
+    for (key, comparison,) in suite.compare(
+        results, baseline, tolerance=args.tolerance
+    ).items():
+        regressions += comparison['regressed']
+        sys.stdout.write((
+            '{key:<32} {comparison[ratio]:>7.2f}x baseline{flag}\n'
+        ).format(
+            flag=(' REGRESSED' if comparison['regressed'] else ''),
+            **locals()
+        ))
+    return (1 if regressions > 0 else 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
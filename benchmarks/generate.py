@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import random
+import string
+import datetime
+
+import pyexcel
+
+COLUMN_KINDS = ('text', 'integer', 'date', 'category', 'float',)
+DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y', '%d %B %Y',)
+CATEGORIES = (
+    'Alabama', 'Alaska', 'Arizona', 'Arkansas', 'California', 'Colorado',
+    'Connecticut', 'Delaware', 'Florida', 'Georgia', 'Hawaii', 'Idaho',
+)
+EPOCH = datetime.date(1970, 1, 1)
+
+
+def column_names(columns):
+    """ Builds the column names of a synthetic table.
+
+    .. note:: Column kinds cycle through ``COLUMN_KINDS`` so column names can
+        be targeted with column filters such as ``text_.*``.
+
+    :param int columns: The number of columns
+    :returns: The column names
+    :rtype: list[str]
+    """
+
+    return [
+        ('{kind}_{index}').format(
+            kind=COLUMN_KINDS[index % len(COLUMN_KINDS)], index=index
+        )
+        for index in range(columns)
+    ]
+
+
+def _text(rng, string_length):
+    """ Builds a messy text value with mixed case and padding.
+
+    :param random.Random rng: The random number generator
+    :param tuple(int, int) string_length: The minimum and maximum length
+    :returns: The text value
+    :rtype: str
+    """
+
+    length = rng.randint(*string_length)
+    words = []
+    while sum(len(word) + 1 for word in words) < length:
+        words.append(''.join(
+            rng.choice(string.ascii_letters)
+            for _ in range(rng.randint(2, 8))
+        ))
+    return (
+        (' ' * rng.randint(0, 2)) +
+        ' '.join(words)[:length] +
+        (' ' * rng.randint(0, 2))
+    )
+
+
+def _pool(rng, kind, cardinality, string_length, date_formats):
+    """ Builds the pool of distinct values of a column.
+
+    :param random.Random rng: The random number generator
+    :param str kind: The kind of the column
+    :param int cardinality: The number of distinct values
+    :param tuple(int, int) string_length: The minimum and maximum length of
+        text values
+    :param list[str] date_formats: The formats of date values
+    :returns: The distinct values
+    :rtype: list
+    """
+
+    if kind == 'text':
+        return [_text(rng, string_length) for _ in range(cardinality)]
+    elif kind == 'integer':
+        return [rng.randint(-10000, 10000) for _ in range(cardinality)]
+    elif kind == 'date':
+        return [
+            (EPOCH + datetime.timedelta(days=rng.randint(0, 20000))).strftime(
+                rng.choice(date_formats)
+            )
+            for _ in range(cardinality)
+        ]
+    elif kind == 'category':
+        return [
+            rng.choice((str.upper, str.lower, str.title,))(category)
+            for category in CATEGORIES
+        ]
+    return [round(rng.uniform(-1000, 1000), 2) for _ in range(cardinality)]
+
+
+def generate_table(
+    rows=10000, columns=10,
+    cardinality=1000, string_length=(4, 32), date_formats=DATE_FORMATS,
+    seed=0,
+):
+    """ Generates a deterministic synthetic table.
+
+    .. note:: The same arguments always generate the same table.
+
+    :param int rows: The number of data rows
+    :param int columns: The number of columns
+    :param int cardinality: The number of distinct values per column
+        (category columns always have ``len(CATEGORIES)`` values)
+    :param tuple(int, int) string_length: The minimum and maximum length of
+        text values
+    :param list[str] date_formats: The formats of date values
+    :param int seed: The seed of the random number generator
+    :returns: The header row followed by the data rows
+    :rtype: list[list]
+    """
+
+    rng = random.Random(seed)
+    header = column_names(columns)
+    pools = [
+        _pool(
+            rng, column.split('_')[0],
+            cardinality, string_length, date_formats
+        )
+        for column in header
+    ]
+    return [header] + [
+        [rng.choice(pool) for pool in pools]
+        for _ in range(rows)
+    ]
+
+
+def write_table(table, path):
+    """ Writes a synthetic table to a file of any type pyexcel supports.
+
+    :param list[list] table: The header row followed by the data rows
+    :param str path: The path of the file to write
+    """
+
+    pyexcel.save_as(array=table, dest_file_name=path)
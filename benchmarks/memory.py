@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+""" Memory benchmarks of applying SandPaper rules to ``.xlsx`` workbooks.
+
+Every application runs in a fresh interpreter, so its peak resident set size
+only covers that application. Run ``python -m benchmarks.memory --help`` from
+the repository root for usage.
+
+.. note:: Peak resident set sizes are read with the ``resource`` module,
+    which is only available on posix platforms.
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import itertools
+import tempfile
+import subprocess
+import collections
+
+import openpyxl
+
+from . import generate, suite
+
+# the generated rows are repeated to build workbooks of any size
+SAMPLE_ROWS = 10000
+MODES = collections.OrderedDict([
+    ('stream', {'stream_xlsx': True}),
+    ('pyexcel', {'stream_xlsx': False}),
+])
+
+_CHILD = (
+    'import sys; from benchmarks import memory; '
+    'sys.stdout.write(memory._measure(*sys.argv[1:]))'
+)
+
+
+def write_workbook(path, rows, table_kwargs=None):
+    """ Writes a synthetic workbook row by row.
+
+    :param str path: The path of the workbook to write
+    :param int rows: The number of data rows
+    :param dict table_kwargs: Any named arguments, passed to
+        ``generate.generate_table``
+    :returns: The header row of the workbook
+    :rtype: list[str]
+    """
+
+    table = generate.generate_table(**dict(
+        table_kwargs or {}, rows=min(rows, SAMPLE_ROWS)
+    ))
+    book = openpyxl.Workbook(write_only=True)
+    sheet = book.create_sheet()
+    sheet.append(table[0])
+    for row in itertools.islice(itertools.cycle(table[1:]), rows):
+        sheet.append(row)
+    book.save(path)
+    return table[0]
+
+
+def _peak_rss():
+    """ Gets the peak resident set size of the current process.
+
+    :returns: The peak resident set size in bytes
+    :rtype: int
+    """
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS reports bytes
+    return (peak if sys.platform == 'darwin' else peak * 1024)
+
+
+def _measure(name, from_file, to_file, header, apply_kwargs):
+    """ Applies a benchmark and reports the peak resident set size.
+
+    .. note:: Called in a fresh interpreter by ``measure``.
+
+    :param str name: The name of the benchmark to apply
+    :param str from_file: The path of the workbook to apply to
+    :param str to_file: The path of the workbook to write
+    :param str header: The JSON header row of the workbook
+    :param str apply_kwargs: The JSON named arguments passed to ``apply``
+    :returns: The JSON peak resident set size in bytes
+    :rtype: str
+    """
+
+    paper = suite.BENCHMARKS[name](json.loads(header))
+    paper.apply(from_file, to_file, **json.loads(apply_kwargs))
+    return json.dumps(_peak_rss())
+
+
+def measure(name, from_file, to_file, header, apply_kwargs=None):
+    """ Measures the peak resident set size of applying a benchmark.
+
+    :param str name: The name of the benchmark to apply
+    :param str from_file: The path of the workbook to apply to
+    :param str to_file: The path of the workbook to write
+    :param list[str] header: The header row of the workbook
+    :param dict apply_kwargs: Any named arguments, passed to ``apply``
+    :returns: The peak resident set size in bytes
+    :rtype: int
+    """
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [root] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else [])
+    )
+    return json.loads(subprocess.check_output(
+        [
+            sys.executable, '-W', 'ignore', '-c', _CHILD,
+            name, from_file, to_file,
+            json.dumps(header), json.dumps(apply_kwargs or {}),
+        ],
+        env=env
+    ).decode('utf-8'))
+
+
+def run(
+    row_counts, name='chain.full', modes=None, table_kwargs=None, output=None,
+):
+    """ Measures the peak resident set sizes of applications to workbooks.
+
+    :param list[int] row_counts: The numbers of data rows to measure
+    :param str name: The name of the benchmark to apply
+    :param list[str] modes: The names of the ``MODES`` to measure (defaults
+        to every mode)
+    :param dict table_kwargs: Any named arguments, passed to
+        ``generate.generate_table``
+    :param callable output: A callable receiving each result as it completes
+    :returns: A dictionary of results keyed by ``{mode}.{rows}``, each
+        containing the ``rows`` and the ``peak_rss`` in bytes
+    :rtype: collections.OrderedDict[str, dict[str,....]]
+    """
+
+    results = collections.OrderedDict()
+    directory = tempfile.mkdtemp(prefix='sandpaper-benchmarks-')
+    try:
+        for rows in row_counts:
+            from_file = os.path.join(directory, 'table.xlsx')
+            header = write_workbook(from_file, rows, table_kwargs=table_kwargs)
+            for mode in (modes or MODES.keys()):
+                key = ('{mode}.{rows}').format(**locals())
+                results[key] = collections.OrderedDict([
+                    ('rows', rows),
+                    ('peak_rss', measure(
+                        name, from_file,
+                        os.path.join(directory, 'sanded.xlsx'),
+                        header, apply_kwargs=MODES[mode]
+                    )),
+                ])
+                if callable(output):
+                    output(key, results[key])
+    finally:
+        shutil.rmtree(directory)
+    return results
+
+
+def growth(results, mode):
+    """ Gets how much the peak resident set size of a mode grew with rows.
+
+    :param dict results: The results from ``run``
+    :param str mode: The name of the mode
+    :returns: The ratio of the peak resident set size of the most rows to
+        the one of the fewest rows
+    :rtype: float
+    """
+
+    peaks = sorted(
+        (result['rows'], result['peak_rss'],)
+        for (key, result,) in results.items()
+        if key.split('.')[0] == mode
+    )
+    return (float(peaks[-1][1]) / peaks[0][1])
+
+
+def _parse_args(args):
+    """ Parses the command line arguments of the memory benchmark runner.
+
+    :param list[str] args: The command line arguments
+    :returns: The parsed arguments
+    :rtype: argparse.Namespace
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.memory',
+        description=(
+            'Benchmarks the peak memory of applying SandPaper rules to '
+            'growing .xlsx workbooks.'
+        )
+    )
+    parser.add_argument(
+        '--rows', default='10000,20000,40000,80000',
+        help='comma separated numbers of rows (default: %(default)s)'
+    )
+    parser.add_argument('--columns', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--benchmark', default='chain.full', choices=list(suite.BENCHMARKS),
+        help='the benchmark to apply (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--modes', default=','.join(MODES),
+        help='comma separated modes (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--max-growth', type=float, default=1.5,
+        help=(
+            'allowed ratio of the stream peak memory of the most rows to the '
+            'one of the fewest rows (default: %(default)s)'
+        )
+    )
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    """ Runs the memory benchmarks from the command line.
+
+    .. note:: Exits with status 1 if the peak memory of the ``stream`` mode
+        grew by more than ``--max-growth`` with the number of rows.
+
+    :param list[str] args: The command line arguments (defaults to
+        ``sys.argv``)
+    :returns: The exit status
+    :rtype: int
+    """
+
+    args = _parse_args(sys.argv[1:] if args is None else args)
+    (row_counts, modes,) = (
+        sorted(int(rows) for rows in args.rows.split(',') if rows.strip()),
+        [mode.strip() for mode in args.modes.split(',') if mode.strip()],
+    )
+
+    def output(key, result):
+        sys.stdout.write((
+            '{key:<32} {peak:>10.1f} MiB peak RSS\n'
+        ).format(peak=(result['peak_rss'] / float(1 << 20)), **locals()))
+
+    results = run(
+        row_counts, name=args.benchmark, modes=modes,
+        table_kwargs={'columns': args.columns, 'seed': args.seed},
+        output=output
+    )
+
+    sys.stdout.write('\n')
+    status = 0
+    for mode in modes:
+        ratio = growth(results, mode)
+        regressed = (mode == 'stream' and ratio > args.max_growth)
+        status = (1 if regressed else status)
+        sys.stdout.write((
+            '{mode:<32} {ratio:>10.2f}x peak RSS over {rows}x rows{flag}\n'
+        ).format(
+            rows=(row_counts[-1] // row_counts[0]),
+            flag=(' GREW' if regressed else ''),
+            **locals()
+        ))
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import os
+import json
+import shutil
+import fnmatch
+import tempfile
+import warnings
+import collections
+
+from sandpaper import SandPaper
+from sandpaper.reporting import clock
+
+from . import generate
+
+FORMATS = ('csv', 'xlsx', 'xls',)
+(TEXT, DATE, NUMBER, CATEGORY,) = (
+    r'text_.*', r'date_.*', r'(integer|float)_.*', r'category_.*',
+)
+REPLACEMENTS = collections.OrderedDict([
+    ('  ', ' '), ('a', 'A'), ('the', 'The'), ('Ave', 'Avenue'),
+    ('St', 'Street'), ('Rd', 'Road'),
+])
+STATES = dict(
+    (('^{category}$').format(category=category.upper()), code,)
+    for (category, code,) in zip(generate.CATEGORIES, (
+        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA', 'HI', 'ID',
+    ))
+)
+DATES = {
+    '%Y-%m-%d': '%d/%m/%Y',
+    '%m/%d/%Y': '%d/%m/%Y',
+    '%d %B %Y': '%d/%m/%Y',
+}
+
+# every benchmark builds its SandPaper instance from the header of the table
+BENCHMARKS = collections.OrderedDict([
+    ('lower', lambda header: SandPaper().lower(column_filter=TEXT)),
+    ('upper', lambda header: SandPaper().upper(column_filter=TEXT)),
+    ('capitalize', lambda header: SandPaper().capitalize(column_filter=TEXT)),
+    ('title', lambda header: SandPaper().title(column_filter=TEXT)),
+    ('lstrip', lambda header: SandPaper().lstrip(column_filter=TEXT)),
+    ('rstrip', lambda header: SandPaper().rstrip(column_filter=TEXT)),
+    ('strip', lambda header: SandPaper().strip(column_filter=TEXT)),
+    ('increment', lambda header: SandPaper().increment(
+        amount=2, column_filter=NUMBER
+    )),
+    ('decrement', lambda header: SandPaper().decrement(
+        amount=2, column_filter=NUMBER
+    )),
+    ('replace', lambda header: SandPaper().replace(
+        REPLACEMENTS, column_filter=TEXT
+    )),
+    ('translate_text', lambda header: SandPaper().translate_text(
+        STATES, column_filter=CATEGORY
+    )),
+    ('translate_date', lambda header: SandPaper().translate_date(
+        DATES, column_filter=DATE
+    )),
+    ('add_columns', lambda header: SandPaper().add_columns({
+        'summary': ' '.join(
+            ('{{{column}}}').format(column=column) for column in header[:3]
+        ),
+        'constant': 'sanded',
+    })),
+    ('remove_columns', lambda header: SandPaper().remove_columns(
+        header[1::2]
+    )),
+    ('keep_columns', lambda header: SandPaper().keep_columns(header[:3])),
+    ('rename_columns', lambda header: SandPaper().rename_columns(
+        dict((column, column.upper(),) for column in header)
+    )),
+    ('order_columns', lambda header: SandPaper().order_columns(
+        list(reversed(header))
+    )),
+    ('chain.cleanup', lambda header: SandPaper()
+        .strip(column_filter=TEXT)
+        .lower(column_filter=TEXT)
+        .replace(REPLACEMENTS, column_filter=TEXT)),
+    ('chain.states', lambda header: SandPaper()
+        .strip(column_filter=CATEGORY)
+        .upper(column_filter=CATEGORY)
+        .translate_text(STATES, column_filter=CATEGORY)),
+    ('chain.dates', lambda header: SandPaper()
+        .strip(column_filter=DATE)
+        .translate_date(DATES, column_filter=DATE)),
+    ('chain.reshape', lambda header: SandPaper()
+        .add_columns({'source': 'synthetic'})
+        .remove_columns(header[1::2])
+        .rename_columns({header[0]: 'first'})
+        .order_columns(['source', 'first'])),
+    ('chain.full', lambda header: SandPaper()
+        .strip()
+        .title(column_filter=TEXT)
+        .replace(REPLACEMENTS, column_filter=TEXT)
+        .upper(column_filter=CATEGORY)
+        .translate_text(STATES, column_filter=CATEGORY)
+        .translate_date(DATES, column_filter=DATE)
+        .increment(column_filter=NUMBER)
+        .keep_columns(header[:5])),
+])
+
+
+def select(patterns=None):
+    """ Selects benchmarks by name.
+
+    :param list[str] patterns: A list of glob patterns of benchmark names
+        (defaults to all benchmarks)
+    :returns: The names of the selected benchmarks in order
+    :rtype: list[str]
+    """
+
+    if not patterns:
+        return list(BENCHMARKS.keys())
+    return [
+        name
+        for name in BENCHMARKS
+        if any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    ]
+
+
+def run(
+    names=None, formats=FORMATS, repeat=3,
+    apply_kwargs=None, table_kwargs=None, output=None,
+):
+    """ Runs benchmarks against synthetic tables.
+
+    .. note:: A single table is generated from ``table_kwargs`` and written
+        once per format. Each benchmark applies its SandPaper instance to the
+        table ``repeat`` times and keeps the fastest run.
+
+    :param list[str] names: The names of the benchmarks to run (defaults to
+        all benchmarks)
+    :param list[str] formats: The file types to benchmark
+    :param int repeat: The number of runs per benchmark and format
+    :param dict apply_kwargs: Any named arguments, passed to ``apply``
+    :param dict table_kwargs: Any named arguments, passed to
+        ``generate.generate_table``
+    :param callable output: A callable receiving each result as it completes
+    :returns: A dictionary of results keyed by ``{benchmark}.{format}``, each
+        containing the ``rows``, the fastest ``seconds`` and ``rows_per_sec``
+    :rtype: collections.OrderedDict[str, dict[str,....]]
+    """
+
+    (apply_kwargs, table_kwargs,) = (
+        dict(apply_kwargs or {}), dict(table_kwargs or {}),
+    )
+    table = generate.generate_table(**table_kwargs)
+    (header, rows,) = (table[0], len(table) - 1,)
+
+    results = collections.OrderedDict()
+    directory = tempfile.mkdtemp(prefix='sandpaper-benchmarks-')
+    try:
+        for file_type in formats:
+            from_file = os.path.join(
+                directory, ('table.{file_type}').format(**locals())
+            )
+            generate.write_table(table, from_file)
+            to_file = os.path.join(
+                directory, ('sanded.{file_type}').format(**locals())
+            )
+
+            for name in (names or BENCHMARKS.keys()):
+                paper = BENCHMARKS[name](header)
+                timings = []
+                for _ in range(repeat):
+                    started = clock()
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore')
+                        paper.apply(from_file, to_file, **apply_kwargs)
+                    timings.append(clock() - started)
+
+                key = ('{name}.{file_type}').format(**locals())
+                results[key] = collections.OrderedDict([
+                    ('rows', rows),
+                    ('seconds', min(timings)),
+                    ('rows_per_sec', rows / max(min(timings), 1e-9)),
+                ])
+                if callable(output):
+                    output(key, results[key])
+    finally:
+        shutil.rmtree(directory)
+    return results
+
+
+def save_baseline(path, results, settings):
+    """ Stores benchmark results as a baseline.
+
+    :param str path: The path of the baseline file
+    :param dict results: The results from ``run``
+    :param dict settings: The table and apply settings of the results
+    """
+
+    with open(path, 'w') as fp:
+        json.dump(
+            {'settings': settings, 'results': results},
+            fp, indent=2, sort_keys=True
+        )
+
+
+def load_baseline(path):
+    """ Loads a stored baseline.
+
+    :param str path: The path of the baseline file
+    :returns: A tuple of (``results``, ``settings``) of the baseline
+    :rtype: tuple(dict, dict)
+    """
+
+    with open(path, 'r') as fp:
+        baseline = json.load(fp)
+    return (baseline['results'], baseline['settings'],)
+
+
+def compare(results, baseline, tolerance=0.1):
+    """ Compares benchmark results to a baseline.
+
+    :param dict results: The results from ``run``
+    :param dict baseline: The results of the baseline
+    :param float tolerance: The fraction of baseline throughput that may be
+        lost before a result counts as a regression
+    :returns: A dictionary of comparisons keyed by result, each containing the
+        current and ``baseline`` rows per second, their ``ratio`` and if the
+        result ``regressed``, results missing from the baseline are skipped
+    :rtype: collections.OrderedDict[str, dict[str,....]]
+    """
+
+    comparisons = collections.OrderedDict()
+    for (key, result,) in results.items():
+        if key not in baseline:
+            continue
+        ratio = result['rows_per_sec'] / baseline[key]['rows_per_sec']
+        comparisons[key] = collections.OrderedDict([
+            ('rows_per_sec', result['rows_per_sec']),
+            ('baseline', baseline[key]['rows_per_sec']),
+            ('ratio', ratio),
+            ('regressed', ratio < (1.0 - tolerance)),
+        ])
+    return comparisons
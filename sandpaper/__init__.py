@@ -4,4 +4,4 @@
 # Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
 # MIT License <https://opensource.org/licenses/MIT>
 
-from .sandpaper import (SandPaper,)
+from .sandpaper import (ALL, SandPaper,)
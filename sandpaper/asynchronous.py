@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+""" Coroutines applying SandPaper instances in executors.
+
+.. note:: This module requires Python 3.5+ and is only imported by
+    ``SandPaper.apply_async`` and ``SandPaper.apply_many_async``.
+"""
+
+import os
+import copy
+import asyncio
+import inspect
+import functools
+import threading
+import traceback
+import concurrent.futures
+
+from .sandpaper import _apply_file
+
+
+def _job(paper, executor):
+    """ Prepares a SandPaper instance to be applied in an executor.
+
+    .. note:: Instances keep their rule statistics while applying, so every
+        application in the current process gets its own shallow copy sharing
+        the rules. Worker processes already receive their own (pickled) copy
+        which cannot be cancelled once started.
+
+    :param SandPaper paper: The SandPaper instance to apply
+    :param concurrent.futures.Executor executor: The executor to apply in
+    :returns: A tuple of (``job``, ``cancelled``) where ``job`` is the
+        instance to apply and ``cancelled`` the event to set to cancel the
+        application (None if it cannot be cancelled)
+    :rtype: tuple(SandPaper, threading.Event)
+    """
+
+    if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+        return (paper, None,)
+    job = copy.copy(paper)
+    job._cancelled = threading.Event()
+    return (job, job._cancelled,)
+
+
+async def _run(executor, cancelled, func, *args, **kwargs):
+    """ Runs a callable in an executor, cancelling it with the awaiting task.
+
+    :param concurrent.futures.Executor executor: The executor to run in
+        (defaults to the event loop's default executor)
+    :param threading.Event cancelled: The event cancelling the callable
+    :param callable func: The callable to run
+    :param tuple args: Any arguments, passed to ``func``
+    :param dict kwargs: Any named arguments, passed to ``func``
+    :returns: The result of the callable
+    """
+
+    loop = asyncio.get_event_loop()
+    try:
+        return await loop.run_in_executor(
+            executor, functools.partial(func, *args, **kwargs)
+        )
+    except asyncio.CancelledError:
+        if cancelled is not None:
+            cancelled.set()
+        raise
+
+
+async def apply(paper, from_file, to_file, executor=None, **kwargs):
+    """ Applies a SandPaper instance rules to a file in an executor.
+
+    :param SandPaper paper: The SandPaper instance to apply
+    :param str from_file: The path of the file to apply the rules to
+    :param str to_file: The path of the file to write to
+    :param concurrent.futures.Executor executor: The executor to apply in
+        (defaults to the event loop's default executor)
+    :param dict kwargs: Any named arguments, passed to ``apply``
+    :returns: The result of ``apply``
+    :rtype: dict[str,....]
+    """
+
+    (job, cancelled,) = _job(paper, executor)
+    return await _run(
+        executor, cancelled, job.apply, from_file, to_file, **kwargs
+    )
+
+
+async def apply_many(
+    paper, pattern_or_paths, output_dir,
+    concurrency=None, executor=None, progress=None,
+    **kwargs
+):
+    """ Applies a SandPaper instance rules to many files in an executor.
+
+    :param SandPaper paper: The SandPaper instance to apply
+    :param pattern_or_paths: A glob pattern or a list of glob patterns and
+        paths of the files to apply the rules to
+    :type pattern_or_paths: str or list[str]
+    :param str output_dir: The path of the directory to write to
+    :param int concurrency: The maximum number of files applied at once
+        (defaults to the number of available processors)
+    :param concurrent.futures.Executor executor: The executor to apply in
+        (defaults to the event loop's default executor)
+    :param callable progress: A callable (or coroutine function) receiving
+        the input path, its result, the number of completed files and the
+        total number of files as each file completes
+    :param dict kwargs: Any named arguments, passed to ``apply``
+    :returns: A dictionary of results keyed by input path, as returned by
+        ``apply_many``
+    :rtype: collections.OrderedDict[str, dict[str,....]]
+    """
+
+    (results, scheduled,) = paper._schedule_files(
+        pattern_or_paths, output_dir
+    )
+    (semaphore, completed,) = (
+        asyncio.Semaphore(concurrency or os.cpu_count() or 1),
+        [0],
+    )
+
+    async def apply_file(from_file):
+        result = results[from_file]
+        async with semaphore:
+            (job, cancelled,) = _job(paper, executor)
+            try:
+                result.update(await _run(
+                    executor, cancelled, _apply_file,
+                    job, from_file, result['to_file'], kwargs
+                ))
+            except asyncio.CancelledError:
+                # cancellation is an Exception before Python 3.8
+                raise
+            except Exception as exc:
+                # failures to transport the job or its result
+                result.update({
+                    'stats': None,
+                    'elapsed': None,
+                    'error': exc,
+                    'traceback': traceback.format_exc(),
+                })
+        completed[0] += 1
+        if progress is not None:
+            reported = progress(from_file, result, completed[0], len(results))
+            if inspect.isawaitable(reported):
+                await reported
+
+    await asyncio.gather(*[
+        apply_file(from_file) for from_file in scheduled
+    ])
+    return results
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import collections
+
+MISSING = object()
+
+
+def value_key(value):
+    """ Builds a memoization key for a value.
+
+    .. note:: Keys include the type of the value since equal values of
+        different types (``1``, ``1.0`` and ``True``) normalize differently.
+        Floats are keyed by their representation to tell ``-0.0`` from
+        ``0.0`` and to let ``nan`` values share a key.
+
+    :param value: The value to build a key for
+    :returns: The key of the value
+    :rtype: tuple
+    """
+
+    if isinstance(value, float):
+        return (float, repr(value),)
+    return (type(value), value,)
+
+
+class LRUCache(object):
+    """ A bounded mapping evicting the least recently used items.
+    """
+
+    __slots__ = ('_size', '_items',)
+
+    def __init__(self, size):
+        """ Initializes the LRUCache object.
+
+        :param int size: The maximum number of items to keep
+        """
+
+        self._size = size
+        self._items = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, default=None):
+        """ Gets an item, marking it as the most recently used.
+
+        :param key: The key of the item
+        :param default: The value to return if the item is not cached
+        :returns: The cached item or ``default``
+        """
+
+        try:
+            value = self._items.pop(key)
+        except KeyError:
+            return default
+        self._items[key] = value
+        return value
+
+    def set(self, key, value):
+        """ Sets an item, evicting the least recently used item if full.
+
+        :param key: The key of the item
+        :param value: The item
+        """
+
+        self._items.pop(key, None)
+        if len(self._items) >= self._size:
+            self._items.popitem(last=False)
+        self._items[key] = value
+
+
+class RuleMemo(object):
+    """ Memoized results of a single rule, kept per column.
+    """
+
+    __slots__ = ('size', 'hits', 'misses', '_caches',)
+
+    def __init__(self, size):
+        """ Initializes the RuleMemo object.
+
+        :param int size: The maximum number of results to keep per column
+        """
+
+        (self.size, self.hits, self.misses,) = (size, 0, 0,)
+        self._caches = {}
+
+    def get(self, column, value):
+        """ Gets the memoized result of a value.
+
+        :param str column: The column of the value
+        :param value: The value the rule was applied to
+        :returns: The memoized result or ``MISSING``
+        """
+
+        cache = self._caches.get(column)
+        try:
+            result = (
+                cache.get(value_key(value), MISSING)
+                if cache is not None else
+                MISSING
+            )
+        except TypeError:
+            # unhashable values are never memoized
+            result = MISSING
+
+        if result is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def set(self, column, value, result):
+        """ Memoizes the result of a value.
+
+        :param str column: The column of the value
+        :param value: The value the rule was applied to
+        :param result: The result of the rule
+        """
+
+        cache = self._caches.get(column)
+        if cache is None:
+            cache = self._caches[column] = LRUCache(self.size)
+        try:
+            cache.set(value_key(value), result)
+        except TypeError:
+            pass
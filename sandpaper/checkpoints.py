@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import os
+import json
+import datetime
+import tempfile
+import collections
+
+import six
+
+VERSION = 2
+CHECKPOINT_SIZE = (64 << 20)
+# datetimes are dates, so they are checked first
+DATE_TYPES = collections.OrderedDict([
+    ('datetime', datetime.datetime),
+    ('date', datetime.date),
+    ('time', datetime.time),
+])
+# the formats isoformat writes without and with microseconds (fromisoformat
+# is not available before Python 3.7)
+DATE_FORMATS = {
+    'datetime': ('%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%S.%f',),
+    'date': ('%Y-%m-%d', '%Y-%m-%d',),
+    'time': ('%H:%M:%S', '%H:%M:%S.%f',),
+}
+
+# os.replace is not available in Python 2 (where os.rename replaces on posix)
+_replace_file = getattr(os, 'replace', os.rename)
+
+
+def fingerprint(path):
+    """ Builds the fingerprint of an input file a checkpoint is valid for.
+
+    :param str path: The path of the file
+    :returns: A dictionary of the absolute ``path``, ``size`` and
+        modification time (``mtime``) of the file
+    :rtype: dict[str,....]
+    """
+
+    stat = os.stat(path)
+    return {
+        'path': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+    }
+
+
+def encode_header(header):
+    """ Encodes the column names of a header as a json list.
+
+    .. note:: Column names converted while reading (such as numbers and
+        dates) keep their type, strings, numbers and None are stored as is
+        and dates without a timezone as ``{"type": ..., "value": ...}``
+        objects.
+
+    :param list header: The column names to encode
+    :raises ValueError: If a column name cannot be encoded
+    :returns: The encoded column names
+    :rtype: list
+    """
+
+    encoded = []
+    for column in header:
+        if column is None or isinstance(
+            column, six.string_types + six.integer_types + (float,)
+        ):
+            encoded.append(column)
+            continue
+        for (name, date_type,) in DATE_TYPES.items():
+            if isinstance(column, date_type) and \
+                    getattr(column, 'tzinfo', None) is None:
+                encoded.append({'type': name, 'value': column.isoformat()})
+                break
+        else:
+            raise ValueError((
+                'cannot checkpoint column name {column!r}'
+            ).format(**locals()))
+    return encoded
+
+
+def decode_header(encoded):
+    """ Decodes the column names encoded by ``encode_header``.
+
+    :param list encoded: The encoded column names
+    :raises ValueError: If an encoded column name is not valid
+    :returns: The column names
+    :rtype: list
+    """
+
+    header = []
+    for column in encoded:
+        if isinstance(column, dict):
+            if column.get('type') not in DATE_TYPES or \
+                    not isinstance(column.get('value'), six.string_types):
+                raise ValueError((
+                    'cannot decode column name {column!r}'
+                ).format(**locals()))
+            (name, value,) = (column['type'], column['value'],)
+            # strptime raises a ValueError for values of any other format
+            column = datetime.datetime.strptime(
+                value, DATE_FORMATS[name]['.' in value]
+            )
+            if name != 'datetime':
+                column = getattr(column, name)()
+        header.append(column)
+    return header
+
+
+def load(checkpoint_path):
+    """ Loads a checkpoint.
+
+    :param str checkpoint_path: The path of the checkpoint
+    :returns: The checkpoint or None if there is no checkpoint
+    :rtype: dict[str,....]
+    """
+
+    if not os.path.isfile(checkpoint_path):
+        return None
+    with open(checkpoint_path, 'r') as fp:
+        return json.load(fp)
+
+
+def save(checkpoint_path, checkpoint):
+    """ Saves a checkpoint, replacing any previous checkpoint atomically.
+
+    :param str checkpoint_path: The path of the checkpoint
+    :param dict checkpoint: The checkpoint to save
+    """
+
+    (handle, temporary_path,) = tempfile.mkstemp(
+        suffix='.tmp',
+        dir=os.path.dirname(os.path.abspath(checkpoint_path))
+    )
+    try:
+        with os.fdopen(handle, 'w') as fp:
+            json.dump(checkpoint, fp, sort_keys=True)
+            fp.flush()
+            os.fsync(fp.fileno())
+        _replace_file(temporary_path, checkpoint_path)
+    finally:
+        if os.path.isfile(temporary_path):
+            os.remove(temporary_path)
+
+
+def remove(checkpoint_path):
+    """ Removes a checkpoint once the application it belongs to completed.
+
+    :param str checkpoint_path: The path of the checkpoint
+    """
+
+    if os.path.isfile(checkpoint_path):
+        os.remove(checkpoint_path)
+
+
+def mismatches(checkpoint, expected):
+    """ Finds the fields of a checkpoint which prevent resuming from it.
+
+    :param dict checkpoint: The loaded checkpoint
+    :param dict expected: The ``version``, ``uid``, ``input``, ``output`` and
+        ``options`` of the application being resumed
+    :returns: The sorted names of the fields that differ
+    :rtype: list[str]
+    """
+
+    # compare the values as they would be loaded from json
+    expected = json.loads(json.dumps(expected))
+    return sorted(
+        key
+        for (key, value,) in expected.items()
+        if checkpoint.get(key) != value
+    )
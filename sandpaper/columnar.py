@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import collections
+
+import six
+
+from .records import Header, Record
+
+
+def _string_kernel(method_name):
+    """ Builds a column kernel for a ``str`` method based value rule.
+
+    :param str method_name: The name of the string method to apply
+    :returns: A column kernel only applying the method to text values
+    :rtype: callable
+    """
+
+    def kernel(values, **kwargs):
+        return [
+            (
+                getattr(value, method_name)()
+                if isinstance(value, six.string_types) else
+                value
+            )
+            for value in values
+        ]
+
+    kernel.__name__ = method_name
+    return kernel
+
+
+def _strip_kernel(method_name):
+    """ Builds a column kernel for a ``content`` stripping value rule.
+
+    :param str method_name: The name of the string strip method to apply
+    :returns: A column kernel only stripping text values
+    :rtype: callable
+    """
+
+    def kernel(values, content=None, **kwargs):
+        return [
+            (
+                getattr(value, method_name)(content)
+                if isinstance(value, six.string_types) else
+                value
+            )
+            for value in values
+        ]
+
+    kernel.__name__ = method_name
+    return kernel
+
+
+def increment(values, amount=1, **kwargs):
+    """ Column kernel for the ``increment`` value rule.
+
+    :param list values: The column values to increment
+    :param amount: The amount to increment by
+    :type amount: int or float
+    :param dict kwargs: Any named arguments
+    :returns: The incremented column values
+    :rtype: list
+    """
+
+    return [
+        ((value + amount) if isinstance(value, (int, float,)) else value)
+        for value in values
+    ]
+
+
+def decrement(values, amount=1, **kwargs):
+    """ Column kernel for the ``decrement`` value rule.
+
+    :param list values: The column values to decrement
+    :param amount: The amount to decrement by
+    :type amount: int or float
+    :param dict kwargs: Any named arguments
+    :returns: The decremented column values
+    :rtype: list
+    """
+
+    return [
+        ((value - amount) if isinstance(value, (int, float,)) else value)
+        for value in values
+    ]
+
+
+def add_columns(header, columns, count, additions, **kwargs):
+    """ Column kernel for the ``add_columns`` record rule.
+
+    .. note:: Callable additions receive the full record and may mutate it,
+        so they are not supported at the column level.
+
+    :param list header: The current column names
+    :param list columns: The current column values
+    :param int count: The number of records in the batch
+    :param additions: A dictionary of column names to strings or other values
+    :type additions: dict[str,....]
+    :param dict kwargs: Any named arguments
+    :returns: The new (``header``, ``columns``) or None if unsupported
+    :rtype: tuple(list[str], list[list])
+    """
+
+    if any(callable(value) for value in additions.values()):
+        return None
+
+    (header, columns,) = (list(header), list(columns),)
+    for (name, value,) in additions.items():
+        if name in header:
+            continue
+
+        if isinstance(value, six.string_types):
+            column = [
+                value.format(**dict(zip(header, row)))
+                for row in _rows(columns, count)
+            ]
+        else:
+            column = [value] * count
+        header.append(name)
+        columns.append(column)
+
+    return (header, columns,)
+
+
+def remove_columns(header, columns, count, removes, **kwargs):
+    """ Column kernel for the ``remove_columns`` record rule.
+
+    :param list header: The current column names
+    :param list columns: The current column values
+    :param int count: The number of records in the batch
+    :param removes: A list of columns to remove
+    :type removes: list[str]
+    :param dict kwargs: Any named arguments
+    :returns: The new (``header``, ``columns``)
+    :rtype: tuple(list[str], list[list])
+    """
+
+    kept = [
+        index
+        for (index, column_name,) in enumerate(header)
+        if column_name not in removes
+    ]
+    return (
+        [header[index] for index in kept],
+        [columns[index] for index in kept],
+    )
+
+
+def keep_columns(header, columns, count, keeps, **kwargs):
+    """ Column kernel for the ``keep_columns`` record rule.
+
+    :param list header: The current column names
+    :param list columns: The current column values
+    :param int count: The number of records in the batch
+    :param keeps: A list of columns to keep
+    :type keeps: list[str]
+    :param dict kwargs: Any named arguments
+    :returns: The new (``header``, ``columns``)
+    :rtype: tuple(list[str], list[list])
+    """
+
+    kept = [
+        index
+        for (index, column_name,) in enumerate(header)
+        if column_name in keeps
+    ]
+    return (
+        [header[index] for index in kept],
+        [columns[index] for index in kept],
+    )
+
+
+def rename_columns(header, columns, count, renames, **kwargs):
+    """ Column kernel for the ``rename_columns`` record rule.
+
+    :param list header: The current column names
+    :param list columns: The current column values
+    :param int count: The number of records in the batch
+    :param renames: A dictionary of column to column renames
+    :type renames: dict[str, str]
+    :param dict kwargs: Any named arguments
+    :returns: The new (``header``, ``columns``)
+    :rtype: tuple(list[str], list[list])
+    """
+
+    # colliding names keep the position of the first and the last value
+    positions = collections.OrderedDict(
+        ((renames[key] if key in renames else key), index,)
+        for (index, key,) in enumerate(header)
+    )
+    return (
+        list(positions.keys()),
+        [columns[index] for index in positions.values()],
+    )
+
+
+def order_columns(
+    header, columns, count, order,
+    ignore_missing=False,
+    **kwargs
+):
+    """ Column kernel for the ``order_columns`` record rule.
+
+    :param list header: The current column names
+    :param list columns: The current column values
+    :param int count: The number of records in the batch
+    :param order: The order that columns need to be in
+    :type order: list[str]
+    :param bool ignore_missing: Boolean which inidicates if missing columns
+        from ``order`` should be ignored
+    :param dict kwargs: Any named arguments
+    :returns: The new (``header``, ``columns``)
+    :rtype: tuple(list[str], list[list])
+    """
+
+    positions = dict((key, index,) for (index, key,) in enumerate(header))
+    ordered = collections.OrderedDict(
+        (column_name, positions[column_name],)
+        for column_name in order
+        if column_name in positions
+    )
+    if not ignore_missing:
+        for (index, column_name,) in enumerate(header):
+            if column_name not in order:
+                ordered[column_name] = index
+
+    return (
+        list(ordered.keys()),
+        [columns[index] for index in ordered.values()],
+    )
+
+
+def _rows(columns, count):
+    """ Iterates over the rows of a set of columns.
+
+    :param list columns: The column values
+    :param int count: The number of records in the batch
+    :returns: A generator yielding row value tuples
+    """
+
+    if len(columns) > 0:
+        return zip(*columns)
+    return (() for _ in range(count))
+
+
+def pivot(records):
+    """ Pivots a batch of records into columns.
+
+    :param list records: A list of records sharing the same column names
+    :returns: A tuple of (``header``, ``columns``) or None if the records do
+        not share the same column names
+    :rtype: tuple(list[str], list[list])
+    """
+
+    first = records[0]
+    if isinstance(first, Record) and all(
+        isinstance(record, Record) and record.header is first.header
+        for record in records
+    ):
+        # records sharing a header are pivoted without key lookups
+        header = list(first.header.columns)
+        rows = [record.row for record in records]
+    else:
+        header = list(first.keys())
+        for record in records:
+            if len(record) != len(header) or list(record.keys()) != header:
+                return None
+        rows = [list(record.values()) for record in records]
+    return (
+        header,
+        [list(column) for column in zip(*rows)] if len(header) > 0 else [],
+    )
+
+
+def unpivot(header, columns, count):
+    """ Pivots columns back into a batch of records.
+
+    :param list header: The column names
+    :param list columns: The column values
+    :param int count: The number of records in the batch
+    :returns: A list of records sharing the same header
+    :rtype: list[Record]
+    """
+
+    header = Header.intern(header)
+    return [Record(header, list(row)) for row in _rows(columns, count)]
+
+
+VALUE_KERNELS = {
+    'lower': _string_kernel('lower'),
+    'upper': _string_kernel('upper'),
+    'capitalize': _string_kernel('capitalize'),
+    'title': _string_kernel('title'),
+    'lstrip': _strip_kernel('lstrip'),
+    'rstrip': _strip_kernel('rstrip'),
+    'strip': _strip_kernel('strip'),
+    'increment': increment,
+    'decrement': decrement,
+}
+
+RECORD_KERNELS = {
+    'add_columns': add_columns,
+    'remove_columns': remove_columns,
+    'keep_columns': keep_columns,
+    'rename_columns': rename_columns,
+    'order_columns': order_columns,
+}
@@ -0,0 +1,619 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import io
+import os
+import csv
+import glob
+import mmap
+import codecs
+import itertools
+import contextlib
+
+import six
+from pyexcel_io import service
+
+from .records import Header, Record, is_ordered
+
+DELIMITED_EXTENSIONS = ('.csv', '.tsv',)
+DIALECTS = {'csv': 'excel', 'tsv': 'excel-tab'}
+DELIMITERS = {'csv': b',', 'tsv': b'\t'}
+SPLITTABLE_ENCODINGS = ('utf-8', 'ascii',)
+MINIMUM_RANGE_SIZE = (1 << 20)
+BLOCK_SIZE = (1 << 20)
+
+(QUOTE, NEWLINE, RETURN, NUL,) = (b'"', b'\n', b'\r', b'\x00',)
+
+
+def get_file_type(path):
+    """ Gets the delimited file type (``csv`` or ``tsv``) of a path.
+
+    :param str path: The path to get the file type of
+    :returns: The file type or None if the path is not a delimited file
+    :rtype: str
+    """
+
+    if not isinstance(path, six.string_types):
+        return None
+
+    extension = os.path.splitext(path)[-1].lower()
+    return (extension[1:] if extension in DELIMITED_EXTENSIONS else None)
+
+
+def is_delimited(path):
+    """ Checks if a path refers to a delimited (``.csv`` or ``.tsv``) file.
+
+    :param str path: The path to check
+    :returns: True if the path has a delimited file extension
+    :rtype: bool
+    """
+
+    return get_file_type(path) is not None
+
+
+def is_multiple_sheets(path):
+    """ Checks if a delimited file is stored as multiple sheet files.
+
+    .. note:: pyexcel writes each sheet of a book to a separate
+        ``{name}__{sheet}__{index}{extension}`` file and reads them back as
+        one book.
+
+    :param str path: The path to check
+    :returns: True if sheet files exist for the path
+    :rtype: bool
+    """
+
+    (name, extension,) = os.path.splitext(path)
+    return len(glob.glob(
+        ('{name}__*__*{extension}').format(**locals())
+    )) > 0
+
+
+def is_splittable_encoding(encoding):
+    """ Checks if byte offsets of an encoding can be split at ``\\n`` bytes.
+
+    :param str encoding: The name of the encoding
+    :returns: True if the encoding can be split at newline bytes
+    :rtype: bool
+    """
+
+    try:
+        return codecs.lookup(encoding).name in SPLITTABLE_ENCODINGS
+    except LookupError:
+        return False
+
+
+def find_boundaries(fp, targets, block_size=BLOCK_SIZE):
+    """ Finds the record boundaries following a list of byte offsets.
+
+    .. note:: Quotes are tracked by their parity which assumes quoting
+        follows RFC 4180 (quote characters only appear within quoted fields
+        and are escaped by doubling them). A newline is only a record boundary
+        if an even number of quotes precedes it.
+
+    :param file fp: A binary file object positioned at the start of the file
+    :param list[int] targets: The ascending byte offsets to find the next
+        boundary at or after
+    :param int block_size: The number of bytes to scan at a time
+    :returns: A tuple of (``boundaries``, ``balanced``) where ``boundaries``
+        is the ascending list of unique offsets right after each found record
+        boundary and ``balanced`` indicates if the file has balanced quotes
+    :rtype: tuple(list[int], bool)
+    """
+
+    (boundaries, pending, offset, parity,) = ([], list(targets), 0, 0,)
+    while True:
+        block = fp.read(block_size)
+        if len(block) <= 0:
+            break
+
+        (end, cursor,) = (offset + len(block), 0,)
+        while len(pending) > 0 and pending[0] < end:
+            target = max(pending[0] - offset, cursor)
+            parity ^= (block.count(QUOTE, cursor, target) & 1)
+            cursor = target
+
+            found = None
+            while found is None:
+                index = block.find(NEWLINE, cursor)
+                if index < 0:
+                    break
+                parity ^= (block.count(QUOTE, cursor, index) & 1)
+                cursor = index + 1
+                if parity == 0:
+                    found = offset + cursor
+            if found is None:
+                # boundary continues into the next block
+                break
+
+            boundaries.append(found)
+            while len(pending) > 0 and pending[0] <= found:
+                pending.pop(0)
+
+        parity ^= (block.count(QUOTE, cursor) & 1)
+        offset = end
+
+    return (boundaries, parity == 0,)
+
+
+def split_records(path, count, minimum_size=None):
+    """ Splits a delimited file into byte ranges at record boundaries.
+
+    :param str path: The path of the delimited file
+    :param int count: The maximum number of ranges to split into
+    :param int minimum_size: The minimum size of each range in bytes
+        (defaults to ``MINIMUM_RANGE_SIZE``)
+    :returns: A tuple of (``header_range``, ``ranges``) where each range is a
+        tuple of (``start``, ``end``) byte offsets, or None if the file cannot
+        be split
+    :rtype: tuple(tuple(int, int), list[tuple(int, int)])
+    """
+
+    if minimum_size is None:
+        minimum_size = MINIMUM_RANGE_SIZE
+
+    size = os.path.getsize(path)
+    count = max(1, min(count, size // max(1, minimum_size)))
+    with open(path, 'rb') as fp:
+        (boundaries, balanced,) = find_boundaries(
+            fp, [0] + [(size * index) // count for index in range(1, count)]
+        )
+
+    # unbalanced quotes mean parity cannot be trusted to find boundaries
+    if not balanced or len(boundaries) <= 0:
+        return None
+
+    offsets = boundaries + ([size] if boundaries[-1] < size else [])
+    return (
+        (0, offsets[0],),
+        [
+            (start, end,)
+            for (start, end,) in zip(offsets[:-1], offsets[1:])
+        ],
+    )
+
+
+class ByteRangeReader(io.RawIOBase):
+    """ A readable raw stream over a sequence of byte ranges of a file.
+
+    Allows reading the header range and a single record range of a delimited
+    file as if they were one continuous file.
+    """
+
+    def __init__(self, path, ranges):
+        """ Initializes the ByteRangeReader object.
+
+        :param str path: The path of the file to read
+        :param list[tuple(int, int)] ranges: A list of (``start``, ``end``)
+            byte offsets to read in order
+        """
+
+        super(ByteRangeReader, self).__init__()
+        self._fp = open(path, 'rb')
+        self._ranges = list(ranges)
+        self._size = sum((end - start) for (start, end,) in self._ranges)
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._position = max(0, offset)
+        return self._position
+
+    def readinto(self, buffer):
+        """ Reads bytes from the current ranges into a buffer.
+
+        :param bytearray buffer: The buffer to read into
+        :returns: The number of bytes read
+        :rtype: int
+        """
+
+        (read, skipped,) = (0, 0,)
+        for (start, end,) in self._ranges:
+            length = (end - start)
+            if self._position >= skipped + length:
+                skipped += length
+                continue
+
+            self._fp.seek(start + (self._position - skipped))
+            data = self._fp.read(
+                min(len(buffer) - read, (skipped + length) - self._position)
+            )
+            buffer[read:read + len(data)] = data
+            (read, self._position,) = (
+                read + len(data), self._position + len(data),
+            )
+            skipped += length
+            if read >= len(buffer):
+                break
+        return read
+
+    def close(self):
+        if not self.closed:
+            self._fp.close()
+        super(ByteRangeReader, self).close()
+
+
+def open_ranges(path, ranges, encoding='utf-8'):
+    """ Opens byte ranges of a delimited file as a single text stream.
+
+    .. note:: Newlines are translated the same way ``open`` translates them
+        for text files.
+
+    :param str path: The path of the file to read
+    :param list[tuple(int, int)] ranges: A list of (``start``, ``end``) byte
+        offsets to read in order
+    :param str encoding: The encoding of the file
+    :returns: A text stream over the ranges
+    :rtype: io.TextIOWrapper
+    """
+
+    return io.TextIOWrapper(
+        io.BufferedReader(ByteRangeReader(path, ranges)),
+        encoding=encoding
+    )
+
+
+def _trim(row):
+    """ Removes trailing empty cells from a row.
+
+    :param list row: The row to trim
+    :returns: The trimmed row
+    :rtype: list
+    """
+
+    end = len(row)
+    while end > 0 and (row[end - 1] is None or row[end - 1] == ''):
+        end -= 1
+    return (row if end == len(row) else row[:end])
+
+
+def _trim_cells(row):
+    """ Removes trailing empty cells from a row of read cells.
+
+    :param list row: The row of text (or encoded text) cells to trim
+    :returns: The trimmed row
+    :rtype: list
+    """
+
+    end = len(row)
+    while end > 0 and not row[end - 1]:
+        end -= 1
+    return (row if end == len(row) else row[:end])
+
+
+def _cell_converter(
+    auto_detect_float=True, ignore_infinity=True, auto_detect_int=True,
+    auto_detect_datetime=True, pep_0515_off=True, ignore_nan_text=False,
+    default_float_nan=None, cache_size=(1 << 16), encoding=None,
+):
+    """ Builds a cell converter matching the pyexcel csv reader.
+
+    .. note:: Conversions are memoized by cell text since the same values
+        tend to repeat throughout a column. The memo is cleared once it holds
+        ``cache_size`` values. When ``encoding`` is given, cells may also be
+        encoded text which is only decoded when its conversion is not
+        memoized yet.
+
+    :param bool auto_detect_float: Boolean flag for converting floats
+    :param bool ignore_infinity: Boolean flag for not converting infinity
+    :param bool auto_detect_int: Boolean flag for converting integers
+    :param bool auto_detect_datetime: Boolean flag for converting dates
+    :param bool pep_0515_off: Boolean flag for not converting numbers with
+        underscores
+    :param bool ignore_nan_text: Boolean flag for not converting ``nan``
+    :param str default_float_nan: The text to convert to ``nan``
+    :param int cache_size: The maximum number of memoized conversions
+    :param str encoding: The encoding of encoded cells
+        (defaults to only converting text cells)
+    :returns: A callable converting cell text
+    :rtype: callable
+    """
+
+    infinities = (float('inf'), float('-inf'),)
+    memo = {}
+
+    def convert(cell):
+        try:
+            return memo[cell]
+        except KeyError:
+            pass
+
+        text = (
+            cell.decode(encoding)
+            if encoding is not None and isinstance(cell, bytes) else
+            cell
+        )
+        value = None
+        if auto_detect_int:
+            value = service.detect_int_value(text, pep_0515_off)
+        if value is None and auto_detect_float:
+            value = service.detect_float_value(
+                text, pep_0515_off,
+                ignore_nan_text=ignore_nan_text,
+                default_float_nan=default_float_nan
+            )
+            if ignore_infinity and value in infinities:
+                value = None
+        if value is None and auto_detect_datetime:
+            value = service.detect_date_value(text)
+        if value is None:
+            value = text
+
+        # every nan is a distinct object (and column name) to pyexcel
+        if value == value:
+            if len(memo) >= cache_size:
+                memo.clear()
+            memo[cell] = value
+        return value
+
+    return convert
+
+
+def read_records(fp, file_type='csv', columns=None, **kwargs):
+    """ Reads records from a delimited text stream.
+
+    .. note:: Records are read exactly like ``pyexcel.iget_records`` reads
+        them. Cells are converted with the same pyexcel-io detection, trailing
+        empty cells are trimmed, and short rows are filled with ``''``.
+
+    .. note:: Records share a single header (and a second one for rows with
+        more cells than the header). When ``columns`` is given, cells of other
+        columns are never converted and left out of the records.
+
+    :param file fp: A text stream opened with universal newlines
+    :param str file_type: The type of the file, either ``csv`` or ``tsv``
+    :param columns: The column names to read (defaults to every column)
+    :param dict kwargs: Any of the pyexcel csv reader type detection options
+    :returns: A generator yielding records
+    """
+
+    return _build_records(
+        csv.reader(fp, dialect=DIALECTS[file_type]),
+        _cell_converter(**kwargs), columns=columns
+    )
+
+
+def _mapped_blocks(mapped, start, end, block_size=None):
+    """ Splits a byte range of a memory mapped file into blocks of records.
+
+    .. note:: Blocks end right after a newline which follows an even number
+        of quotes (see ``find_boundaries``), so quoted cells spanning lines
+        are never split between blocks.
+
+    :param mmap.mmap mapped: The memory mapped file
+    :param int start: The byte offset of the start of the range
+    :param int end: The byte offset of the end of the range
+    :param int block_size: The minimum number of bytes of each block
+        (defaults to ``BLOCK_SIZE``)
+    :returns: A generator yielding blocks of bytes
+    """
+
+    if block_size is None:
+        block_size = BLOCK_SIZE
+    while start < end:
+        newline = mapped.find(NEWLINE, min(start + block_size, end) - 1, end)
+        stop = (end if newline < 0 else newline + 1)
+        block = mapped[start:stop]
+        if (block.count(QUOTE) & 1) > 0:
+            (pieces, parity,) = ([block], 1,)
+            while parity > 0 and stop < end:
+                newline = mapped.find(NEWLINE, stop, end)
+                piece = mapped[stop:(end if newline < 0 else newline + 1)]
+                (parity, stop,) = (
+                    parity ^ (piece.count(QUOTE) & 1), stop + len(piece),
+                )
+                pieces.append(piece)
+            block = b''.join(pieces)
+        yield block
+        start = stop
+
+
+def _mapped_rows(mapped, ranges, file_type='csv', encoding='utf-8'):
+    """ Reads rows of encoded cells from byte ranges of a memory mapped file.
+
+    .. note:: Blocks without quotes, carriage returns (other than in
+        ``\\r\\n`` line endings) or nul bytes are split into rows and cells
+        as bytes without being decoded. Other blocks are decoded and read
+        with the ``csv`` module (with newlines translated like universal
+        newlines), yielding rows of text cells instead.
+
+    :param mmap.mmap mapped: The memory mapped file
+    :param list[tuple(int, int)] ranges: A list of (``start``, ``end``) byte
+        offsets to read in order
+    :param str file_type: The type of the file, either ``csv`` or ``tsv``
+    :param str encoding: The encoding of the file
+    :returns: A generator yielding rows of cells
+    """
+
+    (delimiter, dialect,) = (DELIMITERS[file_type], DIALECTS[file_type],)
+    for (start, end,) in ranges:
+        for block in _mapped_blocks(mapped, start, end):
+            if RETURN in block:
+                block = block.replace(b'\r\n', NEWLINE)
+            if QUOTE in block or RETURN in block or NUL in block:
+                text = block.decode(encoding).replace('\r', '\n')
+                for row in csv.reader(io.StringIO(text), dialect=dialect):
+                    yield row
+                continue
+
+            lines = block.split(NEWLINE)
+            if len(lines[-1]) <= 0:
+                lines.pop()
+            for line in lines:
+                yield line.split(delimiter)
+
+
+def read_mapped(
+    path, ranges=None, file_type='csv', columns=None, encoding='utf-8',
+    **kwargs
+):
+    """ Reads records from byte ranges of a memory mapped delimited file.
+
+    .. note:: Records are the same records ``read_records`` reads from the
+        file (or from ``open_ranges`` over the same ``ranges``). Cells are
+        scanned over the memory mapped file as bytes and only decoded when
+        their conversion is not memoized yet, so cells of columns left out
+        of ``columns`` and repeated cells are never decoded.
+
+    .. important:: The encoding must be splittable at ``\\n`` bytes (see
+        ``is_splittable_encoding``).
+
+    :param str path: The path of the delimited file
+    :param list[tuple(int, int)] ranges: A list of (``start``, ``end``) byte
+        offsets to read in order (defaults to the whole file)
+    :param str file_type: The type of the file, either ``csv`` or ``tsv``
+    :param columns: The column names to read (defaults to every column)
+    :param str encoding: The encoding of the file
+    :param dict kwargs: Any of the pyexcel csv reader type detection options
+    :returns: A generator yielding records
+    """
+
+    with open(path, 'rb') as fp:
+        size = os.fstat(fp.fileno()).st_size
+        # empty files cannot be memory mapped
+        if size <= 0:
+            return
+        with contextlib.closing(mmap.mmap(
+            fp.fileno(), 0, access=mmap.ACCESS_READ
+        )) as mapped:
+            for record in _build_records(
+                _mapped_rows(
+                    mapped, ([(0, size,)] if ranges is None else ranges),
+                    file_type=file_type, encoding=encoding
+                ),
+                _cell_converter(encoding=encoding, **kwargs),
+                columns=columns
+            ):
+                yield record
+
+
+def _build_records(rows, convert, columns=None):
+    """ Builds records from rows of read cells.
+
+    :param rows: An iterable of lists of text (or encoded text) cells
+    :param callable convert: The cell converter from ``_cell_converter``
+    :param columns: The column names to read (defaults to every column)
+    :returns: A generator yielding records
+    """
+
+    (header, layout, long_layout, identity,) = (None, None, None, False,)
+    for row in rows:
+        if header is None:
+            header = [
+                (convert(cell) if cell else '')
+                for cell in _trim_cells(row)
+            ]
+            layout = Header.layout(header, columns)
+            identity = (layout[1] == list(range(len(header))))
+            continue
+
+        row = _trim_cells(row)
+        if len(row) > len(header):
+            if long_layout is None:
+                # extra cells are all named '', the last one wins
+                (long_header, long_indices,) = Header.layout(
+                    header + [''], columns
+                )
+                long_layout = (
+                    long_header,
+                    [
+                        (-1 if index == len(header) else index)
+                        for index in long_indices
+                    ],
+                )
+            (record_header, indices,) = long_layout
+        elif identity and len(row) == len(header):
+            yield Record(layout[0], [
+                (convert(cell) if cell else '') for cell in row
+            ])
+            continue
+        else:
+            (record_header, indices,) = layout
+
+        yield Record(record_header, [
+            (
+                convert(row[index])
+                if index < len(row) and row[index] else
+                ''
+            )
+            for index in indices
+        ])
+
+
+def write_rows(fp, rows, file_type='csv', lineterminator=os.linesep):
+    """ Writes rows to a delimited text stream.
+
+    :param file fp: A text stream opened with ``newline=''``
+    :param rows: An iterable of lists of cells
+    :param str file_type: The type of the file, either ``csv`` or ``tsv``
+    :param str lineterminator: The line terminator to write
+    """
+
+    csv.writer(
+        fp, dialect=DIALECTS[file_type], lineterminator=lineterminator
+    ).writerows(_trim(row) for row in rows)
+
+
+def write_records(
+    fp, records, file_type='csv', lineterminator=os.linesep,
+    header=None, include_header=True,
+):
+    """ Writes records to a delimited text stream.
+
+    .. note:: Records are written exactly like ``pyexcel.isave_as`` writes
+        them. The column names of the first record are the header (sorted if
+        the record is not ordered) and trailing empty cells are trimmed.
+
+    :param file fp: A text stream opened with ``newline=''``
+    :param records: An iterable of records
+    :param str file_type: The type of the file, either ``csv`` or ``tsv``
+    :param str lineterminator: The line terminator to write
+    :param list header: The column names to write records with
+        (defaults to the column names of the first record)
+    :param bool include_header: Boolean flag that indicates if the header
+        should be written before the first record
+    :returns: The header the records were written with or None if there were
+        no records
+    :rtype: list
+    """
+
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        return None
+
+    if header is None:
+        header = (
+            list(first.keys())
+            if is_ordered(first) else
+            sorted(first.keys())
+        )
+    shared = Header.intern(header)
+
+    def get_row(record):
+        # records sharing the header are written without key lookups
+        if isinstance(record, Record) and record.header is shared:
+            return record.row
+        return [record.get(key, '') for key in header]
+
+    rows = (get_row(record) for record in itertools.chain([first], records))
+    write_rows(
+        fp, (itertools.chain([header], rows) if include_header else rows),
+        file_type=file_type, lineterminator=lineterminator
+    )
+    return header
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import os
+import io
+import mmap
+import json
+import shutil
+import hashlib
+import tempfile
+import contextlib
+import collections
+
+VERSION = 1
+
+# os.replace is not available in Python 2 (where os.rename replaces on posix)
+_replace_file = getattr(os, 'replace', os.rename)
+
+
+def hash_file(path):
+    """ Hashes the content of a file.
+
+    .. note:: The file is memory mapped and hashed in place, so no copy of
+        its content is ever read into memory.
+
+    :param str path: The path of the file to hash
+    :returns: The hexadecimal sha256 digest of the file content
+    :rtype: str
+    """
+
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as fp:
+        # empty files cannot be memory mapped
+        if os.fstat(fp.fileno()).st_size > 0:
+            with contextlib.closing(mmap.mmap(
+                fp.fileno(), 0, access=mmap.ACCESS_READ
+            )) as mapped:
+                hasher.update(mapped)
+    return hasher.hexdigest()
+
+
+def _has_callables(value):
+    """ Checks if a value is or contains a callable.
+
+    :param .... value: The value to check
+    :returns: True if the value or any of its items is callable
+    :rtype: bool
+    """
+
+    if isinstance(value, dict):
+        return any(
+            _has_callables(key) or _has_callables(item)
+            for (key, item,) in value.items()
+        )
+    elif isinstance(value, (list, set, frozenset, tuple,)):
+        return any(_has_callables(item) for item in value)
+    return callable(value)
+
+
+def build_key(content_hash, uid, extension, arguments, rule_arguments=()):
+    """ Builds the key of an application in the cache manifest.
+
+    .. note:: The ``uid`` leaves out callable rule arguments, so
+        applications of rules given callables are never keyed.
+
+    :param str content_hash: The content hash of the input file
+    :param str uid: The uid of the applied SandPaper instance
+    :param str extension: The extension of the output file
+    :param dict arguments: The named arguments of the application
+    :param list rule_arguments: The (``rule_args``, ``rule_kwargs``) of the
+        rules of the applied SandPaper instance
+    :returns: The hexadecimal key or None if the arguments cannot be
+        serialized (such as callables) or any rule argument is callable
+    :rtype: str
+    """
+
+    if _has_callables(rule_arguments):
+        return None
+    try:
+        serialized = json.dumps(
+            [VERSION, content_hash, uid, extension.lower(), arguments],
+            sort_keys=True
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+def _entry_path(cache_dir, key):
+    """ Gets the path of an entry of the cache manifest.
+
+    :param str cache_dir: The path of the cache directory
+    :param str key: The key of the entry
+    :returns: The path of the entry
+    :rtype: str
+    """
+
+    return os.path.join(cache_dir, ('{key}.json').format(**locals()))
+
+
+def _output_path(cache_dir, output_hash, extension):
+    """ Gets the path of a cached output file.
+
+    :param str cache_dir: The path of the cache directory
+    :param str output_hash: The content hash of the output file
+    :param str extension: The extension of the output file
+    :returns: The path of the cached output file
+    :rtype: str
+    """
+
+    return os.path.join(
+        cache_dir, ('{output_hash}{extension}').format(**locals())
+    )
+
+
+def _copy_over(from_path, to_path):
+    """ Copies a file over another file atomically.
+
+    :param str from_path: The path of the file to copy
+    :param str to_path: The path of the file to replace
+    """
+
+    (handle, temporary_path,) = tempfile.mkstemp(
+        suffix='.tmp', dir=os.path.dirname(os.path.abspath(to_path))
+    )
+    os.close(handle)
+    try:
+        shutil.copyfile(from_path, temporary_path)
+        _replace_file(temporary_path, to_path)
+    finally:
+        if os.path.isfile(temporary_path):
+            os.remove(temporary_path)
+
+
+def restore(cache_dir, key, to_file):
+    """ Restores the output of an application from the cache.
+
+    .. note:: An existing ``to_file`` with the cached content is left as is,
+        otherwise it is replaced by the cached output file if there is one.
+
+    :param str cache_dir: The path of the cache directory
+    :param str key: The key of the application
+    :param str to_file: The path of the output file
+    :returns: A tuple of (``restored``, ``result``) where ``result`` is the
+        result of the application that produced the output
+    :rtype: tuple(bool, dict[str,....])
+    """
+
+    entry_path = _entry_path(cache_dir, key)
+    if not os.path.isfile(entry_path):
+        return (False, None,)
+    with io.open(entry_path, 'r', encoding='utf-8') as fp:
+        entry = json.load(fp, object_pairs_hook=collections.OrderedDict)
+
+    if os.path.isfile(to_file) and \
+            os.path.getsize(to_file) == entry['output_size'] and \
+            hash_file(to_file) == entry['output_hash']:
+        return (True, entry['result'],)
+
+    output_path = _output_path(
+        cache_dir, entry['output_hash'], os.path.splitext(to_file)[-1]
+    )
+    if os.path.isfile(output_path) and \
+            os.path.getsize(output_path) == entry['output_size']:
+        _copy_over(output_path, to_file)
+        return (True, entry['result'],)
+    return (False, None,)
+
+
+def store(cache_dir, key, to_file, result):
+    """ Stores the output of an application in the cache.
+
+    .. note:: Entries are stored as separate files, so concurrent
+        applications never overwrite each other's entries.
+
+    :param str cache_dir: The path of the cache directory
+    :param str key: The key of the application
+    :param str to_file: The path of the output file
+    :param dict result: The result of the application
+    :returns: True if the output was stored, False if the output or the
+        result cannot be stored
+    :rtype: bool
+    """
+
+    if not os.path.isfile(to_file):
+        return False
+    entry = collections.OrderedDict([
+        ('output_hash', hash_file(to_file)),
+        ('output_size', os.path.getsize(to_file)),
+        ('result', result),
+    ])
+    try:
+        serialized = json.dumps(entry)
+    except (TypeError, ValueError):
+        return False
+
+    try:
+        os.makedirs(cache_dir)
+    except OSError:
+        # concurrent applications may create the directory first
+        if not os.path.isdir(cache_dir):
+            raise
+    output_path = _output_path(
+        cache_dir, entry['output_hash'], os.path.splitext(to_file)[-1]
+    )
+    if not os.path.isfile(output_path):
+        _copy_over(to_file, output_path)
+
+    (handle, temporary_path,) = tempfile.mkstemp(suffix='.tmp', dir=cache_dir)
+    try:
+        with os.fdopen(handle, 'w') as fp:
+            fp.write(serialized)
+        _replace_file(temporary_path, _entry_path(cache_dir, key))
+    finally:
+        if os.path.isfile(temporary_path):
+            os.remove(temporary_path)
+    return True
@@ -0,0 +1,602 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import re
+import datetime
+import itertools
+import collections
+
+import six
+import regex
+from six.moves import collections_abc
+
+DEFAULT_FLAGS = regex.compile('').flags
+MAXIMUM_PREFIX_SIZE = 8
+
+(METACHARACTERS, QUANTIFIERS,) = ('.^$*+?{}[]\\|()', '*+?{',)
+NUMBERED_REFERENCE = regex.compile(r'\\[1-9]|\\g<\d|\(\?[-+\d&R(]|\(\?P>')
+
+
+def literal_prefix(pattern):
+    """ Gets the literal text every match of a pattern must start with.
+
+    .. note:: This is a conservative scan, any pattern containing an
+        alternation or starting with something other than anchors and
+        literal characters has an empty prefix.
+
+    :param str pattern: The regular expression pattern
+    :returns: The literal prefix of the pattern
+    :rtype: str
+    """
+
+    if '|' in pattern:
+        return ''
+
+    (index, prefix,) = (0, [],)
+    while pattern.startswith(('^', '\\A',), index):
+        index += (1 if pattern[index] == '^' else 2)
+
+    while index < len(pattern):
+        character = pattern[index]
+        if character == '\\':
+            if index + 1 >= len(pattern) or \
+                    pattern[index + 1].isalnum() or pattern[index + 1] == '_':
+                break
+            (character, index,) = (pattern[index + 1], index + 1,)
+        elif character in METACHARACTERS:
+            break
+        prefix.append(character)
+        index += 1
+
+    # a quantified last character may not be part of the match
+    if index < len(pattern) and pattern[index] in QUANTIFIERS:
+        prefix = prefix[:-1]
+    return ''.join(prefix)
+
+
+class TextTranslations(collections_abc.Mapping):
+    """ A translations dictionary compiled for ``translate_text``.
+
+    Translations whose patterns can be safely combined are compiled into
+    alternations (one branch per translation, in order) so finding the first
+    matching translation is a single pass over the value. Translations are
+    also bucketed by the leading literal text of their patterns so values
+    are only tested against the translations they could possibly match.
+    """
+
+    def __init__(self, translations):
+        """ Initializes the TextTranslations object.
+
+        :param translations: A dictionary of translations from regular
+            expressions to format strings
+        :type translations: dict[str, str]
+        """
+
+        self._translations = translations
+        (self._patterns, self._formats, self._combinable,) = ([], [], [],)
+        prefixes = []
+        for (from_regex, to_format,) in translations.items():
+            pattern = regex.compile(from_regex)
+            combinable = (
+                isinstance(from_regex, six.string_types) and
+                pattern.flags == DEFAULT_FLAGS and
+                NUMBERED_REFERENCE.search(from_regex) is None
+            )
+            self._patterns.append(pattern)
+            self._formats.append(to_format)
+            self._combinable.append(combinable)
+            prefixes.append(literal_prefix(from_regex) if combinable else '')
+
+        # bucket translations by their literal prefix (capped in size)
+        prefixes = [prefix[:MAXIMUM_PREFIX_SIZE] for prefix in prefixes]
+        self._sizes = sorted(set(
+            len(prefix) for prefix in prefixes if len(prefix) > 0
+        ))
+        (self._buckets, self._wildcards,) = ({}, [],)
+        for (index, prefix,) in enumerate(prefixes):
+            if len(prefix) > 0:
+                self._buckets.setdefault(
+                    (len(prefix), prefix,), []
+                ).append(index)
+            else:
+                self._wildcards.append(index)
+        self._matchers = {}
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__} ({translations} translations)>'
+        ).format(self=self, translations=len(self._patterns))
+
+    def __getitem__(self, key):
+        return self._translations[key]
+
+    def __iter__(self):
+        return iter(self._translations)
+
+    def __len__(self):
+        return len(self._translations)
+
+    def __build_matcher(self, indices):
+        """ Builds the runs of patterns for matching a list of translations.
+
+        :param list[int] indices: The ascending translation indices to match
+        :returns: A list of (``pattern``, ``branches``) tuples where
+            ``branches`` maps a group index of ``pattern`` to a translation
+            index, or is the translation index if ``pattern`` is a single
+            translation's pattern
+        :rtype: list[tuple(regex.Pattern, dict[int, int])]
+        """
+
+        (runs, combined, names,) = ([], [], set(),)
+        for index in (list(indices) + [None]):
+            if index is not None and self._combinable[index]:
+                # duplicate group names would be shared between branches
+                group_names = set(self._patterns[index].groupindex.keys())
+                if names.isdisjoint(group_names):
+                    combined.append(index)
+                    names.update(group_names)
+                    continue
+
+            if len(combined) > 0:
+                runs.extend(self.__combine(combined))
+                (combined, names,) = ([], set(),)
+            if index is not None and self._combinable[index]:
+                combined.append(index)
+                names.update(self._patterns[index].groupindex.keys())
+            elif index is not None:
+                runs.append((self._patterns[index], index,))
+        return runs
+
+    def __combine(self, indices):
+        """ Combines the patterns of translations into a single alternation.
+
+        :param list[int] indices: The ascending translation indices
+        :returns: A list of runs as described by ``__build_matcher``
+        :rtype: list[tuple(regex.Pattern, dict[int, int])]
+        """
+
+        if len(indices) == 1:
+            return [(self._patterns[indices[0]], indices[0],)]
+
+        try:
+            pattern = regex.compile('(?:{0})'.format('|'.join(
+                '(?:{0})(?P<_translation_{1}>)'.format(
+                    self._patterns[index].pattern, index
+                )
+                for index in indices
+            )))
+        except regex.error:
+            return [(self._patterns[index], index,) for index in indices]
+
+        return [(pattern, dict(
+            (pattern.groupindex['_translation_{0}'.format(index)], index,)
+            for index in indices
+        ),)]
+
+    def __candidates(self, key):
+        """ Gets the translations a text with the given bucket keys may match.
+
+        :param tuple key: The bucket keys of the text
+        :returns: The ascending translation indices
+        :rtype: list[int]
+        """
+
+        return sorted(itertools.chain(self._wildcards, *(
+            self._buckets[(size, prefix,)]
+            for (size, prefix,) in zip(self._sizes, key)
+            if prefix is not None
+        )))
+
+    def __first(self, key, start, text):
+        """ Finds the first translation matching a text.
+
+        :param tuple key: The bucket keys of the text
+        :param int start: The minimum translation index
+        :param str text: The text to match
+        :returns: A tuple of (``index``, ``match``) or None
+        :rtype: tuple(int, regex.Match)
+        """
+
+        runs = self._matchers.get((key, start,))
+        if runs is None:
+            runs = self._matchers[(key, start,)] = self.__build_matcher([
+                index
+                for index in self.__candidates(key)
+                if index >= start
+            ])
+
+        for (pattern, branches,) in runs:
+            match = pattern.match(text)
+            if match is None:
+                continue
+            if not isinstance(branches, dict):
+                return (branches, match,)
+
+            index = branches.get(match.lastindex)
+            if index is None or match.start(match.lastindex) < 0:
+                index = next(
+                    branch
+                    for (group, branch,) in sorted(branches.items())
+                    if match.start(group) >= 0
+                )
+            return (index, self._patterns[index].match(text),)
+
+    def match(self, text, start=0):
+        """ Finds the first translation at or after ``start`` matching a text.
+
+        :param str text: The text to match
+        :param int start: The minimum translation index
+        :returns: A tuple of (``index``, ``to_format``, ``match``) or None if
+            no translation matches
+        :rtype: tuple(int, str, regex.Match)
+        """
+
+        key = tuple(
+            (text[:size] if (size, text[:size],) in self._buckets else None)
+            for size in self._sizes
+        )
+        found = self.__first(key, 0, text)
+        if found is not None and found[0] < start:
+            found = self.__first(key, start, text)
+        if found is None:
+            return None
+        return (found[0], self._formats[found[0]], found[1],)
+
+
+class DateTranslations(collections_abc.Mapping):
+    """ A translations dictionary compiled for ``translate_date``.
+
+    Each date format is compiled into a pattern matching every value
+    ``strptime`` may parse, so formats a value cannot match are skipped
+    without raising and catching a ``ValueError``. The format which last
+    succeeded for a column is tried first, values are memoized, and fixed
+    width ISO-8601 values are parsed without ``strptime``.
+    """
+
+    def __init__(self, translations, cache_size=(1 << 16)):
+        """ Initializes the DateTranslations object.
+
+        :param translations: A dictionary of translations from date formats to
+            date formats
+        :type translations: dict[str, str]
+        :param int cache_size: The maximum number of memoized values
+        """
+
+        self._translations = translations
+        (self._from_formats, self._to_formats,) = (
+            list(translations.keys()),
+            list(translations.values()),
+        )
+        self._patterns = [
+            _strptime_pattern(from_format)
+            for from_format in self._from_formats
+        ]
+        self._iso_patterns = [
+            ISO_PATTERNS.get(from_format)
+            for from_format in self._from_formats
+        ]
+        (self._learned, self._memo, self._cache_size,) = ({}, {}, cache_size,)
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__} ({translations} translations)>'
+        ).format(self=self, translations=len(self._from_formats))
+
+    def __getitem__(self, key):
+        return self._translations[key]
+
+    def __iter__(self):
+        return iter(self._translations)
+
+    def __len__(self):
+        return len(self._translations)
+
+    def __may_parse(self, value, index):
+        """ Checks if a value may be parsed by a date format.
+
+        :param str value: The value to check
+        :param int index: The index of the date format
+        :returns: False only if ``strptime`` would fail to parse the value
+        :rtype: bool
+        """
+
+        pattern = self._patterns[index]
+        if pattern is None:
+            return True
+
+        match = pattern.match(value)
+        return (match is not None and match.end() == len(value))
+
+    def __parse(self, value, index):
+        """ Parses a value with a date format.
+
+        :param str value: The value to parse
+        :param int index: The index of the date format
+        :returns: The parsed datetime or None if the value does not match
+        :rtype: datetime.datetime
+        """
+
+        iso_pattern = self._iso_patterns[index]
+        if iso_pattern is not None:
+            match = iso_pattern.match(value)
+            if match is not None:
+                try:
+                    return datetime.datetime(
+                        *[int(group) for group in match.groups()]
+                    )
+                except ValueError:
+                    return None
+
+        if not self.__may_parse(value, index):
+            return None
+        try:
+            return datetime.datetime.strptime(
+                value, self._from_formats[index]
+            )
+        except ValueError:
+            return None
+
+    def translate(self, value, column=None):
+        """ Translates a value with the first date format that parses it.
+
+        :param str value: The value to translate
+        :param str column: The column of the value, used to remember the
+            date format which last succeeded
+        :returns: The translated value or the value if no date format parses
+            it
+        """
+
+        if not isinstance(value, six.string_types):
+            # strptime raises the appropriate TypeError
+            for from_format in self._from_formats:
+                datetime.datetime.strptime(value, from_format)
+            return value
+
+        try:
+            return self._memo[value]
+        except KeyError:
+            pass
+
+        (translated, learned,) = (value, self._learned.get(column),)
+        parsed = (
+            self.__parse(value, learned)
+            if learned is not None else
+            None
+        )
+        if parsed is not None and not any(
+            self.__may_parse(value, index) for index in range(learned)
+        ):
+            translated = parsed.strftime(self._to_formats[learned])
+        else:
+            for index in range(len(self._from_formats)):
+                parsed = self.__parse(value, index)
+                if parsed is not None:
+                    self._learned[column] = index
+                    translated = parsed.strftime(self._to_formats[index])
+                    break
+
+        if len(self._memo) >= self._cache_size:
+            self._memo.clear()
+        self._memo[value] = translated
+        return translated
+
+
+# directives are matched loosely, so a value is only skipped if its format
+# can never parse it, names of the current locale match any text
+STRPTIME_FORMAT = re.compile(r'(\s+|[^%\s]+)|%(.)', re.DOTALL)
+STRPTIME_DIRECTIVES = dict(
+    [('%', '%',)] +
+    [(directive, r'\d',) for directive in 'uw'] +
+    [(directive, r' ?\d\d?',) for directive in 'dHImMSUVWy'] +
+    [(directive, r'\d\d?\d?',) for directive in 'j'] +
+    [(directive, r'\d{1,6}',) for directive in 'f'] +
+    [(directive, r'\d{4}',) for directive in 'GY'] +
+    [(directive, r'.+?',) for directive in 'aAbBp']
+)
+
+
+def _strptime_pattern(date_format):
+    """ Compiles a pattern matching every value ``strptime`` may parse.
+
+    .. note:: The pattern is built from ``STRPTIME_DIRECTIVES`` rather than
+        the private pattern cache of ``strptime``, and it may match values
+        ``strptime`` rejects (such as ``31`` days in February).
+
+    :param str date_format: The date format
+    :returns: The compiled pattern or None if the format has a directive
+        left to ``strptime`` itself
+    :rtype: re.Pattern
+    """
+
+    pattern = []
+    for (literal, directive,) in STRPTIME_FORMAT.findall(date_format):
+        if literal:
+            # strptime matches any whitespace of a format with one or more
+            pattern.append(r'\s+' if literal.isspace() else re.escape(literal))
+        elif directive not in STRPTIME_DIRECTIVES:
+            return None
+        else:
+            pattern.append(STRPTIME_DIRECTIVES[directive])
+    return re.compile((''.join(pattern) + r'\Z'), re.IGNORECASE)
+
+
+ISO_PATTERNS = {
+    '%Y-%m-%d': re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})\Z'),
+    '%Y-%m-%d %H:%M:%S': re.compile(
+        r'([0-9]{4})-([0-9]{2})-([0-9]{2}) '
+        r'([0-9]{2}):([0-9]{2}):([0-9]{2})\Z'
+    ),
+    '%Y-%m-%dT%H:%M:%S': re.compile(
+        r'([0-9]{4})-([0-9]{2})-([0-9]{2})T'
+        r'([0-9]{2}):([0-9]{2}):([0-9]{2})\Z'
+    ),
+}
+
+
+class Replacements(collections_abc.Mapping):
+    """ A replacements dictionary compiled for ``replace``.
+
+    The replacement texts are compiled into an Aho-Corasick automaton so
+    the occurrences of every replacement text within a value are found in a
+    single left to right scan, no matter how many replacements there are.
+    """
+
+    def __init__(self, replacements):
+        """ Initializes the Replacements object.
+
+        :param replacements: A dictionary of replacements
+        :type replacements: dict[str, str]
+        """
+
+        self._replacements = replacements
+        (self._from_texts, self._to_texts,) = (
+            list(replacements.keys()),
+            list(replacements.values()),
+        )
+        self._compiled = all(
+            isinstance(text, six.string_types)
+            for text in itertools.chain(self._from_texts, self._to_texts)
+        )
+        # empty replacement texts occur everywhere, see str.replace
+        self._empty = [
+            index
+            for (index, from_text,) in enumerate(self._from_texts)
+            if from_text == ''
+        ]
+        if self._compiled:
+            self.__build_automaton()
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__} ({replacements} replacements)>'
+        ).format(self=self, replacements=len(self._from_texts))
+
+    def __getitem__(self, key):
+        return self._replacements[key]
+
+    def __iter__(self):
+        return iter(self._replacements)
+
+    def __len__(self):
+        return len(self._replacements)
+
+    def __build_automaton(self):
+        """ Builds the Aho-Corasick automaton of the replacement texts.
+        """
+
+        (self._goto, self._fail, self._outputs,) = ([{}], [0], [()],)
+        for (index, from_text,) in enumerate(self._from_texts):
+            if from_text == '':
+                continue
+
+            node = 0
+            for character in from_text:
+                following = self._goto[node].get(character)
+                if following is None:
+                    following = self._goto[node][character] = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append(())
+                node = following
+            self._outputs[node] += (index,)
+
+        # breadth first so failure links always point to finished nodes
+        queue = collections.deque(self._goto[0].values())
+        while len(queue) > 0:
+            node = queue.popleft()
+            for (character, following,) in self._goto[node].items():
+                queue.append(following)
+                fail = self._fail[node]
+                while fail > 0 and character not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(character, 0)
+                self._fail[following] = fail
+                self._outputs[following] += self._outputs[fail]
+
+    def __scan(self, text):
+        """ Scans a text for occurrences of the replacement texts.
+
+        :param str text: The text to scan
+        :returns: A generator yielding (``end``, ``indices``) tuples of the
+            position right after each occurrence and the indices of the
+            replacement texts ending there
+        """
+
+        (goto, fail, outputs, node,) = (
+            self._goto, self._fail, self._outputs, 0,
+        )
+        for (position, character,) in enumerate(text):
+            while node > 0 and character not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(character, 0)
+            if len(outputs[node]) > 0:
+                yield (position + 1, outputs[node],)
+
+    def sequential(self, text):
+        """ Applies the replacements in order, each to the previous result.
+
+        .. note:: This gives the same result as calling ``str.replace`` for
+            every replacement in order, but only replacements whose text
+            occurs in the value are applied.
+
+        :param str text: The text to apply the replacements to
+        :returns: The text with all replacements made
+        :rtype: str
+        """
+
+        if not self._compiled:
+            for (from_text, to_text,) in self._replacements.items():
+                text = text.replace(from_text, to_text)
+            return text
+
+        last = -1
+        while True:
+            occurring = [
+                index
+                for (_, indices,) in self.__scan(text)
+                for index in indices
+                if index > last
+            ] + [index for index in self._empty if index > last]
+            if len(occurring) <= 0:
+                return text
+
+            last = min(occurring)
+            text = text.replace(self._from_texts[last], self._to_texts[last])
+
+    def leftmost_longest(self, text):
+        """ Applies the replacements in a single left to right pass.
+
+        .. note:: At each position the longest replacement text starting
+            there is replaced, and scanning continues right after it, so
+            replaced text is never replaced again. Empty replacement texts are
+            ignored.
+
+        :param str text: The text to apply the replacements to
+        :returns: The text with all replacements made
+        :rtype: str
+        """
+
+        if not self._compiled:
+            return self.sequential(text)
+
+        longest = {}
+        for (end, indices,) in self.__scan(text):
+            for index in indices:
+                start = end - len(self._from_texts[index])
+                if start not in longest or end > longest[start][0]:
+                    longest[start] = (end, index,)
+        if len(longest) <= 0:
+            return text
+
+        (pieces, position,) = ([], 0,)
+        for start in sorted(longest):
+            if start < position:
+                continue
+            (end, index,) = longest[start]
+            pieces.extend((text[position:start], self._to_texts[index],))
+            position = end
+        pieces.append(text[position:])
+        return ''.join(pieces)
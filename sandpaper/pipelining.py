@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import sys
+import itertools
+import threading
+
+import six
+from six.moves import queue
+
+# seconds between checks for a stopped consumer while the queue is full
+PUT_TIMEOUT = 0.1
+
+_DONE = object()
+
+
+class _Failure(object):
+    """ An exception raised in a pipeline thread, reraised by its consumer.
+    """
+
+    __slots__ = ('exc_info',)
+
+    def __init__(self, exc_info):
+        """ Initializes the _Failure object.
+
+        :param tuple exc_info: The ``sys.exc_info`` of the exception
+        """
+
+        self.exc_info = exc_info
+
+
+def _batches(iterable, batch_size):
+    """ Splits an iterable into lists of items.
+
+    :param iterable: The iterable to split
+    :param int batch_size: The number of items per list
+    :returns: A generator yielding lists of at most ``batch_size`` items
+    """
+
+    iterator = iter(iterable)
+    return iter(lambda: list(itertools.islice(iterator, batch_size)), [])
+
+
+def _start(target, name):
+    """ Starts a daemon thread.
+
+    :param callable target: The callable to run in the thread
+    :param str name: The name of the thread
+    :returns: The started thread
+    :rtype: threading.Thread
+    """
+
+    thread = threading.Thread(target=target, name=name)
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def read_ahead(iterable, batch_size=1024, depth=4):
+    """ Iterates an iterable in a thread, ahead of its consumer.
+
+    .. note:: Items are passed from the thread in batches of ``batch_size``
+        through a queue of at most ``depth`` batches, so the thread blocks
+        once the consumer falls ``depth`` batches behind. Exceptions raised
+        while iterating are reraised to the consumer, and the thread stops
+        once the consumer closes the returned generator.
+
+    :param iterable: The iterable to iterate in a thread
+    :param int batch_size: The number of items per batch
+    :param int depth: The maximum number of batches queued
+    :returns: A generator yielding the items of ``iterable``
+    """
+
+    (batches, stopped,) = (queue.Queue(depth), threading.Event(),)
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                batches.put(item, timeout=PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for batch in _batches(iterable, batch_size):
+                if not put(batch):
+                    return
+            put(_DONE)
+        except BaseException:
+            put(_Failure(sys.exc_info()))
+
+    thread = _start(produce, 'sandpaper-read')
+    try:
+        while True:
+            batch = batches.get()
+            if batch is _DONE:
+                return
+            elif isinstance(batch, _Failure):
+                six.reraise(*batch.exc_info)
+            for item in batch:
+                yield item
+    finally:
+        stopped.set()
+        # the generator may be finalized by the garbage collector in the
+        # thread itself, which cannot join itself
+        if threading.current_thread() is not thread:
+            thread.join()
+
+
+def write_behind(write, iterable, batch_size=1024, depth=4):
+    """ Writes the items of an iterable in a thread, behind their producer.
+
+    .. note:: Items are passed to the thread in batches of ``batch_size``
+        through a queue of at most ``depth`` batches, so producing blocks
+        once the writer falls ``depth`` batches behind. Exceptions raised
+        while writing stop the production and are reraised once the thread
+        is done.
+
+    :param callable write: A callable writing an iterable of items, called
+        in the thread
+    :param iterable: The iterable of items to write
+    :param int batch_size: The number of items per batch
+    :param int depth: The maximum number of batches queued
+    :returns: The result of ``write``
+    """
+
+    (batches, done, results, failures,) = (
+        queue.Queue(depth), [False], [], [],
+    )
+
+    def items():
+        while True:
+            batch = batches.get()
+            if batch is _DONE:
+                done[0] = True
+                return
+            for item in batch:
+                yield item
+
+    def consume():
+        try:
+            results.append(write(items()))
+        except BaseException:
+            failures.append(sys.exc_info())
+        finally:
+            # keep draining so the producer never blocks on a full queue
+            while not done[0]:
+                done[0] = (batches.get() is _DONE)
+
+    thread = _start(consume, 'sandpaper-write')
+    try:
+        for batch in _batches(iterable, batch_size):
+            if len(failures) > 0:
+                break
+            batches.put(batch)
+    finally:
+        batches.put(_DONE)
+        thread.join()
+
+    if len(failures) > 0:
+        six.reraise(*failures[0])
+    return results[0]
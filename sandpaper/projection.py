@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import string
+
+import six
+
+
+class Columns(object):
+    """ A set of column names which may be every column except some.
+    """
+
+    __slots__ = ('names', 'complement',)
+
+    def __init__(self, names=(), complement=False):
+        """ Initializes the Columns object.
+
+        :param names: The column names in (or if ``complement``, not in) the
+            set
+        :param bool complement: Boolean flag that indicates if the set holds
+            every column except ``names``
+        """
+
+        self.names = frozenset(names)
+        self.complement = complement
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__} {prefix}{names}>'
+        ).format(
+            self=self,
+            prefix=('all except ' if self.complement else ''),
+            names=sorted(self.names, key=str)
+        )
+
+    def __contains__(self, column):
+        return (column in self.names) != self.complement
+
+    @property
+    def everything(self):
+        """ Indicates if the set holds every column.
+
+        :getter: Returns True if the set holds every column
+        :rtype: bool
+        """
+
+        return self.complement and len(self.names) <= 0
+
+    def union(self, names):
+        """ Adds column names to the set.
+
+        :param names: The column names to add
+        :returns: A new set with the columns added
+        :rtype: Columns
+        """
+
+        if self.complement:
+            return Columns(self.names.difference(names), complement=True)
+        return Columns(self.names.union(names))
+
+    def intersection(self, names):
+        """ Keeps only the given column names in the set.
+
+        :param names: The column names to keep
+        :returns: A new set with only the kept columns
+        :rtype: Columns
+        """
+
+        if self.complement:
+            return Columns(frozenset(names).difference(self.names))
+        return Columns(self.names.intersection(names))
+
+    def difference(self, names):
+        """ Removes column names from the set.
+
+        :param names: The column names to remove
+        :returns: A new set with the columns removed
+        :rtype: Columns
+        """
+
+        if self.complement:
+            return Columns(self.names.union(names), complement=True)
+        return Columns(self.names.difference(names))
+
+
+EVERY_COLUMN = Columns(complement=True)
+
+
+def format_fields(text):
+    """ Finds the record columns referenced by a format string.
+
+    :param str text: The format string
+    :returns: The set of referenced column names or None if they cannot be
+        determined
+    :rtype: set(str)
+    """
+
+    fields = set()
+    try:
+        for (_, field_name, format_spec, _,) in string.Formatter().parse(text):
+            if field_name is None:
+                continue
+            fields.add(field_name.split('.', 1)[0].split('[', 1)[0])
+            if format_spec:
+                nested = format_fields(format_spec)
+                if nested is None:
+                    return None
+                fields.update(nested)
+    except ValueError:
+        return None
+    return fields
+
+
+def _argument(rule_args, rule_kwargs, name, position=0, default=None):
+    """ Gets an argument of a rule given either by position or by name.
+
+    :param tuple rule_args: The positional arguments of the rule
+    :param dict rule_kwargs: The named arguments of the rule
+    :param str name: The name of the argument
+    :param int position: The position of the argument
+    :param default: The default value of the argument
+    :returns: The value of the argument
+    """
+
+    if len(rule_args) > position:
+        return rule_args[position]
+    return rule_kwargs.get(name, default)
+
+
+def _live_before(rule, rule_args, rule_kwargs, filters, live, builtin):
+    """ Finds the columns needed before a rule from the columns needed after.
+
+    :param callable rule: The rule
+    :param tuple rule_args: The positional arguments of the rule
+    :param dict rule_kwargs: The named arguments of the rule
+    :param tuple filters: The compiled filters of a value rule or None for
+        record rules
+    :param Columns live: The columns needed after the rule
+    :param bool builtin: Boolean flag that indicates if the rule is a
+        built-in rule
+    :returns: The columns needed before the rule
+    :rtype: Columns
+    """
+
+    if not builtin:
+        # other rules receive the whole record
+        return EVERY_COLUMN
+    elif filters is not None:
+        # built-in value rules only read the values they normalize
+        return (live if filters[2] is None else EVERY_COLUMN)
+
+    name = rule.__name__
+    if name == 'keep_columns':
+        keeps = _argument(rule_args, rule_kwargs, 'keeps')
+        # strings keep every column name they contain
+        if isinstance(keeps, six.string_types):
+            return EVERY_COLUMN
+        return live.intersection(keeps)
+    elif name == 'remove_columns':
+        return live.difference(
+            _argument(rule_args, rule_kwargs, 'removes')
+        )
+    elif name == 'order_columns':
+        if _argument(rule_args, rule_kwargs, 'ignore_missing', 1, False):
+            return live.intersection(
+                _argument(rule_args, rule_kwargs, 'order')
+            )
+        return live
+    elif name == 'rename_columns':
+        renames = _argument(rule_args, rule_kwargs, 'renames')
+        if live.complement:
+            return Columns(
+                [column for column in live.names if column not in renames] +
+                [
+                    column
+                    for (column, renamed,) in renames.items()
+                    if renamed in live.names
+                ],
+                complement=True
+            )
+        return live.union(
+            column
+            for (column, renamed,) in renames.items()
+            if renamed in live.names
+        )
+    elif name == 'add_columns':
+        referenced = set()
+        for value in _argument(rule_args, rule_kwargs, 'additions').values():
+            if callable(value):
+                return EVERY_COLUMN
+            elif isinstance(value, six.string_types):
+                fields = format_fields(value)
+                if fields is None:
+                    return EVERY_COLUMN
+                referenced.update(fields)
+        return live.union(referenced)
+    return EVERY_COLUMN
+
+
+def live_columns(plan, is_builtin):
+    """ Finds the columns still needed after every rule of a compiled plan.
+
+    .. note:: A column is needed after a rule if it is written out or read by
+        a later rule. Built-in value rules applied to columns that are not
+        needed after them can be skipped, and columns not needed before the
+        first rule never need to be read.
+
+    :param list plan: A compiled plan from ``SandPaper._compile_rules``
+    :param callable is_builtin: A callable checking if a rule is a built-in
+        rule
+    :returns: A tuple of (``read``, ``live``) where ``read`` are the columns
+        needed before the first rule and ``live`` is a list of the columns
+        needed after each rule of the plan
+    :rtype: tuple(Columns, list[Columns])
+    """
+
+    (read, live,) = (EVERY_COLUMN, [None] * len(plan),)
+    for index in reversed(range(len(plan))):
+        (rule, rule_args, rule_kwargs, filters,) = plan[index]
+        live[index] = read
+        try:
+            read = _live_before(
+                rule, rule_args, rule_kwargs, filters, read, is_builtin(rule)
+            )
+        except (AttributeError, TypeError):
+            # invalid arguments fail once the rule is applied
+            read = EVERY_COLUMN
+    return (read, live,)
@@ -0,0 +1,427 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import weakref
+import collections
+
+from six.moves import collections_abc
+
+MAXIMUM_DERIVED = 256
+
+_headers = weakref.WeakValueDictionary()
+_generation = [0]
+
+
+def expire_derived():
+    """ Expires the headers derived from rule arguments.
+
+    .. note:: Derived headers are cached by the identity of the rule argument
+        they are derived from, so they must be expired before applying rules
+        whose arguments may have been mutated since.
+    """
+
+    _generation[0] += 1
+
+
+class Header(object):
+    """ The interned column names of records.
+
+    Records read from the same file share a single header, and headers
+    derived from it (by renaming, ordering or dropping columns) are computed
+    once and cached on the header.
+    """
+
+    __slots__ = ('columns', 'index', '_derived', '__weakref__',)
+
+    def __init__(self, columns):
+        """ Initializes the Header object.
+
+        .. note:: Use ``Header.intern`` rather than creating headers directly
+            so equal headers are shared.
+
+        :param tuple columns: The unique column names in order
+        """
+
+        self.columns = tuple(columns)
+        self.index = dict(
+            (column, position,)
+            for (position, column,) in enumerate(self.columns)
+        )
+        self._derived = {}
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__} {columns!r}>'
+        ).format(self=self, columns=list(self.columns))
+
+    def __len__(self):
+        return len(self.columns)
+
+    @classmethod
+    def intern(cls, columns):
+        """ Gets the shared header of unique column names.
+
+        :param columns: The unique column names in order
+        :returns: The shared header
+        :rtype: Header
+        """
+
+        columns = tuple(columns)
+        header = _headers.get(columns)
+        if header is None:
+            header = _headers[columns] = cls(columns)
+        return header
+
+    @classmethod
+    def layout(cls, columns, selected=None):
+        """ Gets the header of possibly duplicated column names.
+
+        .. note:: Just like building an ``OrderedDict`` from (``column``,
+            ``value``) pairs, duplicated columns keep the position of their
+            first occurrence and the value of their last occurrence.
+
+        :param columns: The column names in order
+        :param selected: The column names to keep (defaults to every column)
+        :returns: A tuple of (``header``, ``indices``) where ``indices`` are
+            the positions in ``columns`` of the values of the header's columns
+        :rtype: tuple(Header, list[int])
+        """
+
+        last = collections.OrderedDict()
+        for (position, column,) in enumerate(columns):
+            last[column] = position
+        positions = [
+            (column, position,)
+            for (column, position,) in last.items()
+            if selected is None or column in selected
+        ]
+        return (
+            cls.intern(column for (column, _,) in positions),
+            [position for (_, position,) in positions],
+        )
+
+    def derive(self, operation, argument, build):
+        """ Gets a header derived from this header, building it only once.
+
+        :param str operation: The name of the operation deriving the header
+        :param argument: The argument of the operation, cached by identity
+        :param callable build: A callable returning the derived header and the
+            indices of its values in records of this header
+        :returns: A tuple of (``header``, ``indices``)
+        :rtype: tuple(Header, list[int])
+        """
+
+        (key, generation,) = ((operation, id(argument),), _generation[0],)
+        cached = self._derived.get(key)
+        if cached is None or cached[0] is not argument or \
+                cached[1] != generation:
+            if len(self._derived) >= MAXIMUM_DERIVED:
+                self._derived.clear()
+            cached = self._derived[key] = (argument, generation, build(),)
+        return cached[2]
+
+    def added(self, column):
+        """ Gets the header with a column appended.
+
+        :param column: The column to append
+        :returns: The derived header
+        :rtype: Header
+        """
+
+        key = ('added', column,)
+        header = self._derived.get(key)
+        if header is None:
+            if len(self._derived) >= MAXIMUM_DERIVED:
+                self._derived.clear()
+            header = self._derived[key] = Header.intern(
+                self.columns + (column,)
+            )
+        return header
+
+    def removed(self, column):
+        """ Gets the header without a column.
+
+        :param column: The column to remove
+        :returns: The derived header
+        :rtype: Header
+        """
+
+        key = ('removed', column,)
+        header = self._derived.get(key)
+        if header is None:
+            if len(self._derived) >= MAXIMUM_DERIVED:
+                self._derived.clear()
+            header = self._derived[key] = Header.intern(
+                existing for existing in self.columns if existing != column
+            )
+        return header
+
+
+def _record(columns, row):
+    """ Rebuilds a pickled record.
+
+    :param tuple columns: The column names of the record
+    :param list row: The values of the record
+    :returns: The record
+    :rtype: Record
+    """
+
+    return Record(Header.intern(columns), row)
+
+
+class Record(collections_abc.MutableMapping):
+    """ A compact ordered record of values with a shared header.
+
+    Records behave like the ``collections.OrderedDict`` records pyexcel reads
+    but only store a list of values, the column names and their positions are
+    stored once in a :class:`Header` shared by every record of a file.
+    Renaming, ordering and dropping columns derive a new header once per file
+    and only rearrange the values of each record.
+    """
+
+    __slots__ = ('_header', '_row',)
+
+    def __init__(self, header, row):
+        """ Initializes the Record object.
+
+        :param Header header: The header of the record
+        :param list row: The values of the record in the order of ``header``
+        """
+
+        self._header = header
+        self._row = row
+
+    def __repr__(self):
+        return (
+            '{self.__class__.__name__}({items!r})'
+        ).format(self=self, items=list(self.items()))
+
+    def __reduce__(self):
+        return (_record, (self._header.columns, self._row,),)
+
+    def __getitem__(self, key):
+        return self._row[self._header.index[key]]
+
+    def __setitem__(self, key, value):
+        position = self._header.index.get(key)
+        if position is None:
+            self._header = self._header.added(key)
+            self._row.append(value)
+        else:
+            self._row[position] = value
+
+    def __delitem__(self, key):
+        position = self._header.index[key]
+        self._header = self._header.removed(key)
+        del self._row[position]
+
+    def __iter__(self):
+        return iter(self._header.columns)
+
+    def __len__(self):
+        return len(self._row)
+
+    def __contains__(self, key):
+        return key in self._header.index
+
+    @property
+    def header(self):
+        """ The shared header of the record.
+
+        :getter: Returns the header of the record
+        :rtype: Header
+        """
+
+        return self._header
+
+    @property
+    def row(self):
+        """ The values of the record in the order of its header.
+
+        :getter: Returns the list of values of the record
+        :rtype: list
+        """
+
+        return self._row
+
+    def get(self, key, default=None):
+        position = self._header.index.get(key)
+        return (default if position is None else self._row[position])
+
+    def keys(self):
+        return list(self._header.columns)
+
+    def values(self):
+        return list(self._row)
+
+    def items(self):
+        return list(zip(self._header.columns, self._row))
+
+    def copy(self):
+        """ Returns a copy of the record sharing the same header.
+
+        :returns: A copy of the record
+        :rtype: Record
+        """
+
+        return Record(self._header, list(self._row))
+
+    def derive(self, build, argument, *args):
+        """ Builds a new record with a derived header.
+
+        :param callable build: A callable receiving the columns of the header,
+            ``argument`` and ``args`` and returning the derived header and the
+            indices of its values
+        :param argument: The argument of the operation, cached by identity
+        :param tuple args: Any other arguments of the operation
+        :returns: The new record
+        :rtype: Record
+        """
+
+        header = self._header
+        (header, indices,) = header.derive(
+            (build, args,), argument,
+            lambda: build(header.columns, argument, *args)
+        )
+        row = self._row
+        return Record(header, [row[index] for index in indices])
+
+
+def from_mapping(mapping, header=None):
+    """ Builds a record from an ordered mapping.
+
+    :param collections.OrderedDict mapping: The mapping to build from
+    :param Header header: A header to reuse if it has the same columns
+    :returns: The record
+    :rtype: Record
+    """
+
+    columns = tuple(mapping.keys())
+    if header is None or header.columns != columns:
+        header = Header.intern(columns)
+    return Record(header, list(mapping.values()))
+
+
+def from_mappings(mappings):
+    """ Builds records from ordered mappings, sharing headers between them.
+
+    :param mappings: An iterable of ordered mappings
+    :returns: A generator yielding records
+    """
+
+    header = None
+    for mapping in mappings:
+        record = from_mapping(mapping, header=header)
+        header = record.header
+        yield record
+
+
+def is_ordered(record):
+    """ Checks if the column order of a record is meaningful.
+
+    :param record: The record to check
+    :returns: True for ordered dictionaries and records
+    :rtype: bool
+    """
+
+    return isinstance(record, (collections.OrderedDict, Record,))
+
+
+def rename_header(columns, renames, **kwargs):
+    """ Derives the header of the ``rename_columns`` record rule.
+
+    :param tuple columns: The current column names
+    :param renames: A dictionary of column to column renames
+    :type renames: dict[str, str]
+    :param dict kwargs: Any named arguments
+    :returns: A tuple of (``header``, ``indices``)
+    :rtype: tuple(Header, list[int])
+    """
+
+    return Header.layout([
+        (renames[column] if column in renames else column)
+        for column in columns
+    ])
+
+
+def order_header(columns, order, ignore_missing=False, **kwargs):
+    """ Derives the header of the ``order_columns`` record rule.
+
+    :param tuple columns: The current column names
+    :param order: The order that columns need to be in
+    :type order: list[str]
+    :param bool ignore_missing: Boolean which inidicates if missing columns
+        from ``order`` should be ignored
+    :param dict kwargs: Any named arguments
+    :returns: A tuple of (``header``, ``indices``)
+    :rtype: tuple(Header, list[int])
+    """
+
+    index = Header.intern(columns).index
+    positions = collections.OrderedDict(
+        (column, index[column],)
+        for column in order
+        if column in index
+    )
+    if not ignore_missing:
+        for (position, column,) in enumerate(columns):
+            if column not in order:
+                positions[column] = position
+
+    return (Header.intern(positions.keys()), list(positions.values()),)
+
+
+def keep_header(columns, keeps, **kwargs):
+    """ Derives the header of the ``keep_columns`` record rule.
+
+    :param tuple columns: The current column names
+    :param keeps: A list of columns to keep
+    :type keeps: list[str]
+    :param dict kwargs: Any named arguments
+    :returns: A tuple of (``header``, ``indices``)
+    :rtype: tuple(Header, list[int])
+    """
+
+    positions = [
+        (column, position,)
+        for (position, column,) in enumerate(columns)
+        if column in keeps
+    ]
+    return (
+        Header.intern(column for (column, _,) in positions),
+        [position for (_, position,) in positions],
+    )
+
+
+def remove_header(columns, removes, **kwargs):
+    """ Derives the header of the ``remove_columns`` record rule.
+
+    :param tuple columns: The current column names
+    :param removes: A list of columns to remove
+    :type removes: list[str]
+    :param dict kwargs: Any named arguments
+    :returns: A tuple of (``header``, ``indices``)
+    :rtype: tuple(Header, list[int])
+    """
+
+    removes = frozenset(removes)
+    positions = [
+        (column, position,)
+        for (position, column,) in enumerate(columns)
+        if column not in removes
+    ]
+    return (
+        Header.intern(column for (column, _,) in positions),
+        [position for (_, position,) in positions],
+    )
+
+
+HEADER_BUILDERS = {
+    'rename_columns': rename_header,
+    'order_columns': order_header,
+    'keep_columns': keep_header,
+    'remove_columns': remove_header,
+}
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import timeit
+import collections
+
+clock = timeit.default_timer
+
+
+class ApplyReport(object):
+    """ Performance metrics collected during a single ``apply``.
+
+    .. note:: Rules are tracked by their position in the rules of the
+        SandPaper instance, so repeated rules are reported separately.
+    """
+
+    def __init__(self, rule_names):
+        """ Initializes the ApplyReport object.
+
+        :param list[str] rule_names: The names of the rules in order
+        """
+
+        self.rule_names = list(rule_names)
+        (self.rows_read, self.rows_written,) = (0, 0,)
+        (self.dropped_pre, self.dropped_post,) = (0, 0,)
+        (self.read_time, self.produce_time, self.write_time,) = (
+            0.0, 0.0, 0.0,
+        )
+        self.elapsed = 0.0
+        self.rule_counts = [0] * len(self.rule_names)
+        self.rule_times = [0.0] * len(self.rule_names)
+        self.column_counts = [{} for _ in self.rule_names]
+        self.column_times = [{} for _ in self.rule_names]
+
+    def add_rule(self, position, elapsed, count=1, column=None):
+        """ Adds applications of a rule.
+
+        :param int position: The position of the rule
+        :param float elapsed: The seconds spent applying the rule
+        :param int count: The number of applications of the rule
+        :param str column: The column the rule was applied to (None for
+            record rules)
+        """
+
+        self.rule_counts[position] += count
+        self.rule_times[position] += elapsed
+        if column is not None:
+            (counts, times,) = (
+                self.column_counts[position], self.column_times[position],
+            )
+            counts[column] = counts.get(column, 0) + count
+            times[column] = times.get(column, 0.0) + elapsed
+
+    def timed(self, iterable, attribute):
+        """ Yields from an iterable, adding the time spent in it to a total.
+
+        :param iterable: The iterable to time
+        :param str attribute: The name of the total to add to
+        :returns: A generator yielding the items of ``iterable``
+        """
+
+        (iterator, done,) = (iter(iterable), object(),)
+        while True:
+            started = clock()
+            item = next(iterator, done)
+            setattr(
+                self, attribute, getattr(self, attribute) + (clock() - started)
+            )
+            if item is done:
+                return
+            yield item
+
+    def write(self, writer, records):
+        """ Writes records, adding the time spent writing to ``write_time``.
+
+        .. note:: The time spent producing the records (reading and
+            normalizing them) is added to ``produce_time`` instead.
+
+        :param callable writer: A callable writing an iterable of records
+        :param records: An iterable of records
+        :returns: The result of ``writer``
+        """
+
+        (produced, started,) = (self.produce_time, clock(),)
+        result = writer(self.timed(records, 'produce_time'))
+        self.write_time += (
+            (clock() - started) - (self.produce_time - produced)
+        )
+        return result
+
+    def merge(self, other):
+        """ Adds the metrics of another report of the same rules.
+
+        :param ApplyReport other: The report to merge into this one
+        """
+
+        for attribute in (
+            'rows_read', 'rows_written', 'dropped_pre', 'dropped_post',
+            'read_time', 'produce_time', 'write_time',
+        ):
+            setattr(
+                self, attribute,
+                getattr(self, attribute) + getattr(other, attribute)
+            )
+        for position in range(len(self.rule_names)):
+            self.rule_counts[position] += other.rule_counts[position]
+            self.rule_times[position] += other.rule_times[position]
+            for column in other.column_counts[position]:
+                self.column_counts[position][column] = (
+                    self.column_counts[position].get(column, 0) +
+                    other.column_counts[position][column]
+                )
+                self.column_times[position][column] = (
+                    self.column_times[position].get(column, 0.0) +
+                    other.column_times[position][column]
+                )
+
+    def to_dict(self):
+        """ Builds the structured report of the collected metrics.
+
+        :returns: A dictionary of the row counts (``rows_read``,
+            ``rows_written`` and ``rows_dropped`` by the ``pre`` and ``post``
+            normalization row filter), the ``read_time``, ``normalize_time``,
+            ``write_time`` and ``elapsed`` seconds and a list of ``rules`` in
+            order, each with its ``position``, ``rule`` name, ``count``,
+            cumulative ``time``, ``mean_time`` and the same metrics per column
+            in ``columns``
+        :rtype: dict[str,....]
+        """
+
+        def timing(count, elapsed):
+            return collections.OrderedDict([
+                ('count', count),
+                ('time', elapsed),
+                ('mean_time', (elapsed / count if count > 0 else 0.0)),
+            ])
+
+        rules = []
+        for (position, rule_name,) in enumerate(self.rule_names):
+            rule = collections.OrderedDict([
+                ('position', position),
+                ('rule', rule_name),
+            ])
+            rule.update(timing(
+                self.rule_counts[position], self.rule_times[position]
+            ))
+            rule['columns'] = collections.OrderedDict(
+                (column, timing(count, self.column_times[position][column]),)
+                for (column, count,) in self.column_counts[position].items()
+            )
+            rules.append(rule)
+
+        return collections.OrderedDict([
+            ('rows_read', self.rows_read),
+            ('rows_written', self.rows_written),
+            ('rows_dropped', collections.OrderedDict([
+                ('pre', self.dropped_pre),
+                ('post', self.dropped_post),
+            ])),
+            ('read_time', self.read_time),
+            ('normalize_time', max(0.0, self.produce_time - self.read_time)),
+            ('write_time', self.write_time),
+            ('elapsed', self.elapsed),
+            ('rules', rules),
+        ])
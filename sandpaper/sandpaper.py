@@ -5,15 +5,37 @@
 # MIT License <https://opensource.org/licenses/MIT>
 
 import os
+import copy
+import glob
+import shutil
+import time
+import pickle
 import hashlib
+import tempfile
 import warnings
 import datetime
 import functools
+import itertools
+import traceback
 import collections
+import concurrent.futures
 
 import six
 import regex
 import pyexcel
+from six.moves import collections_abc
+
+from . import (
+    caching, checkpoints, columnar, delimited, manifest, matchers,
+    pipelining, projection, reporting, workbooks,
+)
+from .records import (
+    HEADER_BUILDERS, Header, Record, expire_derived, from_mappings,
+    is_ordered, keep_header, order_header, remove_header, rename_header,
+)
+
+# selects every sheet of a workbook (sheet names cannot contain ``*``)
+ALL = '*'
 
 
 def value_rule(func):
@@ -58,6 +80,277 @@ def record_rule(func):
     return wrapper
 
 
+def _apply_file(paper, from_file, to_file, apply_kwargs):
+    """ Applies a SandPaper instance to a single file for ``apply_many``.
+
+    .. note:: This is the entry point of ``apply_many`` worker processes, so
+        errors are captured and returned rather than raised.
+
+    :param SandPaper paper: The SandPaper instance to apply
+    :param str from_file: The path of the file to apply the rules to
+    :param str to_file: The path of the file to write to
+    :param dict apply_kwargs: Any named arguments, passed to ``apply``
+    :returns: The result of applying the rules to the file
+    :rtype: dict[str,....]
+    """
+
+    (result, started,) = ({
+        'to_file': to_file,
+        'stats': None,
+        'error': None,
+        'traceback': None,
+    }, time.time(),)
+    try:
+        result['stats'] = paper.apply(from_file, to_file, **apply_kwargs)
+    except Exception as exc:
+        result['error'] = exc
+        result['traceback'] = traceback.format_exc()
+    result['elapsed'] = (time.time() - started)
+    return result
+
+
+class CopyOnWriteRecord(collections_abc.MutableMapping):
+    """ A record proxy which only copies the proxied record once mutated.
+
+    Rules applied with ``copy_records=False`` receive one of these instead of
+    a full copy of the record. Reading from the proxy reads straight through to
+    the proxied record, the first write copies it so the mutation never leaks
+    back into the record being normalized.
+    """
+
+    __slots__ = ('_record', '_copied',)
+
+    def __init__(self, record):
+        """ Initializes the CopyOnWriteRecord object.
+
+        :param collections.OrderedDict record: The record to proxy
+        """
+
+        self._record = record
+        self._copied = False
+
+    def __repr__(self):
+        """ Returns a string representation of a CopyOnWriteRecord instance.
+
+        :returns: A string representation of a CopyOnWriteRecord instance
+        :rtype: str
+        """
+
+        return (
+            '<{self.__class__.__name__} {self._record!r}>'
+        ).format(self=self)
+
+    def __getitem__(self, key):
+        return self._record[key]
+
+    def __setitem__(self, key, value):
+        self.__own()[key] = value
+
+    def __delitem__(self, key):
+        del self.__own()[key]
+
+    def __iter__(self):
+        return iter(self._record)
+
+    def __len__(self):
+        return len(self._record)
+
+    def __contains__(self, key):
+        return key in self._record
+
+    def __own(self):
+        """ Copies the proxied record if it has not already been copied.
+
+        :returns: The record that is safe to mutate
+        :rtype: collections.OrderedDict
+        """
+
+        if not self._copied:
+            self._record = self._record.copy()
+            self._copied = True
+        return self._record
+
+    @property
+    def copied(self):
+        """ Indicates if the proxied record has been copied.
+
+        :getter: Returns True if the proxied record has been copied
+        :rtype: bool
+        """
+
+        return self._copied
+
+    @property
+    def record(self):
+        """ The currently proxied record.
+
+        :getter: Returns the copy if one has been made, otherwise the
+            original record
+        :rtype: collections.OrderedDict
+        """
+
+        return self._record
+
+    def get(self, key, default=None):
+        return self._record.get(key, default)
+
+    def keys(self):
+        return self._record.keys()
+
+    def values(self):
+        return self._record.values()
+
+    def items(self):
+        return self._record.items()
+
+    def copy(self):
+        """ Returns a full copy of the proxied record.
+
+        :returns: A full copy of the proxied record
+        :rtype: collections.OrderedDict
+        """
+
+        return self._record.copy()
+
+
+class FusedValueRules(object):
+    """ A run of consecutive built-in value rules fused into one step.
+
+    Resolved steps of built-in value rules without a ``callable_filter`` that
+    target the same columns are fused so each value is taken through the
+    whole run at once instead of passing over the record once per rule.
+    Built-in value rules only ever read ``record[column]``, so every value
+    still sees the rules (and their value filters) in the same order.
+    """
+
+    __slots__ = ('steps',)
+
+    def __init__(self, steps):
+        """ Initializes the FusedValueRules object.
+
+        :param list steps: The resolved steps to fuse
+        """
+
+        self.steps = tuple(steps)
+
+    def __repr__(self):
+        """ Returns a string representation of a FusedValueRules instance.
+
+        :returns: A string representation of a FusedValueRules instance
+        :rtype: str
+        """
+
+        return ('<{name} ({rules})>').format(
+            name=self.__class__.__name__,
+            rules=', '.join(
+                rule.__name__ for (_, rule, _, _, _,) in self.steps
+            )
+        )
+
+    def __call__(self, paper, column, value, stats=None, report=None):
+        """ Takes a value through every fused rule.
+
+        :param SandPaper paper: The SandPaper instance applying the rules
+        :param str column: The column of the value
+        :param value: The value to normalize
+        :param dict stats: The rule statistics to count applications in
+            (defaults to not counting applications)
+        :param reporting.ApplyReport report: The report to add the time spent
+            in each rule to
+        :returns: The normalized value
+        """
+
+        for (position, rule, rule_args, rule_kwargs, targets,) in self.steps:
+            (_, value_filter, _, memo,) = targets
+            if value_filter is not None and \
+                    not value_filter.match(str(value)):
+                continue
+
+            if report is not None:
+                started = reporting.clock()
+            result = (
+                memo.get(column, value)
+                if memo is not None else
+                caching.MISSING
+            )
+            if result is caching.MISSING:
+                result = rule(
+                    paper, {column: value}, column,
+                    *rule_args, **rule_kwargs
+                )
+                if memo is not None:
+                    memo.set(column, value, result)
+            value = result
+            if report is not None:
+                report.add_rule(
+                    position, reporting.clock() - started, column=column
+                )
+            if stats is not None:
+                stats[rule.__name__] += 1
+        return value
+
+
+class ColumnMapping(object):
+    """ A built-in column rule resolved against the header of a file.
+
+    ``rename_columns``, ``order_columns``, ``keep_columns`` and
+    ``remove_columns`` only depend on the column names of a record, so their
+    resulting header and the positions of its values are computed once when
+    rules are resolved. Each record with the resolved header then only has
+    its values rearranged, records with any other columns (from custom rules
+    changing the schema) fall back to applying the rule itself.
+    """
+
+    __slots__ = ('rule', 'source', 'header', 'indices',)
+
+    def __init__(self, rule, source, header, indices):
+        """ Initializes the ColumnMapping object.
+
+        :param callable rule: The built-in column rule
+        :param Header source: The header the rule was resolved against
+        :param Header header: The header of records after the rule
+        :param list[int] indices: The positions in ``source`` of the values of
+            ``header``
+        """
+
+        (self.rule, self.source, self.header, self.indices,) = (
+            rule, source, header, indices,
+        )
+
+    def __repr__(self):
+        """ Returns a string representation of a ColumnMapping instance.
+
+        :returns: A string representation of a ColumnMapping instance
+        :rtype: str
+        """
+
+        return ('<{name} {rule} {source} -> {header}>').format(
+            name=self.__class__.__name__,
+            rule=self.rule.__name__,
+            source=list(self.source.columns),
+            header=list(self.header.columns)
+        )
+
+    def map(self, record):
+        """ Rearranges the values of a record with the resolved header.
+
+        :param record: The record to map
+        :returns: The mapped record or None if the record does not have the
+            resolved header
+        :rtype: Record
+        """
+
+        if isinstance(record, Record):
+            if record.header is not self.source:
+                return None
+            row = record.row
+        else:
+            if tuple(record) != self.source.columns:
+                return None
+            row = list(record.values())
+        return Record(self.header, [row[index] for index in self.indices])
+
+
 class SandPaper(object):
     """ The SandPaper object.
 
@@ -68,10 +361,22 @@ class SandPaper(object):
     __available_filters = (
         'column_filter', 'value_filter', 'callable_filter',
     )
-    __rule_stats = {}
+    __available_engines = ('row', 'columnar',)
+    __available_readers = ('stream', 'mmap',)
+    __available_replace_modes = ('sequential', 'leftmost_longest',)
     __default_apply = {
         'auto_detect_datetime': False,
     }
+    __compiled_arguments = {
+        'replace': ('replacements', matchers.Replacements,),
+        'translate_text': ('translations', matchers.TextTranslations,),
+        'translate_date': ('translations', matchers.DateTranslations,),
+    }
+    __delimited_kwargs = (
+        'auto_detect_datetime', 'auto_detect_float', 'auto_detect_int',
+        'encoding', 'ignore_infinity', 'ignore_nan_text', 'default_float_nan',
+        'pep_0515_off',
+    )
 
     def __init__(self, name=None):
         """ Initializes the SandPaper object.
@@ -84,6 +389,7 @@ class SandPaper(object):
 
         if name is not None:
             self.name = name
+        self.__rule_stats = {}
 
     def __repr__(self):
         """ Returns a string representation of a SandPaper instance.
@@ -116,6 +422,36 @@ class SandPaper(object):
 
         return int(self.uid, 16)
 
+    def __getstate__(self):
+        """ Returns the picklable state of a SandPaper instance.
+
+        .. note:: Rules are stored by name since the decorated rule methods
+            shadow the raw rule callables stored in ``rules``.
+
+        :returns: The picklable state of a SandPaper instance
+        :rtype: dict
+        """
+
+        return {
+            'name': getattr(self, '_name', None),
+            'rules': [
+                (rule.__name__, rule_args, rule_kwargs,)
+                for (rule, rule_args, rule_kwargs,) in self.rules
+            ],
+        }
+
+    def __setstate__(self, state):
+        """ Restores a SandPaper instance from its picklable state.
+
+        :param dict state: The state from ``__getstate__``
+        :returns: Nothing
+        """
+
+        if state['name'] is not None:
+            self.name = state['name']
+        for (rule_name, rule_args, rule_kwargs,) in state['rules']:
+            getattr(self, rule_name)(*rule_args, **rule_kwargs)
+
     def __json__(self):
         """ The current instance to a dictionary suitable for json encoding.
 
@@ -220,179 +556,1769 @@ class SandPaper(object):
 
         A hexadecimal digest string
 
+        .. note:: The hash is cached along with the rules it was built from.
+            Appended rules are added to the cached hash incrementally while
+            any other change to ``rules`` (removing, replacing or reordering
+            rules) rebuilds it. Arguments of rules mutated in place are not
+            detected.
+
         :getter: Returns a continually updating hash of the active rules
         :rtype: str
         """
 
-        hasher = hashlib.sha1()
-        for (rule, rule_args, rule_kwargs,) in self.rules:
-            hasher.update((
-                "{rule.__name__}({args}, {kwargs})"
-            ).format(
-                rule=rule,
-                args=self.__jsonify(rule_args),
-                kwargs=self.__jsonify(rule_kwargs)).encode('utf-8')
-            )
-        return hasher.hexdigest()
+        (hashed, hasher, digest,) = getattr(
+            self, '_uid', ((), hashlib.sha1(), None,)
+        )
+        rules = self.rules
+        if len(rules) < len(hashed) or any(
+            rule is not hashed_rule
+            for (rule, hashed_rule,) in zip(rules, hashed)
+        ):
+            (hashed, hasher, digest,) = ((), hashlib.sha1(), None,)
+
+        if digest is None or len(rules) > len(hashed):
+            # the cached hasher may be shared by copies of the instance
+            hasher = hasher.copy()
+            for (rule, rule_args, rule_kwargs,) in rules[len(hashed):]:
+                hasher.update((
+                    "{rule.__name__}({args}, {kwargs})"
+                ).format(
+                    rule=rule,
+                    args=self.__jsonify(rule_args),
+                    kwargs=self.__jsonify(rule_kwargs)).encode('utf-8')
+                )
+            (hashed, digest,) = (tuple(rules), hasher.hexdigest(),)
+            self._uid = (hashed, hasher, digest,)
+        return digest
+
+    @property
+    def rules(self):
+        """ This list of applicable rules for the SandPaper instance.
+
+        :getter: Returns the list of applicable rules for the instance
+        :rtype: list[tuple(callable, tuple(....,....), dict[str,....])]
+        """
+
+        if not hasattr(self, '_rules'):
+            self._rules = []
+        return self._rules
+
+    @property
+    def value_rules(self):
+        """ The set of value rules for the SandPaper instance.
+
+        :getter: Returns the set rules for the SandPaper instance
+        :rtype: set(callable)
+        """
+
+        if not hasattr(self, '_value_rules'):
+            self._value_rules = set()
+        return self._value_rules
+
+    @property
+    def record_rules(self):
+        """ The set of record rules for the SandPaper instance.
+
+        :getter: Returns the set rules for the SandPaper instance
+        :rtype: set(callable)
+        """
+
+        if not hasattr(self, '_record_rules'):
+            self._record_rules = set()
+        return self._record_rules
+
+    def _filter_values(
+        self, record,
+        column_filter=None, value_filter=None, callable_filter=None,
+        **kwargs
+    ):
+        """ Yield only allowed (column, value) pairs using supported filters.
+
+        :param collections.OrderedDict record: An ordered dictionary of
+            (``column_name``, ``row_value``) items
+        :param str column_filter: A matched regular expression for
+            ``column_name``
+        :param str value_filter: A matched regular expression for ``row_value``
+        :param callable callable_filter: An truthy evaluated callable
+        :param dict kwargs: Any named arguments, for the kwargs of
+            ``callable_filter``
+        :returns: A generator yielding allowed (column, value) pairs
+        """
+
+        for (column, value) in record.items():
+
+            if column_filter is not None:
+                if not column_filter.match(str(column)):
+                    continue
+            if value_filter is not None:
+                if not value_filter.match(str(value)):
+                    continue
+            if callable(callable_filter):
+                if not callable_filter(record, column, **kwargs):
+                    continue
+
+            yield (column, value,)
+
+    def _compile_rules(self, memoize=None):
+        """ Compiles the active rules into an execution plan.
+
+        .. note:: Filters are prepared once per application rather than once
+            per record, as are the arguments of built-in rules listed in
+            ``__compiled_arguments``. The returned plan still needs to be
+            resolved against the columns of a record through
+            ``_resolve_rules``.
+
+        .. note:: Built-in value rules are limited to the columns that are
+            still needed after them (see ``projection.live_columns``), so
+            values of columns that later rules remove are never normalized.
+
+        :param int memoize: The maximum number of results of built-in value
+            rules to memoize per rule and column (defaults to no memoization)
+        :returns: A list of (``rule``, ``rule_args``, ``rule_kwargs``,
+            ``filters``) tuples where ``filters`` is a tuple of
+            (``column_filter``, ``value_filter``, ``callable_filter``,
+            ``live``, ``memo``) for value rules and None for record rules.
+            ``live`` are the columns needed after the rule or None if every
+            column is
+        :rtype: list[tuple(callable, tuple(....,....), dict[str,....], tuple)]
+        """
+
+        plan = []
+        for (rule, rule_args, rule_kwargs,) in self.rules:
+            filters = None
+            if rule in self.value_rules:
+                (column_filter, value_filter, callable_filter,) = (
+                    rule_kwargs.get(filter_name)
+                    for filter_name in self.__available_filters
+                )
+                if isinstance(column_filter, six.string_types):
+                    column_filter = regex.compile(column_filter)
+                if isinstance(value_filter, six.string_types):
+                    value_filter = regex.compile(value_filter)
+                if not callable(callable_filter):
+                    callable_filter = None
+                # built-in value rules are pure functions of the value
+                memo = (
+                    caching.RuleMemo(memoize)
+                    if memoize is not None and self._is_builtin_rule(rule) else
+                    None
+                )
+                filters = (column_filter, value_filter, callable_filter, memo,)
+            (rule_args, rule_kwargs,) = self.__compile_arguments(
+                rule, rule_args, rule_kwargs
+            )
+            plan.append((rule, rule_args, rule_kwargs, filters,))
+
+        (_, live,) = projection.live_columns(plan, self._is_builtin_rule)
+        for (index, (rule, rule_args, rule_kwargs, filters,),) in \
+                enumerate(plan):
+            if filters is not None:
+                (column_filter, value_filter, callable_filter, memo,) = filters
+                plan[index] = (rule, rule_args, rule_kwargs, (
+                    column_filter, value_filter, callable_filter,
+                    (
+                        None
+                        if live[index].everything or
+                        not self._is_builtin_rule(rule) else
+                        live[index]
+                    ),
+                    memo,
+                ),)
+        return plan
+
+    def __compile_arguments(self, rule, rule_args, rule_kwargs):
+        """ Compiles the first argument of a built-in rule for a plan.
+
+        :param callable rule: The rule to compile the argument of
+        :param tuple rule_args: The positional arguments of the rule
+        :param dict rule_kwargs: The named arguments of the rule
+        :returns: A tuple of (``rule_args``, ``rule_kwargs``) with the
+            argument compiled, the originals are never modified
+        :rtype: tuple(tuple(....,....), dict[str,....])
+        """
+
+        if rule.__name__ not in self.__compiled_arguments or \
+                not self._is_builtin_rule(rule):
+            return (rule_args, rule_kwargs,)
+
+        (argument_name, compiler,) = self.__compiled_arguments[rule.__name__]
+        if len(rule_args) > 0:
+            rule_args = (compiler(rule_args[0]),) + tuple(rule_args[1:])
+        elif argument_name in rule_kwargs:
+            rule_kwargs = dict(rule_kwargs, **{
+                argument_name: compiler(rule_kwargs[argument_name])
+            })
+        return (rule_args, rule_kwargs,)
+
+    def _resolve_rules(self, plan, start, header):
+        """ Resolves a compiled plan against the columns of a record.
+
+        .. note:: Resolution stops right after the first record rule, as record
+            rules may change the columns that the remaining rules need to be
+            resolved against. Built-in ``rename_columns``, ``order_columns``,
+            ``keep_columns`` and ``remove_columns`` rules are resolved into a
+            :class:`ColumnMapping` instead, and resolution continues with the
+            header they produce.
+
+        .. note:: Consecutive built-in value rules without a
+            ``callable_filter`` that target the same columns are fused into a
+            single step applying a :class:`FusedValueRules`.
+
+        :param list plan: A compiled plan from ``_compile_rules``
+        :param int start: The index of the plan to start resolving from
+        :param tuple header: The column names of the record
+        :returns: A tuple of (``steps``, ``next_start``) where ``steps`` is a
+            list of (``position``, ``rule``, ``rule_args``, ``rule_kwargs``,
+            ``targets``) tuples and ``next_start`` is None once the plan is
+            exhausted.
+            ``targets`` is a tuple of (``columns``, ``value_filter``,
+            ``callable_filter``, ``memo``) for value rules and None for record
+            rules
+        :rtype: tuple(list[tuple], int)
+        """
+
+        steps = []
+        for (index, (rule, rule_args, rule_kwargs, filters,),) in \
+                enumerate(plan[start:], start):
+            if filters is None:
+                mapping = self.__map_columns(
+                    rule, rule_args, rule_kwargs, header
+                )
+                if mapping is None:
+                    steps.append((index, rule, rule_args, rule_kwargs, None,))
+                    return (self.__fuse_steps(steps), index + 1,)
+
+                # built-in column rules are resolved by their new header
+                steps.append((index, mapping, rule_args, rule_kwargs, None,))
+                header = mapping.header.columns
+                continue
+
+            (column_filter, value_filter, callable_filter, live, memo,) = (
+                filters
+            )
+            columns = tuple(
+                column
+                for column in header
+                if (
+                    column_filter is None or
+                    column_filter.match(str(column))
+                ) and (live is None or column in live)
+            )
+            # value rules matching no columns are dropped from the steps
+            if len(columns) > 0:
+                steps.append((
+                    index, rule, rule_args, rule_kwargs,
+                    (columns, value_filter, callable_filter, memo,),
+                ))
+        return (self.__fuse_steps(steps), None,)
+
+    def __map_columns(self, rule, rule_args, rule_kwargs, header):
+        """ Resolves a built-in column rule against a header.
+
+        :param callable rule: The record rule
+        :param tuple rule_args: The positional arguments of the rule
+        :param dict rule_kwargs: The named arguments of the rule
+        :param tuple header: The column names of the record
+        :returns: The resolved column mapping or None if the rule is not a
+            built-in column rule
+        :rtype: ColumnMapping
+        """
+
+        build = HEADER_BUILDERS.get(rule.__name__)
+        if build is None or not self._is_builtin_rule(rule):
+            return None
+
+        try:
+            (mapped, indices,) = build(header, *rule_args, **rule_kwargs)
+        except (AttributeError, KeyError, TypeError):
+            # invalid arguments fail once the rule is applied
+            return None
+        return ColumnMapping(rule, Header.intern(header), mapped, indices)
+
+    def __fuse_steps(self, steps):
+        """ Fuses runs of built-in value rule steps targeting the same columns.
+
+        :param list steps: Resolved steps from ``_resolve_rules``
+        :returns: The steps with every run of fusable steps replaced by a
+            single step applying a :class:`FusedValueRules`
+        :rtype: list[tuple]
+        """
+
+        (fused, run,) = ([], [],)
+        for step in (steps + [None]):
+            fusable = (
+                step is not None and step[-1] is not None and
+                step[-1][2] is None and self._is_builtin_rule(step[1])
+            )
+            if len(run) > 0 and \
+                    (not fusable or step[-1][0] != run[0][-1][0]):
+                fused.append(
+                    (
+                        run[0][0], FusedValueRules(run), (), {},
+                        (run[0][-1][0], None, None, None,),
+                    )
+                    if len(run) > 1 else
+                    run[0]
+                )
+                run = []
+
+            if fusable:
+                run.append(step)
+            elif step is not None:
+                fused.append(step)
+        return fused
+
+    def _run_steps(
+        self, record, steps,
+        monitor_rules=False, copy_records=True, report=None,
+    ):
+        """ Applies resolved steps to a single record.
+
+        :param collections.OrderedDict record: An ordered dictionary of
+            (``column_name``, ``row_value``) items
+        :param list steps: Resolved steps from ``_resolve_rules``
+        :param bool monitor_rules: Boolean flag that inidicates if the count of
+            applied rules should be monitored
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param reporting.ApplyReport report: The report to add the time spent
+            in each rule to (defaults to not timing rules)
+        :returns: The record with the steps applied
+        :rtype: collections.OrderedDict
+        """
+
+        # proxies are shared between rules until one of them mutates it
+        view = None
+        for (position, rule, rule_args, rule_kwargs, targets,) in steps:
+            if isinstance(rule, FusedValueRules):
+                stats = (self.__rule_stats if monitor_rules else None)
+                for column in targets[0]:
+                    record[column] = rule(
+                        self, column, record[column],
+                        stats=stats, report=report
+                    )
+                continue
+
+            if targets is None:
+                # handle application of record rule
+                if report is not None:
+                    started = reporting.clock()
+                mapped = None
+                if isinstance(rule, ColumnMapping):
+                    # records with other columns fall back to the rule
+                    (mapped, rule,) = (rule.map(record), rule.rule,)
+                if mapped is not None:
+                    (record, view,) = (mapped, None,)
+                elif copy_records:
+                    record = rule(
+                        self, record.copy(),
+                        *rule_args, **rule_kwargs
+                    )
+                else:
+                    view = CopyOnWriteRecord(record)
+                    record = rule(self, view, *rule_args, **rule_kwargs)
+                    if record is view:
+                        record = view.record
+                    view = None
+                if report is not None:
+                    report.add_rule(position, reporting.clock() - started)
+                if monitor_rules:
+                    self.__rule_stats[rule.__name__] += 1
+                continue
+
+            # value rules are required to pass filtering
+            (columns, value_filter, callable_filter, memo,) = targets
+            for column in columns:
+                if value_filter is not None and \
+                        not value_filter.match(str(record[column])):
+                    continue
+                if callable_filter is not None and \
+                        not callable_filter(record, column, **rule_kwargs):
+                    continue
+
+                if report is not None:
+                    started = reporting.clock()
+                if memo is not None:
+                    value = record[column]
+                    result = memo.get(column, value)
+                    if result is caching.MISSING:
+                        result = rule(
+                            self, {column: value}, column,
+                            *rule_args, **rule_kwargs
+                        )
+                        memo.set(column, value, result)
+                    record[column] = result
+                else:
+                    # handle application of value rule
+                    if copy_records:
+                        argument = record.copy()
+                    else:
+                        if view is None or view.copied:
+                            view = CopyOnWriteRecord(record)
+                        argument = view
+                    record[column] = rule(
+                        self, argument, column,
+                        *rule_args, **rule_kwargs
+                    )
+                if report is not None:
+                    report.add_rule(
+                        position, reporting.clock() - started, column=column
+                    )
+                if monitor_rules:
+                    self.__rule_stats[rule.__name__] += 1
+
+        return record
+
+    def _normalize_record(
+        self, record, plan, resolved,
+        start=0, monitor_rules=False, copy_records=True, report=None,
+    ):
+        """ Applies a compiled plan to a single record.
+
+        :param collections.OrderedDict record: An ordered dictionary of
+            (``column_name``, ``row_value``) items
+        :param list plan: A compiled plan from ``_compile_rules``
+        :param dict resolved: A cache of resolved steps keyed by
+            (``start``, ``header``)
+        :param int start: The index of the plan to start applying from
+        :param bool monitor_rules: Boolean flag that inidicates if the count of
+            applied rules should be monitored
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param reporting.ApplyReport report: The report to add the time spent
+            in each rule to
+        :returns: The normalized record
+        :rtype: collections.OrderedDict
+        """
+
+        while start is not None:
+            # interned headers of records are cheaper keys than column names
+            if isinstance(record, Record):
+                (key, header,) = (
+                    (start, record.header,), record.header.columns,
+                )
+            else:
+                key = (start, tuple(record),)
+                header = key[-1]
+            if key not in resolved:
+                resolved[key] = self._resolve_rules(plan, start, header)
+            (steps, start,) = resolved[key]
+            record = self._run_steps(
+                record, steps,
+                monitor_rules=monitor_rules, copy_records=copy_records,
+                report=report
+            )
+
+        return record
+
+    def _is_builtin_rule(self, rule):
+        """ Checks if a rule is one of the built-in SandPaper rules.
+
+        .. note:: Built-in value rules are pure functions of the value at
+            ``record[column]`` and their arguments.
+
+        :param callable rule: The rule to check
+        :returns: True if the rule is a built-in rule
+        :rtype: bool
+        """
+
+        builtin = getattr(SandPaper, rule.__name__, None)
+        return getattr(builtin, '__wrapped__', None) is rule
+
+    @staticmethod
+    def __unwrap_record(record):
+        """ Gets the record proxied by a copy-on-write record.
+
+        .. note:: Only safe for rules that build a new record rather than
+            mutating the one they receive.
+
+        :param record: A record or a copy-on-write record proxy
+        :returns: The proxied record or ``record`` itself
+        """
+
+        if isinstance(record, CopyOnWriteRecord):
+            return record.record
+        return record
+
+    def _normalize_batch(
+        self, records, plan, resolved,
+        monitor_rules=False, copy_records=True, report=None,
+    ):
+        """ Applies a compiled plan to a batch of records column by column.
+
+        .. note:: Built-in rules are applied to whole columns at once (value
+            rules only when no ``callable_filter`` is given). Any other rule
+            is applied record by record for the batch.
+
+        :param list records: A list of records to normalize
+        :param list plan: A compiled plan from ``_compile_rules``
+        :param dict resolved: A cache of resolved steps keyed by
+            (``start``, ``header``)
+        :param bool monitor_rules: Boolean flag that inidicates if the count of
+            applied rules should be monitored
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param reporting.ApplyReport report: The report to add the time spent
+            in each rule to
+        :returns: The normalized records
+        :rtype: list[collections.OrderedDict]
+        """
+
+        (count, pivoted,) = (len(records), columnar.pivot(records),)
+        if pivoted is None:
+            return [
+                self._normalize_record(
+                    record, plan, resolved,
+                    monitor_rules=monitor_rules, copy_records=copy_records,
+                    report=report
+                )
+                for record in records
+            ]
+
+        ((header, columns,), start,) = (pivoted, 0,)
+        while start is not None:
+            key = (start, tuple(header),)
+            if key not in resolved:
+                resolved[key] = self._resolve_rules(plan, start, key[-1])
+            (steps, start,) = resolved[key]
+            positions = dict(
+                (column, index,) for (index, column,) in enumerate(header)
+            )
+
+            # fused steps are applied rule by rule to whole columns instead
+            for step in itertools.chain.from_iterable(
+                (
+                    step[1].steps
+                    if isinstance(step[1], FusedValueRules) else
+                    (step,)
+                )
+                for step in steps
+            ):
+                (position, rule, rule_args, rule_kwargs, targets,) = step
+                if isinstance(rule, ColumnMapping):
+                    if tuple(header) == rule.source.columns:
+                        started = reporting.clock()
+                        (header, columns,) = (
+                            list(rule.header.columns),
+                            [columns[index] for index in rule.indices],
+                        )
+                        positions = dict(
+                            (column, index,)
+                            for (index, column,) in enumerate(header)
+                        )
+                        if report is not None:
+                            report.add_rule(
+                                position, reporting.clock() - started,
+                                count=count
+                            )
+                        if monitor_rules:
+                            self.__rule_stats[rule.rule.__name__] += count
+                        continue
+                    rule = rule.rule
+
+                builtin = self._is_builtin_rule(rule)
+                if targets is None:
+                    kernel = (
+                        columnar.RECORD_KERNELS.get(rule.__name__)
+                        if builtin else
+                        None
+                    )
+                    started = reporting.clock()
+                    result = (
+                        kernel(
+                            header, columns, count, *rule_args, **rule_kwargs
+                        )
+                        if kernel is not None else
+                        None
+                    )
+                    if result is not None:
+                        if report is not None:
+                            report.add_rule(
+                                position, reporting.clock() - started,
+                                count=count
+                            )
+                        (header, columns,) = result
+                        positions = dict(
+                            (column, index,)
+                            for (index, column,) in enumerate(header)
+                        )
+                        if monitor_rules:
+                            self.__rule_stats[rule.__name__] += count
+                        continue
+
+                    records = [
+                        self._run_steps(
+                            record, [step],
+                            monitor_rules=monitor_rules,
+                            copy_records=copy_records, report=report
+                        )
+                        for record in columnar.unpivot(header, columns, count)
+                    ]
+                    pivoted = columnar.pivot(records)
+                    if pivoted is None:
+                        # record rule produced differing columns, so finish
+                        # the rest of the plan record by record
+                        return [
+                            self._normalize_record(
+                                record, plan, resolved,
+                                start=start,
+                                monitor_rules=monitor_rules,
+                                copy_records=copy_records, report=report
+                            )
+                            for record in records
+                        ]
+                    (header, columns,) = pivoted
+                    continue
+
+                (target_columns, value_filter, callable_filter, memo,) = (
+                    targets
+                )
+                if not builtin or callable_filter is not None:
+                    records = [
+                        self._run_steps(
+                            record, [step],
+                            monitor_rules=monitor_rules,
+                            copy_records=copy_records, report=report
+                        )
+                        for record in columnar.unpivot(header, columns, count)
+                    ]
+                    (header, columns,) = columnar.pivot(records)
+                    continue
+
+                kernel = columnar.VALUE_KERNELS.get(rule.__name__)
+                for column in target_columns:
+                    apply_kernel = (
+                        kernel
+                        if kernel is not None else
+                        functools.partial(
+                            self.__apply_value_rule, rule, column, memo
+                        )
+                    )
+
+                    (values, started,) = (
+                        columns[positions[column]], reporting.clock(),
+                    )
+                    if value_filter is None:
+                        columns[positions[column]] = apply_kernel(
+                            values, *rule_args, **rule_kwargs
+                        )
+                        applied = count
+                    else:
+                        selected = [
+                            index
+                            for (index, value,) in enumerate(values)
+                            if value_filter.match(str(value))
+                        ]
+                        if len(selected) > 0:
+                            normalized = apply_kernel(
+                                [values[index] for index in selected],
+                                *rule_args, **rule_kwargs
+                            )
+                            for (index, value,) in zip(selected, normalized):
+                                values[index] = value
+                        applied = len(selected)
+                    if report is not None and applied > 0:
+                        report.add_rule(
+                            position, reporting.clock() - started,
+                            count=applied, column=column
+                        )
+                    if monitor_rules:
+                        self.__rule_stats[rule.__name__] += applied
+
+        return columnar.unpivot(header, columns, count)
+
+    def __apply_value_rule(
+        self, rule, column, memo, values,
+        *args, **kwargs
+    ):
+        """ Applies a built-in value rule to a column of values.
+
+        :param callable rule: The built-in value rule to apply
+        :param str column: The column name the values belong to
+        :param caching.RuleMemo memo: The memoized results of the rule or
+            None if results are not memoized
+        :param list values: The column values to normalize
+        :param dict kwargs: Any named arguments, for the rule
+        :returns: The normalized column values
+        :rtype: list
+        """
+
+        # built-in value rules only ever read record[column]
+        if memo is None:
+            return [
+                rule(self, {column: value}, column, *args, **kwargs)
+                for value in values
+            ]
+
+        normalized = []
+        for value in values:
+            result = memo.get(column, value)
+            if result is caching.MISSING:
+                result = rule(self, {column: value}, column, *args, **kwargs)
+                memo.set(column, value, result)
+            normalized.append(result)
+        return normalized
+
+    def _apply_rules(
+        self, from_file,
+        sheet_name=None, row_filter=None, monitor_rules=False,
+        copy_records=True, engine='row', batch_size=1024, memoize=None,
+        report=None, pipeline=None,
+        **kwargs
+    ):
+        """ Base rule application method.
+
+        .. note:: Rules are compiled once per application and resolved once
+            per distinct header, so the per record work is limited to the
+            resolved (``column``, ``rule``) steps.
+
+        :param str from_file: The file to apply rules to
+        :param str sheet_name: The name of the sheet to apply rules to
+        :param callable row_filter: A callable which accepts a cleaned record
+            and returns True if the record should be written out
+        :param bool monitor_rules: Boolean flag that inidicates if the count of
+            applied rules should be monitored
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param str engine: The engine to apply rules with, either ``row`` or
+            ``columnar``
+        :param int batch_size: The number of records per ``columnar`` batch
+        :param int memoize: The maximum number of results of built-in value
+            rules to memoize per rule and column
+        :param reporting.ApplyReport report: The report to collect metrics in
+            (defaults to not collecting metrics)
+        :param int pipeline: The number of batches of ``batch_size`` records
+            to read ahead in a separate thread (defaults to reading records
+            as they are normalized)
+        :param dict kwargs: Any named arguments, for the reading of the file
+        :returns: Yields normalized records
+        """
+
+        plan = self._compile_rules(memoize=memoize)
+        # rule arguments may have changed since headers were last derived
+        expire_derived()
+        # columns no rule needs are left unread unless a row filter sees them
+        (columns, _,) = projection.live_columns(plan, self._is_builtin_rule)
+        if callable(row_filter) or columns.everything:
+            columns = None
+        if not callable(row_filter):
+            row_filter = self.__row_filter
+
+        records = self.__iget_records(
+            from_file, sheet_name=sheet_name, columns=columns, **kwargs
+        )
+        if pipeline is not None:
+            records = reading = pipelining.read_ahead(
+                records, batch_size=batch_size, depth=pipeline
+            )
+        if report is not None:
+            records = report.timed(records, 'read_time')
+        try:
+            for record in self.__normalize_records(
+                records, plan, row_filter,
+                monitor_rules=monitor_rules, copy_records=copy_records,
+                engine=engine, batch_size=batch_size, report=report
+            ):
+                yield record
+        finally:
+            # stops the reading thread if the records are closed early
+            if pipeline is not None:
+                reading.close()
+
+    def __normalize_records(
+        self, records, plan, row_filter,
+        monitor_rules=False, copy_records=True, engine='row', batch_size=1024,
+        report=None, in_place=False,
+    ):
+        """ Applies a compiled plan to an iterable of records.
+
+        :param records: An iterable of records
+        :param list plan: A compiled plan from ``_compile_rules``
+        :param callable row_filter: A callable which accepts a record and
+            returns True if the record should be normalized (or written out)
+        :param bool monitor_rules: Boolean flag that inidicates if the count of
+            applied rules should be monitored
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param str engine: The engine to apply rules with, either ``row`` or
+            ``columnar``
+        :param int batch_size: The number of records per ``columnar`` batch
+        :param reporting.ApplyReport report: The report to collect metrics in
+            (defaults to not collecting metrics)
+        :param bool in_place: Boolean flag that indicates if the given records
+            should be updated with their normalized columns and yielded
+            instead of the normalized records
+        :returns: Yields normalized records
+        """
+
+        (resolved, records,) = ({}, self.__filter_records(
+            records, plan, row_filter,
+            monitor_rules=monitor_rules, report=report
+        ),)
+
+        # start application of all registered rules
+        if engine == 'columnar':
+            normalized = itertools.chain.from_iterable(
+                zip(batch, self._normalize_batch(
+                    batch, plan, resolved,
+                    monitor_rules=monitor_rules, copy_records=copy_records,
+                    report=report
+                ))
+                for batch in iter(
+                    lambda: list(itertools.islice(records, batch_size)), []
+                )
+            )
+        else:
+            normalized = (
+                (record, self._normalize_record(
+                    record, plan, resolved,
+                    monitor_rules=monitor_rules, copy_records=copy_records,
+                    report=report
+                ),)
+                for record in records
+            )
+
+        for (source, record,) in normalized:
+            if in_place and record is not source:
+                # record rules build new records, copy their columns back
+                source.clear()
+                source.update(record)
+                record = source
+            # row filtering done post record normalization
+            if row_filter(record, normalized=True):
+                if report is not None:
+                    report.rows_written += 1
+                yield record
+            elif report is not None:
+                report.dropped_post += 1
+
+        if monitor_rules:
+            for (rule, _, _, filters,) in plan:
+                if filters is None or filters[-1] is None:
+                    continue
+                for (counter, count,) in (
+                    ('memo_hits', filters[-1].hits,),
+                    ('memo_misses', filters[-1].misses,),
+                ):
+                    key = ('{rule.__name__}.{counter}').format(**locals())
+                    self.__rule_stats[key] = (
+                        self.__rule_stats.get(key, 0) + count
+                    )
+
+    def __is_delimited(self, file_type, kwargs):
+        """ Checks if a file type can be read and written by ``delimited``.
+
+        :param str file_type: The type of the file
+        :param dict kwargs: Any named arguments, for the reading of the file
+        :returns: True if the file can skip pyexcel
+        :rtype: bool
+        """
+
+        return (
+            six.PY3 and
+            file_type in delimited.DIALECTS and
+            all(key in self.__delimited_kwargs for key in kwargs)
+        )
+
+    def __iget_records(
+        self, from_file,
+        sheet_name=None, file_stream=None, file_type=None, columns=None,
+        ranges=None, reader='stream', stream_xlsx=False,
+        **kwargs
+    ):
+        """ Reads records from a file.
+
+        .. note:: Delimited files are read with the ``csv`` module rather than
+            pyexcel, yielding the same records as ``pyexcel.iget_records``.
+            With the ``mmap`` reader, delimited files in an encoding
+            splittable at newline bytes are memory mapped and read by
+            ``delimited.read_mapped`` instead. With ``stream_xlsx``, ``.xlsx``
+            files are read row by row by ``workbooks.read_records``.
+
+        :param str from_file: The file to read records from
+        :param str sheet_name: The name of the sheet to read records from
+        :param file file_stream: A text stream to read records from instead
+            of ``from_file``
+        :param str file_type: The type of the ``file_stream``
+        :param projection.Columns columns: The columns that are needed, other
+            columns may be left out of delimited records (defaults to every
+            column)
+        :param list[tuple(int, int)] ranges: The (``start``, ``end``) byte
+            offsets of a delimited ``from_file`` to read in order (defaults
+            to the whole file)
+        :param str reader: The reader of delimited files, either ``stream``
+            or ``mmap``
+        :param bool stream_xlsx: Boolean flag that indicates if ``.xlsx``
+            files should be read row by row
+        :param dict kwargs: Any named arguments, for the reading of the file
+        :returns: A generator yielding records
+        """
+
+        encoding = kwargs.get('encoding', 'utf-8')
+        if sheet_name is None and file_stream is not None and \
+                self.__is_delimited(file_type, kwargs):
+            for record in delimited.read_records(
+                file_stream, file_type=file_type, columns=columns,
+                **dict(
+                    (key, value,)
+                    for (key, value,) in kwargs.items()
+                    if key != 'encoding'
+                )
+            ):
+                yield record
+        elif sheet_name is None and file_stream is None and \
+                self.__is_delimited(
+                    delimited.get_file_type(from_file), kwargs
+                ) and \
+                not delimited.is_multiple_sheets(from_file):
+            if reader == 'mmap' and \
+                    delimited.is_splittable_encoding(encoding):
+                for record in delimited.read_mapped(
+                    from_file,
+                    ranges=ranges,
+                    file_type=delimited.get_file_type(from_file),
+                    columns=columns,
+                    **kwargs
+                ):
+                    yield record
+                return
+
+            with (
+                open(from_file, 'r', encoding=encoding)
+                if ranges is None else
+                delimited.open_ranges(from_file, ranges, encoding=encoding)
+            ) as fp:
+                for record in self.__iget_records(
+                    None,
+                    file_stream=fp,
+                    file_type=delimited.get_file_type(from_file),
+                    columns=columns,
+                    **kwargs
+                ):
+                    yield record
+        elif stream_xlsx and file_stream is None and \
+                workbooks.is_xlsx(from_file) and \
+                all(key in self.__delimited_kwargs for key in kwargs):
+            # the type detection options only apply to delimited files
+            for record in workbooks.read_records(
+                from_file, sheet_name=sheet_name, columns=columns
+            ):
+                yield record
+        else:
+            if file_stream is not None:
+                kwargs.update(file_stream=file_stream, file_type=file_type)
+            for record in from_mappings(pyexcel.iget_records(
+                file_name=from_file, sheet_name=sheet_name,
+                **kwargs
+            )):
+                yield record
+
+    def __isave_records(self, records, to_file, stream_xlsx=False):
+        """ Writes records to a file.
+
+        .. note:: Delimited files are written with the ``csv`` module rather
+            than pyexcel, writing the same bytes as ``pyexcel.isave_as``.
+            With ``stream_xlsx``, ``.xlsx`` files are written row by row by
+            ``workbooks.write_records``.
+
+        :param records: An iterable of records
+        :param str to_file: The file to write records to
+        :param bool stream_xlsx: Boolean flag that indicates if ``.xlsx``
+            files should be written row by row
+        """
+
+        file_type = delimited.get_file_type(to_file)
+        if self.__is_delimited(file_type, {}):
+            with open(to_file, 'w', newline='', encoding='utf-8') as fp:
+                delimited.write_records(fp, records, file_type=file_type)
+        elif stream_xlsx and workbooks.is_xlsx(to_file):
+            workbooks.write_records(to_file, records)
+        else:
+            (records, kwargs,) = (iter(records), {},)
+            first = next(records, None)
+            if first is not None:
+                # pyexcel only keeps the column order of ordered dictionaries
+                kwargs['custom_headers'] = (
+                    list(first.keys())
+                    if is_ordered(first) else
+                    sorted(first.keys())
+                )
+                records = itertools.chain([first], records)
+            pyexcel.isave_as(
+                records=records,
+                dest_file_name=to_file,
+                dest_lineterminator=os.linesep,
+                **kwargs
+            )
+
+    def __filter_records(
+        self, records, plan, row_filter,
+        monitor_rules=False, report=None,
+    ):
+        """ Yields only the records passing the pre-normalization row filter.
+
+        :param records: An iterable of records
+        :param list plan: A compiled plan from ``_compile_rules``
+        :param callable row_filter: A callable which accepts a record and
+            returns True if the record should be normalized
+        :param bool monitor_rules: Boolean flag that inidicates if the count of
+            applied rules should be monitored
+        :param reporting.ApplyReport report: The report to count read and
+            dropped records in
+        :returns: A generator yielding records passing the row filter
+        """
+
+        # set on the copies of instances applied by ``apply_async``
+        cancelled = getattr(self, '_cancelled', None)
+        for record in records:
+            if cancelled is not None and cancelled.is_set():
+                raise concurrent.futures.CancelledError((
+                    'application of {self} was cancelled'
+                ).format(**locals()))
+            if report is not None:
+                report.rows_read += 1
+            if row_filter(record, normalized=False):
+                if monitor_rules:
+                    for (rule, _, _, _,) in plan:
+                        self.__rule_stats.setdefault(rule.__name__, 0)
+                yield record
+            elif report is not None:
+                report.dropped_pre += 1
+
+    def _apply_to(
+        self, from_file, to_file,
+        sheet_name=None, row_filter=None, monitor_rules=False,
+        copy_records=True, engine='row', batch_size=1024, memoize=None,
+        workers=None, collect_metrics=False, checkpoint_path=None,
+        checkpoint_size=None, reader='stream', pipeline=None,
+        stream_xlsx=False,
+        **kwargs
+    ):
+        """ Threadable rule processing method.
+
+        .. important:: No overwrite protection is enabled for this method.
+            If the ``from_file`` is equal to the ``to_file``, then
+            ``from_file`` will be overwritten.
+
+        :param str from_file: The input filepath
+        :param str to_file: The output filepath
+        :param sheet_name: The name of the sheet (or the list of names of
+            sheets, or ``ALL``) to apply rules to
+        :type sheet_name: str or list[str]
+        :param callable row_filter: A callable which accepts a cleaned record
+            and returns True if the record should be written out
+        :param bool monitor_rules: Boolean flag that inidicates if the count of
+            applied rules should be monitored
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param str engine: The engine to apply rules with, either ``row`` or
+            ``columnar``
+        :param int batch_size: The number of records per ``columnar`` batch
+        :param int memoize: The maximum number of results of built-in value
+            rules to memoize per rule and column
+        :param int workers: The number of worker processes to split
+            delimited files over
+        :param bool collect_metrics: Boolean flag that indicates if a
+            performance report should be collected
+        :param str checkpoint_path: The filepath to save checkpoints to
+        :param int checkpoint_size: The number of input bytes to apply between
+            checkpoints
+        :param str reader: The reader of delimited files, either ``stream``
+            or ``mmap``
+        :param int pipeline: The number of batches of records queued between
+            the reading, normalizing and writing threads
+        :param bool stream_xlsx: Boolean flag that indicates if ``.xlsx``
+            files should be read and written row by row
+        :param dict kwargs: Any named arguments, passed to ``_apply_rules``
+        :returns: The performance report if ``collect_metrics`` is true,
+            otherwise the rule statistics if ``monitor_rules`` is true
+        :rtype: dict[str,....]
+        """
+
+        if sheet_name == ALL or isinstance(sheet_name, (list, tuple,)):
+            return self._apply_sheets(
+                from_file, to_file, sheet_name,
+                workers=workers, row_filter=row_filter,
+                monitor_rules=monitor_rules, copy_records=copy_records,
+                engine=engine, batch_size=batch_size, memoize=memoize,
+                collect_metrics=collect_metrics,
+                **kwargs
+            )
+
+        # statistics are kept per instance, never on the shared class dict
+        self.__rule_stats = {}
+        (report, started,) = (
+            (
+                reporting.ApplyReport(
+                    rule.__name__ for (rule, _, _,) in self.rules
+                )
+                if collect_metrics else
+                None
+            ),
+            reporting.clock(),
+        )
+        try:
+            (stats, ranges,) = (None, None,)
+            if checkpoint_path is not None:
+                assert self.__is_splittable(
+                    from_file, to_file, sheet_name, kwargs
+                ), (
+                    'checkpoint_path expected .csv or .tsv files read and '
+                    'written with the csv module, received "{from_file}" and '
+                    '"{to_file}"'
+                ).format(**locals())
+                stats = self._apply_checkpointed(
+                    from_file, to_file, checkpoint_path,
+                    checkpoint_size=checkpoint_size, row_filter=row_filter,
+                    monitor_rules=monitor_rules, copy_records=copy_records,
+                    engine=engine, batch_size=batch_size, memoize=memoize,
+                    report=report, reader=reader,
+                    **kwargs
+                )
+                if stats is None:
+                    warnings.warn((
+                        '{from_file!r} cannot be split at record boundaries, '
+                        'applying without checkpoints'
+                    ).format(**locals()))
+            else:
+                ranges = self.__split_ranges(
+                    from_file, to_file, sheet_name, workers, kwargs,
+                    row_filter=row_filter
+                )
+
+            if stats is None and ranges is not None:
+                stats = self._apply_split(
+                    from_file, to_file, ranges, workers,
+                    row_filter=row_filter, monitor_rules=monitor_rules,
+                    copy_records=copy_records, engine=engine,
+                    batch_size=batch_size, memoize=memoize, report=report,
+                    reader=reader,
+                    **kwargs
+                )
+            elif stats is None:
+                records = self._apply_rules(
+                    from_file,
+                    sheet_name=sheet_name, row_filter=row_filter,
+                    monitor_rules=monitor_rules, copy_records=copy_records,
+                    engine=engine, batch_size=batch_size, memoize=memoize,
+                    report=report, reader=reader, pipeline=pipeline,
+                    stream_xlsx=stream_xlsx,
+                    **kwargs
+                )
+                save = functools.partial(
+                    self.__isave_records,
+                    to_file=to_file, stream_xlsx=stream_xlsx
+                )
+                if pipeline is not None:
+                    save = functools.partial(
+                        pipelining.write_behind, save,
+                        batch_size=batch_size, depth=pipeline
+                    )
+                try:
+                    if report is not None:
+                        report.write(save, records)
+                    else:
+                        save(records)
+                finally:
+                    # a failed writer leaves the records (and reader) open
+                    records.close()
+                stats = self.__rule_stats
+
+            if report is not None:
+                report.elapsed = (reporting.clock() - started)
+                report = report.to_dict()
+                if monitor_rules:
+                    report['stats'] = stats
+                return report
+            if monitor_rules:
+                return stats
+        finally:
+            self.__rule_stats = {}
+
+    def __is_splittable(self, from_file, to_file, sheet_name, kwargs):
+        """ Checks if a delimited file can be applied to in byte ranges.
+
+        :param str from_file: The input filepath
+        :param str to_file: The output filepath
+        :param str sheet_name: The name of the sheet to apply rules to
+        :param dict kwargs: Any named arguments, for the reading of the file
+        :returns: True if both files are delimited files read and written
+            natively and the input can be split at record boundaries
+        :rtype: bool
+        """
+
+        return (
+            sheet_name is None and
+            self.__is_delimited(delimited.get_file_type(from_file), kwargs) and
+            self.__is_delimited(delimited.get_file_type(to_file), {}) and
+            os.path.isfile(from_file) and
+            not delimited.is_multiple_sheets(from_file) and
+            delimited.is_splittable_encoding(kwargs.get('encoding', 'utf-8'))
+        )
+
+    def __split_ranges(
+        self, from_file, to_file, sheet_name, workers, kwargs,
+        row_filter=None,
+    ):
+        """ Splits a delimited file into byte ranges for ``_apply_split``.
 
-    @property
-    def rules(self):
-        """ This list of applicable rules for the SandPaper instance.
+        .. note:: Files are applied serially (with a warning) if the rules,
+            the ``row_filter`` or the ``kwargs`` cannot be pickled for the
+            worker processes.
 
-        :getter: Returns the list of applicable rules for the instance
-        :rtype: list[tuple(callable, tuple(....,....), dict[str,....])]
+        :param str from_file: The input filepath
+        :param str to_file: The output filepath
+        :param str sheet_name: The name of the sheet to apply rules to
+        :param int workers: The number of worker processes
+        :param dict kwargs: Any named arguments, for the reading of the file
+        :param callable row_filter: The row filter sent to worker processes
+        :returns: The (``header_range``, ``ranges``) to apply to in parallel
+            or None if the file should be applied to serially
+        :rtype: tuple(tuple(int, int), list[tuple(int, int)])
         """
 
-        if not hasattr(self, '_rules'):
-            self._rules = []
-        return self._rules
+        if workers is None or workers <= 1 or \
+                not self.__is_splittable(
+                    from_file, to_file, sheet_name, kwargs
+                ):
+            return None
 
-    @property
-    def value_rules(self):
-        """ The set of value rules for the SandPaper instance.
+        split = delimited.split_records(from_file, workers * 4)
+        if split is None or len(split[-1]) <= 1:
+            return None
+        if not self.__is_picklable(row_filter, kwargs):
+            warnings.warn((
+                'rules or arguments of {from_file!r} cannot be pickled for '
+                'worker processes, applying serially'
+            ).format(**locals()))
+            return None
+        return split
 
-        :getter: Returns the set rules for the SandPaper instance
-        :rtype: set(callable)
+    def __is_picklable(self, *values):
+        """ Checks if values can be sent to worker processes.
+
+        :param list values: The values to send along with this instance
+        :returns: True if this instance and every value can be pickled
+        :rtype: bool
         """
 
-        if not hasattr(self, '_value_rules'):
-            self._value_rules = set()
-        return self._value_rules
+        try:
+            pickle.dumps((self,) + values, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # lambdas and local functions fail with varying exception types
+            return False
+        return True
 
-    @property
-    def record_rules(self):
-        """ The set of record rules for the SandPaper instance.
+    def _apply_range(
+        self, from_file, part_file, ranges,
+        header=None, row_filter=None, monitor_rules=False,
+        copy_records=True, engine='row', batch_size=1024, memoize=None,
+        collect_metrics=False, reader='stream',
+        **kwargs
+    ):
+        """ Applies rules to byte ranges of a delimited file.
 
-        :getter: Returns the set rules for the SandPaper instance
-        :rtype: set(callable)
+        .. note:: Only the data rows are written to the ``part_file``, the
+            header row is written once by ``_apply_split``.
+
+        :param str from_file: The input filepath
+        :param str part_file: The filepath to write the data rows to
+        :param list[tuple(int, int)] ranges: The header range and the record
+            range to apply to
+        :param list[str] header: The column names to write rows with
+            (defaults to the column names of the first normalized record)
+        :param callable row_filter: A callable which accepts a cleaned record
+            and returns True if the record should be written out
+        :param bool monitor_rules: Boolean flag that inidicates if the count of
+            applied rules should be monitored
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param str engine: The engine to apply rules with, either ``row`` or
+            ``columnar``
+        :param int batch_size: The number of records per ``columnar`` batch
+        :param int memoize: The maximum number of results of built-in value
+            rules to memoize per rule and column
+        :param bool collect_metrics: Boolean flag that indicates if a
+            performance report should be collected
+        :param str reader: The reader of the file, either ``stream`` or
+            ``mmap``
+        :param dict kwargs: Any named arguments, for the reading of the file
+        :returns: The ``header`` the rows were written with (None if no rows
+            were written), the rule ``stats`` and the ``report`` (None if
+            ``collect_metrics`` is false)
+        :rtype: dict[str,....]
         """
 
-        if not hasattr(self, '_record_rules'):
-            self._record_rules = set()
-        return self._record_rules
+        self.__rule_stats = {}
+        report = (
+            reporting.ApplyReport(
+                rule.__name__ for (rule, _, _,) in self.rules
+            )
+            if collect_metrics else
+            None
+        )
+        try:
+            records = self._apply_rules(
+                from_file,
+                row_filter=row_filter, monitor_rules=monitor_rules,
+                copy_records=copy_records, engine=engine,
+                batch_size=batch_size, memoize=memoize, report=report,
+                ranges=ranges, reader=reader,
+                **kwargs
+            )
+            with open(part_file, 'w', newline='', encoding='utf-8') as fp:
+                write = functools.partial(
+                    delimited.write_records, fp,
+                    file_type=delimited.get_file_type(part_file),
+                    header=header, include_header=False
+                )
+                header = (
+                    report.write(write, records)
+                    if report is not None else
+                    write(records)
+                )
+            return {
+                'header': header,
+                'stats': self.__rule_stats,
+                'report': report,
+            }
+        finally:
+            self.__rule_stats = {}
 
-    def _filter_values(
-        self, record,
-        column_filter=None, value_filter=None, callable_filter=None,
+    def _apply_split(
+        self, from_file, to_file, ranges, workers,
+        report=None,
         **kwargs
     ):
-        """ Yield only allowed (column, value) pairs using supported filters.
-
-        :param collections.OrderedDict record: An ordered dictionary of
-            (``column_name``, ``row_value``) items
-        :param str column_filter: A matched regular expression for
-            ``column_name``
-        :param str value_filter: A matched regular expression for ``row_value``
-        :param callable callable_filter: An truthy evaluated callable
-        :param dict kwargs: Any named arguments, for the kwargs of
-            ``callable_filter``
-        :returns: A generator yielding allowed (column, value) pairs
-        """
+        """ Applies rules to byte ranges of a delimited file in parallel.
 
-        for (column, value) in record.items():
+        .. note:: Ranges are applied by a pool of ``workers`` processes and
+            their rows are concatenated in order. Ranges whose first
+            normalized record has different column names than the first
+            normalized record of the file are reapplied in this process with
+            the file's column names, so the output matches ``apply`` without
+            ``workers``.
 
-            if column_filter is not None:
-                if not column_filter.match(str(column)):
-                    continue
-            if value_filter is not None:
-                if not value_filter.match(str(value)):
-                    continue
-            if callable(callable_filter):
-                if not callable_filter(record, column, **kwargs):
-                    continue
+        .. note:: The metrics of each range are merged into the ``report``,
+            so its read, normalize, write and rule times are the total seconds
+            spent over all processes.
 
-            yield (column, value,)
+        :param str from_file: The input filepath
+        :param str to_file: The output filepath
+        :param tuple ranges: The (``header_range``, ``ranges``) from
+            ``delimited.split_records``
+        :param int workers: The number of worker processes
+        :param reporting.ApplyReport report: The report to merge the metrics
+            of each range into (defaults to not collecting metrics)
+        :param dict kwargs: Any named arguments, passed to ``_apply_range``
+        :returns: The merged rule statistics
+        :rtype: dict[str, int]
+        """
 
-    def _apply_rules(
-        self, from_file,
-        sheet_name=None, row_filter=None, monitor_rules=False,
+        (header_range, ranges,) = ranges
+        kwargs['collect_metrics'] = report is not None
+        (directory, extension,) = (
+            os.path.dirname(os.path.abspath(to_file)),
+            os.path.splitext(to_file)[-1],
+        )
+        part_files = []
+        try:
+            for _ in range(len(ranges)):
+                (handle, part_file,) = tempfile.mkstemp(
+                    suffix=extension, dir=directory
+                )
+                os.close(handle)
+                part_files.append(part_file)
+
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._apply_range,
+                        from_file, part_file, [header_range, record_range],
+                        **kwargs
+                    )
+                    for (part_file, record_range,) in zip(part_files, ranges)
+                ]
+                results = [future.result() for future in futures]
+
+            header = next((
+                result['header']
+                for result in results
+                if result['header'] is not None
+            ), None)
+            stats = {}
+            for (part_file, record_range, result,) in zip(
+                part_files, ranges, results
+            ):
+                if result['header'] not in (None, header,):
+                    result = self._apply_range(
+                        from_file, part_file, [header_range, record_range],
+                        header=header,
+                        **kwargs
+                    )
+                for (rule_name, count,) in result['stats'].items():
+                    stats[rule_name] = stats.get(rule_name, 0) + count
+                if report is not None:
+                    report.merge(result['report'])
+
+            with open(to_file, 'w', newline='', encoding='utf-8') as to_fp:
+                if header is not None:
+                    delimited.write_rows(
+                        to_fp, [header],
+                        file_type=delimited.get_file_type(to_file)
+                    )
+            with open(to_file, 'ab') as to_fp:
+                for part_file in part_files:
+                    with open(part_file, 'rb') as part_fp:
+                        shutil.copyfileobj(part_fp, to_fp)
+            return stats
+        finally:
+            for part_file in part_files:
+                if os.path.isfile(part_file):
+                    os.remove(part_file)
+
+    def _apply_checkpointed(
+        self, from_file, to_file, checkpoint_path,
+        checkpoint_size=None, row_filter=None, monitor_rules=False,
+        copy_records=True, engine='row', batch_size=1024, memoize=None,
+        report=None, reader='stream',
         **kwargs
     ):
-        """ Base rule application method.
+        """ Applies rules to a delimited file, checkpointing the progress.
+
+        .. note:: The input file is applied in byte ranges of about
+            ``checkpoint_size`` bytes split at record boundaries. Once the
+            rows of a range are flushed to ``to_file``, the end offset of the
+            range, the size of ``to_file``, the number of rows written and the
+            rule statistics are saved to ``checkpoint_path`` along with the
+            ``uid`` of the instance and the size and modification time of the
+            input file. Applying again with an existing checkpoint truncates
+            ``to_file`` to its checkpointed size and continues from the
+            checkpointed offset. The checkpoint is removed once the whole file
+            has been applied.
 
-        :param str from_file: The file to apply rules to
-        :param str sheet_name: The name of the sheet to apply rules to
+        :param str from_file: The input filepath
+        :param str to_file: The output filepath
+        :param str checkpoint_path: The filepath to save checkpoints to
+        :param int checkpoint_size: The number of input bytes to apply between
+            checkpoints (defaults to ``checkpoints.CHECKPOINT_SIZE``)
         :param callable row_filter: A callable which accepts a cleaned record
             and returns True if the record should be written out
+        :param bool monitor_rules: Ignored, applied rules are always counted
+            so the checkpointed statistics are complete
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param str engine: The engine to apply rules with, either ``row`` or
+            ``columnar``
+        :param int batch_size: The number of records per ``columnar`` batch
+        :param int memoize: The maximum number of results of built-in value
+            rules to memoize per rule and column
+        :param reporting.ApplyReport report: The report to collect the metrics
+            of this application in (defaults to not collecting metrics)
+        :param str reader: The reader of the file, either ``stream`` or
+            ``mmap``
         :param dict kwargs: Any named arguments, for the reading of the file
-        :returns: Yields normalized records
+        :returns: The rule statistics (including the checkpointed statistics)
+            or None if the file cannot be split at record boundaries
+        :rtype: dict[str, int]
         """
 
-        if not callable(row_filter):
-            row_filter = self.__row_filter
+        if checkpoint_size is None:
+            checkpoint_size = checkpoints.CHECKPOINT_SIZE
+        split = delimited.split_records(
+            from_file,
+            (os.path.getsize(from_file) // checkpoint_size) + 1,
+            minimum_size=checkpoint_size
+        )
+        if split is None:
+            return None
 
-        for record in pyexcel.iget_records(
-            file_name=from_file,
-            sheet_name=sheet_name,
-            **kwargs
-        ):
-            if row_filter(record, normalized=False):
-                # start application of all registered rules
-                for (rule, rule_args, rule_kwargs,) in self.rules:
-                    if monitor_rules and rule.__name__ not in \
-                            self.__rule_stats:
-                        self.__rule_stats[rule.__name__] = 0
-                    if rule in self.value_rules:
-                        # value rules are  required to pass filtering
-                        for (column, value,) in self._filter_values(
-                            record, **rule_kwargs
-                        ):
-                            # handle application of value rule
-                            record[column] = rule(
-                                self, record.copy(), column,
-                                *rule_args, **rule_kwargs
-                            )
-                            if monitor_rules:
-                                self.__rule_stats[rule.__name__] += 1
-                    else:
-                        # handle application of record rule
-                        record = rule(
-                            self, record.copy(),
-                            *rule_args, **rule_kwargs
-                        )
-                        if monitor_rules:
-                            self.__rule_stats[rule.__name__] += 1
+        (header_range, ranges,) = split
+        expected = {
+            'version': checkpoints.VERSION,
+            'uid': self.uid,
+            'input': checkpoints.fingerprint(from_file),
+            'output': os.path.abspath(to_file),
+            'options': kwargs,
+        }
+        checkpoint = checkpoints.load(checkpoint_path)
+        if checkpoint is None:
+            checkpoint = dict(
+                expected,
+                input_offset=header_range[-1], output_offset=0,
+                rows_written=0, header=None, stats={}
+            )
+        else:
+            mismatched = checkpoints.mismatches(checkpoint, expected)
+            if len(mismatched) > 0:
+                raise ValueError((
+                    'cannot resume from checkpoint {checkpoint_path!r}, '
+                    'the {mismatched} changed since it was saved'
+                ).format(
+                    checkpoint_path=checkpoint_path,
+                    mismatched=', '.join(mismatched)
+                ))
+            elif not os.path.isfile(to_file) or \
+                    os.path.getsize(to_file) < checkpoint['output_offset']:
+                raise ValueError((
+                    'cannot resume from checkpoint {checkpoint_path!r}, '
+                    '{to_file!r} is missing rows written before it was saved'
+                ).format(**locals()))
+
+        header = (
+            checkpoints.decode_header(checkpoint['header'])
+            if checkpoint['header'] is not None else
+            None
+        )
+        for (rule_name, count,) in checkpoint['stats'].items():
+            self.__rule_stats[rule_name] = (
+                self.__rule_stats.get(rule_name, 0) + count
+            )
 
-                # row filtering done post record normalization
-                if row_filter(record, normalized=True):
-                    yield record
+        # rows written after the last checkpoint are written again
+        with open(to_file, 'ab') as fp:
+            fp.truncate(checkpoint['output_offset'])
 
-    def _apply_to(
-        self, from_file, to_file,
-        sheet_name=None, row_filter=None, monitor_rules=False,
+        written = [checkpoint['rows_written']]
+
+        def count(records):
+            for record in records:
+                written[0] += 1
+                yield record
+
+        file_type = delimited.get_file_type(to_file)
+        with open(to_file, 'a', newline='', encoding='utf-8') as fp:
+            for (start, end,) in ranges:
+                if end <= checkpoint['input_offset']:
+                    continue
+
+                # checkpoints always count rules so resumed totals match
+                records = self._apply_rules(
+                    from_file,
+                    row_filter=row_filter, monitor_rules=True,
+                    copy_records=copy_records, engine=engine,
+                    batch_size=batch_size, memoize=memoize, report=report,
+                    ranges=[
+                        header_range,
+                        (max(start, checkpoint['input_offset']), end,),
+                    ],
+                    reader=reader,
+                    **kwargs
+                )
+                write = functools.partial(
+                    delimited.write_records, fp,
+                    file_type=file_type, header=header,
+                    include_header=(header is None)
+                )
+                written_header = (
+                    report.write(write, count(records))
+                    if report is not None else
+                    write(count(records))
+                )
+                if written_header is not None:
+                    header = written_header
+
+                fp.flush()
+                os.fsync(fp.fileno())
+                checkpoint.update(
+                    input_offset=end,
+                    output_offset=os.fstat(fp.fileno()).st_size,
+                    rows_written=written[0],
+                    header=(
+                        checkpoints.encode_header(header)
+                        if header is not None else
+                        None
+                    ),
+                    stats=self.__rule_stats
+                )
+                checkpoints.save(checkpoint_path, checkpoint)
+
+        checkpoints.remove(checkpoint_path)
+        return self.__rule_stats
+
+    def _apply_sheets(
+        self, from_file, to_file, sheet_names,
+        workers=None, row_filter=None, monitor_rules=False,
+        copy_records=True, engine='row', batch_size=1024, memoize=None,
+        collect_metrics=False,
         **kwargs
     ):
-        """ Threadable rule processing method.
+        """ Applies rules to many sheets of a workbook at once.
 
-        .. important:: No overwrite protection is enabled for this method.
-            If the ``from_file`` is equal to the ``to_file``, then
-            ``from_file`` will be overwritten.
+        .. note:: The workbook is read once and every selected sheet is
+            applied to independently, by a pool of ``workers`` processes if
+            ``workers`` is greater than 1. The normalized sheets are written
+            to ``to_file`` as a single workbook in the order they were
+            selected in (``.csv`` and ``.tsv`` files are written as one
+            ``{name}__{sheet}__{index}`` file per sheet, like pyexcel does).
 
         :param str from_file: The input filepath
         :param str to_file: The output filepath
-        :param str sheet_name: The name of the sheet to apply rules to
+        :param sheet_names: The names of the sheets to apply rules to or
+            ``ALL`` to apply to every sheet
+        :type sheet_names: str or list[str]
+        :param int workers: The number of worker processes to apply sheets in
         :param callable row_filter: A callable which accepts a cleaned record
             and returns True if the record should be written out
         :param bool monitor_rules: Boolean flag that inidicates if the count of
             applied rules should be monitored
-        :param dict kwargs: Any named arguments, passed to ``_apply_rules``
-        :returns: The rule statistics if ``monitor_rules`` is true
-        :rtype: dict[str, int]
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param str engine: The engine to apply rules with, either ``row`` or
+            ``columnar``
+        :param int batch_size: The number of records per ``columnar`` batch
+        :param int memoize: The maximum number of results of built-in value
+            rules to memoize per rule and column
+        :param bool collect_metrics: Boolean flag that indicates if a
+            performance report should be collected per sheet
+        :param dict kwargs: Any named arguments, for the reading of the file
+        :returns: A dictionary keyed by sheet name of the performance reports
+            if ``collect_metrics`` is true, otherwise of the rule statistics if
+            ``monitor_rules`` is true
+        :rtype: collections.OrderedDict[str, dict[str,....]]
+        """
+
+        book = pyexcel.get_book_dict(file_name=from_file, **kwargs)
+        if sheet_names == ALL:
+            sheet_names = list(book.keys())
+        missing = [name for name in sheet_names if name not in book]
+        if len(missing) > 0:
+            raise ValueError((
+                'sheets {missing!r} do not exist in {from_file!r}'
+            ).format(**locals()))
+
+        apply_kwargs = dict(
+            row_filter=row_filter, monitor_rules=monitor_rules,
+            copy_records=copy_records, engine=engine, batch_size=batch_size,
+            memoize=memoize, collect_metrics=collect_metrics
+        )
+        parallel = (
+            workers is not None and workers > 1 and len(sheet_names) > 1
+        )
+        if parallel and not self.__is_picklable(apply_kwargs):
+            warnings.warn((
+                'rules or arguments of {from_file!r} cannot be pickled for '
+                'worker processes, applying serially'
+            ).format(**locals()))
+            parallel = False
+        if not parallel:
+            results = [
+                self._apply_sheet(book[name], **apply_kwargs)
+                for name in sheet_names
+            ]
+        else:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._apply_sheet, book[name], **apply_kwargs
+                    )
+                    for name in sheet_names
+                ]
+                results = [future.result() for future in futures]
+
+        pyexcel.save_book_as(
+            bookdict=collections.OrderedDict(
+                (name, result['rows'],)
+                for (name, result,) in zip(sheet_names, results)
+            ),
+            dest_file_name=to_file,
+            dest_lineterminator=os.linesep
+        )
+        if collect_metrics or monitor_rules:
+            return collections.OrderedDict(
+                (name, result['result'],)
+                for (name, result,) in zip(sheet_names, results)
+            )
+
+    def _apply_sheet(
+        self, rows,
+        row_filter=None, monitor_rules=False, copy_records=True,
+        engine='row', batch_size=1024, memoize=None, collect_metrics=False,
+    ):
+        """ Applies rules to the rows of a single sheet for ``_apply_sheets``.
+
+        :param list rows: The rows of the sheet, starting with its header
+        :param callable row_filter: A callable which accepts a cleaned record
+            and returns True if the record should be written out
+        :param bool monitor_rules: Boolean flag that inidicates if the count of
+            applied rules should be monitored
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param str engine: The engine to apply rules with, either ``row`` or
+            ``columnar``
+        :param int batch_size: The number of records per ``columnar`` batch
+        :param int memoize: The maximum number of results of built-in value
+            rules to memoize per rule and column
+        :param bool collect_metrics: Boolean flag that indicates if a
+            performance report should be collected
+        :returns: The normalized ``rows`` (starting with their header) and the
+            ``result`` of the sheet, the performance report if
+            ``collect_metrics`` is true, otherwise the rule statistics if
+            ``monitor_rules`` is true
+        :rtype: dict[str,....]
         """
 
+        self.__rule_stats = {}
+        (report, started,) = (
+            (
+                reporting.ApplyReport(
+                    rule.__name__ for (rule, _, _,) in self.rules
+                )
+                if collect_metrics else
+                None
+            ),
+            reporting.clock(),
+        )
         try:
-            pyexcel.isave_as(
-                records=self._apply_rules(
-                    from_file,
-                    sheet_name=sheet_name, row_filter=row_filter,
-                    monitor_rules=monitor_rules,
-                    **kwargs
-                ),
-                dest_file_name=to_file,
-                dest_lineterminator=os.linesep,
+            records = self._apply_rules(
+                None,
+                row_filter=row_filter, monitor_rules=monitor_rules,
+                copy_records=copy_records, engine=engine,
+                batch_size=batch_size, memoize=memoize, report=report,
+                array=rows
             )
-            if monitor_rules:
-                return self.__rule_stats
+
+            def write(records):
+                records = iter(records)
+                first = next(records, None)
+                if first is None:
+                    return []
+                # pyexcel only keeps the column order of ordered dictionaries
+                return pyexcel.get_array(
+                    records=itertools.chain([first], records),
+                    custom_headers=(
+                        list(first.keys())
+                        if is_ordered(first) else
+                        sorted(first.keys())
+                    )
+                )
+
+            rows = (
+                report.write(write, records)
+                if report is not None else
+                write(records)
+            )
+            result = (dict(self.__rule_stats) if monitor_rules else None)
+            if report is not None:
+                report.elapsed = (reporting.clock() - started)
+                (result, stats,) = (report.to_dict(), result,)
+                if monitor_rules:
+                    result['stats'] = stats
+            return {'rows': rows, 'result': result}
         finally:
             self.__rule_stats = {}
 
@@ -590,7 +2516,7 @@ class SandPaper(object):
     @value_rule
     def replace(
         self, record, column,
-        replacements,
+        replacements, mode='sequential',
         **kwargs
     ):
         """ Applies a replacements dictionary to a value.
@@ -603,18 +2529,48 @@ class SandPaper(object):
                 'this_is_going_to_be_replaced': 'with_this',
             })
 
+        .. note:: During ``apply`` the replacements are compiled once into a
+            multi-pattern automaton which finds the occurrences of every
+            replacement in a single scan of the value. The ``mode`` decides
+            how the occurrences are replaced:
+
+            - ``sequential`` (the default) applies each replacement in order
+              to the result of the previous one (just like calling
+              ``str.replace`` for each), so replaced text can be replaced
+              again by later replacements.
+            - ``leftmost_longest`` rewrites the value in one left to right
+              pass, replacing the longest replacement starting at each
+              position and never replacing text again. Empty replacements are
+              ignored.
+
+            For example ``{'ab': 'x', 'abc': 'y', 'b': 'ab'}`` turns
+            ``'abc'`` into ``'xc'`` sequentially but into ``'y'`` with
+            ``leftmost_longest``.
 
         :param collections.OrderedDict record: A record whose value within
             ``column`` should be normalized and returned
         :param str column: A column that indicates what value to normalize
         :param replacements: A dictionary of replacements for the value
         :type replacements: dict[str, str]
+        :param str mode: Either ``sequential`` or ``leftmost_longest``
         :param dict kwargs: Any named arguments
         :returns: The value with all replacements made
         """
 
+        assert mode in self.__available_replace_modes, (
+            "replace mode {mode!r} is not one of "
+            "{self._SandPaper__available_replace_modes!r}"
+        ).format(**locals())
+
         value = record[column]
         if isinstance(value, six.string_types):
+            if isinstance(replacements, matchers.Replacements):
+                return getattr(replacements, mode)(value)
+            elif mode != 'sequential':
+                return getattr(matchers.Replacements(replacements), mode)(
+                    value
+                )
+
             for (from_text, to_text,) in replacements.items():
                 value = value.replace(from_text, to_text)
         return value
@@ -644,6 +2600,11 @@ class SandPaper(object):
             passed as ``*args`` and ``**kwargs`` to the format method of the
             returned ``to_format`` string.
 
+        .. note:: During ``apply`` the translations are compiled once into
+            :class:`~sandpaper.matchers.TextTranslations` so each value is
+            only matched against a combined pattern of the translations it
+            could match, rather than against every translation in turn.
+
         :param collections.OrderedDict record: A record whose value within
             ``column`` should be normalized and returned
         :param str column: A column that indicates what value to normalize
@@ -654,23 +2615,27 @@ class SandPaper(object):
         """
 
         value = record[column]
-
-        for (from_regex, to_format,) in translations.items():
-            match = regex.match(from_regex, str(value))
-            if match is not None:
-                # NOTE: Would prefer to use PEP448, but have to do this for PY2
-                named_groups = kwargs.copy()
-                named_groups.update(match.groupdict())
-
-                value = to_format.format(
-                    *[
-                        (capture if capture is not None else '')
-                        for capture in match.groups()
-                    ], **{
-                        name: (capture if capture is not None else '')
-                        for (name, capture) in named_groups.items()
-                    }
-                )
+        if not isinstance(translations, matchers.TextTranslations):
+            translations = matchers.TextTranslations(translations)
+
+        # translations still apply in order, each to the previous result
+        found = translations.match(str(value))
+        while found is not None:
+            (index, to_format, match,) = found
+            # NOTE: Would prefer to use PEP448, but have to do this for PY2
+            named_groups = kwargs.copy()
+            named_groups.update(match.groupdict())
+
+            value = to_format.format(
+                *[
+                    (capture if capture is not None else '')
+                    for capture in match.groups()
+                ], **{
+                    name: (capture if capture is not None else '')
+                    for (name, capture) in named_groups.items()
+                }
+            )
+            found = translations.match(str(value), start=(index + 1))
 
         return value
 
@@ -697,6 +2662,12 @@ class SandPaper(object):
         date formats in columns ending with ``_date`` to the date format
         ``%Y``.
 
+        .. note:: During ``apply`` the translations are compiled once into
+            :class:`~sandpaper.matchers.DateTranslations` which remembers the
+            date format last used for each column and memoizes translated
+            values. The first date format (in order) that parses a value is
+            still the one used to translate it.
+
         :param collections.OrderedDict record: A record whose value within
             ``column`` should be normalized and returned
         :param str column: A column that indicates what value to normalize
@@ -714,14 +2685,9 @@ class SandPaper(object):
             # parameters implicitly passed, but it does...
             return value.strftime(list(translations.values())[0])
 
-        for (from_format, to_format,) in translations.items():
-            try:
-                return datetime.datetime.strptime(
-                    value, from_format
-                ).strftime(to_format)
-            except ValueError:
-                continue
-        return value
+        if not isinstance(translations, matchers.DateTranslations):
+            translations = matchers.DateTranslations(translations)
+        return translations.translate(value, column=column)
 
     @record_rule
     def add_columns(self, record, additions, **kwargs):
@@ -772,6 +2738,10 @@ class SandPaper(object):
         :returns: The record with a potential newly removed column
         """
 
+        source = self.__unwrap_record(record)
+        if isinstance(source, Record):
+            return source.derive(remove_header, removes)
+
         for name in removes:
             if name in record:
                 del record[name]
@@ -790,6 +2760,10 @@ class SandPaper(object):
         :returns: The record with a potential newly kept column
         """
 
+        source = self.__unwrap_record(record)
+        if isinstance(source, Record):
+            return source.derive(keep_header, keeps)
+
         try:
             new_record = record.copy()
             for column_name in record:
@@ -816,6 +2790,10 @@ class SandPaper(object):
         :returns: The record with the remapped column
         """
 
+        source = self.__unwrap_record(record)
+        if isinstance(source, Record):
+            return source.derive(rename_header, renames)
+
         # full OrderedDict rebuild required for column renaming
         return collections.OrderedDict([(
             (renames[key] if key in renames else key),
@@ -838,6 +2816,11 @@ class SandPaper(object):
         :param dict kwargs: Any named arguments
         :returns: The record with the columns reordered
         """
+
+        source = self.__unwrap_record(record)
+        if isinstance(source, Record):
+            return source.derive(order_header, order, bool(ignore_missing))
+
         ordered_record = collections.OrderedDict([
             (column_name, record[column_name],)
             for column_name in order
@@ -851,44 +2834,573 @@ class SandPaper(object):
 
         return ordered_record
 
+    def transform(
+        self, records,
+        row_filter=None, stats=None, copy_records=True, engine='row',
+        batch_size=1024, memoize=None, in_place=False,
+    ):
+        """ Lazily applies a SandPaper instance rules to records in memory.
+
+        .. note:: Records are normalized as the returned generator is
+            iterated, so records can be read from any iterable (such as a
+            queue or a database cursor) of ordered mappings without writing
+            them to a file first::
+
+                for record in paper.transform(cursor, stats=stats):
+                    queue.put(record)
+
+        .. note:: By default the given mappings are never modified, each of
+            them is copied into a :class:`~sandpaper.records.Record` which is
+            normalized and yielded. When ``in_place`` is true, the given
+            mappings themselves are normalized and yielded instead (columns
+            changed by record rules are copied back into them), avoiding the
+            copy. Combined with ``copy_records=False``, no record is copied
+            by built-in rules at all. Mappings dropped by the ``row_filter``
+            after normalization are still modified.
+
+        .. note:: When ``stats`` is given, the count of applied rules is
+            added to it as records are normalized. Rules receive a shallow
+            copy of the instance keeping these statistics, so applications
+            and other transforms of the same instance are not affected.
+
+        :param records: An iterable of ordered mappings of (``column_name``,
+            ``row_value``) items
+        :param callable row_filter: A callable which accepts a record and
+            returns True if the record should be yielded
+        :param dict stats: A dictionary to count applied rules in
+            (defaults to not monitoring rules)
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param str engine: The engine to apply rules with, either ``row`` or
+            ``columnar``
+        :param int batch_size: The number of records per ``columnar`` batch
+        :param int memoize: The maximum number of results of built-in value
+            rules to memoize per rule and column (defaults to no memoization)
+        :param bool in_place: Boolean flag that indicates if the given
+            mappings should be normalized in place rather than copied
+        :returns: A generator yielding normalized records
+        """
+
+        assert engine in self.__available_engines, (
+            'engine expected one of {self._SandPaper__available_engines}, '
+            'received "{engine}"'
+        ).format(**locals())
+        assert batch_size > 0, (
+            'batch_size expected a positive integer, received "{batch_size}"'
+        ).format(**locals())
+        assert memoize is None or memoize > 0, (
+            'memoize expected a positive integer, received "{memoize}"'
+        ).format(**locals())
+
+        job = copy.copy(self)
+        job.__rule_stats = ({} if stats is None else stats)
+        return job.__transform(
+            records,
+            row_filter=(row_filter if callable(row_filter) else None),
+            monitor_rules=(stats is not None), copy_records=copy_records,
+            engine=engine, batch_size=batch_size, memoize=memoize,
+            in_place=in_place
+        )
+
+    def __transform(
+        self, records,
+        row_filter=None, monitor_rules=False, copy_records=True,
+        engine='row', batch_size=1024, memoize=None, in_place=False,
+    ):
+        """ Applies rules to records in memory for ``transform``.
+
+        :param records: An iterable of ordered mappings
+        :param callable row_filter: A callable which accepts a record and
+            returns True if the record should be yielded
+        :param bool monitor_rules: Boolean flag that inidicates if the count of
+            applied rules should be monitored
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param str engine: The engine to apply rules with, either ``row`` or
+            ``columnar``
+        :param int batch_size: The number of records per ``columnar`` batch
+        :param int memoize: The maximum number of results of built-in value
+            rules to memoize per rule and column
+        :param bool in_place: Boolean flag that indicates if the given
+            mappings should be normalized in place rather than copied
+        :returns: Yields normalized records
+        """
+
+        plan = self._compile_rules(memoize=memoize)
+        # rule arguments may have changed since headers were last derived
+        expire_derived()
+        for record in self.__normalize_records(
+            (records if in_place else from_mappings(records)), plan,
+            (self.__row_filter if row_filter is None else row_filter),
+            monitor_rules=monitor_rules, copy_records=copy_records,
+            engine=engine, batch_size=batch_size, in_place=in_place
+        ):
+            yield record
+
     def apply(
         self, from_file, to_file,
         sheet_name=None, row_filter=None, monitor_rules=False,
+        copy_records=True, engine='row', batch_size=1024, memoize=None,
+        workers=None, collect_metrics=False, checkpoint_path=None,
+        checkpoint_size=None, cache_dir=None, reader='stream', pipeline=None,
+        stream_xlsx=False,
         **kwargs
     ):
         """ Applies a SandPaper instance rules to a given glob of files.
 
+        .. note:: By default every rule receives a full copy of the record it
+            is applied to. When ``copy_records`` is False, rules instead
+            receive a :class:`CopyOnWriteRecord` which only copies the record
+            if the rule mutates it (none of the built-in value rules do).
+
+        .. note:: Records are :class:`~sandpaper.records.Record` mappings which
+            store a list of values and share an interned header of column
+            names. ``rename_columns``, ``order_columns``, ``keep_columns`` and
+            ``remove_columns`` compute their new header once per header and
+            only rearrange the values of each record.
+
+        .. note:: The ``columnar`` engine reads records in batches of
+            ``batch_size``, pivots them into columns and applies built-in
+            rules to whole columns at once. Row filters are applied to a full
+            batch before it is normalized.
+
+        .. note:: When ``memoize`` is given, the results of built-in value
+            rules are memoized per rule and column in least recently used
+            caches of up to ``memoize`` values (built-in rules are pure
+            functions of the value). Rules applied to whole columns by the
+            ``columnar`` engine are not memoized. The rule statistics include
+            ``{rule}.memo_hits`` and ``{rule}.memo_misses`` counts.
+
+        .. note:: ``.csv`` and ``.tsv`` files are read and written with the
+            ``csv`` module instead of pyexcel unless reader arguments other
+            than the type detection ones are given.
+
+        .. note:: When ``workers`` is greater than 1 and both files are
+            ``.csv`` or ``.tsv`` files, the input file is split into byte
+            ranges at record boundaries which are applied by a pool of
+            ``workers`` processes. Files that are too small, use quotes that
+            do not follow RFC 4180, use an encoding other than UTF-8 or
+            receive reader arguments other than the type detection ones are
+            applied serially. The SandPaper instance and ``row_filter`` are
+            pickled for the worker processes, so rules given lambdas or local
+            functions (such as a ``callable_filter``) and such a
+            ``row_filter`` are applied serially with a warning.
+
+        .. note:: Built-in value rules skip columns that later rules remove
+            (through ``keep_columns``, ``remove_columns`` or ``order_columns``
+            with ``ignore_missing``) without reading them first, so rule
+            statistics only count the columns that are kept. Unless a
+            ``row_filter`` is given, ``.csv`` and ``.tsv`` files are read
+            without the cells of columns no rule needs. Custom rules and
+            callables (such as ``add_columns`` callables or a
+            ``callable_filter``) may read any column, so columns before them
+            are always kept.
+
+        .. note:: When ``collect_metrics`` is true, a performance report of
+            this application is returned instead of the rule statistics (which
+            are included as ``stats`` if ``monitor_rules`` is also true). The
+            report counts the rows read, written and dropped by ``row_filter``
+            before and after normalization, the seconds spent reading,
+            normalizing and writing and the count, cumulative and mean
+            seconds of every rule and of every (rule, column) pair. Rules are
+            listed by their position, so repeated rules are never merged.
+
+        .. note:: When ``checkpoint_path`` is given, both files must be
+            ``.csv`` or ``.tsv`` files. The input file is applied serially in
+            byte ranges of about ``checkpoint_size`` bytes and a checkpoint of
+            the progress (the input offset, the output size, the number of
+            rows written, the rule statistics and the ``uid``) is saved to
+            ``checkpoint_path`` after each range is flushed. If the
+            application is interrupted, applying the same rules to the same
+            input file and output file again resumes from the checkpoint,
+            appending to the partial output. A ``ValueError`` is raised
+            instead if the rules, the input file (its size or modification
+            time), the output file or the reader arguments changed. The
+            checkpoint is removed once the application completes, and a
+            performance report only covers the resumed part. Callables (such
+            as ``row_filter``) cannot be compared, so resuming with different
+            callables is not detected.
+
+        .. note:: When ``cache_dir`` is given, the output file and the result
+            of the application are cached in ``cache_dir`` under a key built
+            from the content hash of the input file, the ``uid`` and the named
+            arguments of the application (other than the ones only affecting
+            performance). Applying again with the same key leaves an existing
+            ``to_file`` with the cached content as is, or copies the cached
+            output file to ``to_file``, and returns the cached result without
+            applying any rules. Applications given callables (such as a
+            ``row_filter``), applications of rules given callables (such as
+            a ``callable_filter``) and applications collecting metrics are
+            never cached.
+
+        .. note:: When ``reader`` is ``mmap``, ``.csv`` and ``.tsv`` files
+            read with the ``csv`` module are memory mapped instead of read
+            through a text stream. Records are scanned over the mapped bytes
+            and cells are only decoded when they are converted (cells of
+            columns no rule needs and cells repeating a memoized conversion
+            are never decoded). Byte ranges applied by ``workers`` or between
+            checkpoints are mapped the same way. Files in encodings other
+            than UTF-8 are read through a text stream.
+
+        .. note:: When ``sheet_name`` is ``ALL`` or a list of sheet names,
+            the workbook is read once and every selected sheet is normalized
+            independently (by a pool of ``workers`` processes if ``workers``
+            is greater than 1, with the same pickling restriction as for
+            delimited files). The normalized sheets are written to
+            ``to_file`` as a single workbook, or as one
+            ``{name}__{sheet}__{index}`` file per sheet for ``.csv`` and
+            ``.tsv`` files (the files pyexcel reads back as a workbook). The
+            rule statistics or performance reports are then returned per
+            sheet. Sheets are always read and written by pyexcel, so a
+            ``ValueError`` is raised if ``checkpoint_path``, ``pipeline``,
+            the ``mmap`` ``reader`` or ``stream_xlsx`` are also given.
+
+        .. note:: When ``pipeline`` is given, records are read, normalized
+            and written by three threads connected by queues of at most
+            ``pipeline`` batches of ``batch_size`` records, so reading and
+            writing (such as compressing ``.xlsx`` files) overlap with
+            normalizing while at most ``2 * pipeline`` batches are buffered.
+            Rules and row filters are still called in the applying thread.
+            The ``read_time`` and ``write_time`` of a performance report are
+            then the seconds this thread waited for the reading and writing
+            threads. Applications split over ``workers`` or checkpointed are
+            not pipelined.
+
+        .. note:: When ``stream_xlsx`` is true, ``.xlsx`` files are read and
+            written row by row (see ``workbooks``) rather than loaded into
+            memory by pyexcel, so memory stays flat as the number of rows
+            grows. The sheet XML is parsed incrementally from the workbook
+            and rows are written as they are normalized. Merged cells then
+            only have a value in their top left cell. Files read with pyexcel
+            arguments other than the type detection ones are still loaded by
+            pyexcel.
+
         :param str from_file: The path of the file to apply the rules to
         :param str to_file: The path of the file to write to
-        :param str sheet_name: The name of the sheet to apply rules to
-            (defaults to the first available sheet)
+        :param sheet_name: The name of the sheet to apply rules to, a list of
+            names of sheets or ``ALL`` to apply to every sheet (defaults to
+            the first available sheet)
+        :type sheet_name: str or list[str]
         :param callable row_filter: A callable which accepts a cleaned record
             and returns True if the record should be written out
         :param bool monitor_rules: Boolean flag that inidicates if the count of
             applied rules should be monitored
+        :param bool copy_records: Boolean flag that indicates if rules should
+            receive full copies of the record rather than copy-on-write
+            proxies
+        :param str engine: The engine to apply rules with, either ``row`` or
+            ``columnar``
+        :param int batch_size: The number of records per ``columnar`` batch
+        :param int memoize: The maximum number of results of built-in value
+            rules to memoize per rule and column (defaults to no memoization)
+        :param int workers: The number of worker processes to split
+            delimited files over (defaults to applying serially)
+        :param bool collect_metrics: Boolean flag that indicates if a
+            performance report should be returned
+        :param str checkpoint_path: The path of the file to save checkpoints
+            to and resume from (defaults to not checkpointing)
+        :param int checkpoint_size: The number of input bytes to apply between
+            checkpoints (defaults to ``checkpoints.CHECKPOINT_SIZE``)
+        :param str cache_dir: The path of the directory to cache outputs in
+            (defaults to not caching outputs)
+        :param str reader: The reader of ``.csv`` and ``.tsv`` files, either
+            ``stream`` or ``mmap``
+        :param int pipeline: The number of batches of ``batch_size`` records
+            queued between the reading, normalizing and writing threads
+            (defaults to applying in a single thread)
+        :param bool stream_xlsx: Boolean flag that indicates if ``.xlsx``
+            files should be read and written row by row in constant memory
         :param dict kwargs: Any additional named arguments
             (applied to the pyexcel ``iget_records`` method)
-        :returns: The rule statistics if ``monitor_rules`` is true
-        :rtype: dict[str, int]
+        :returns: The performance report if ``collect_metrics`` is true,
+            otherwise the rule statistics if ``monitor_rules`` is true (keyed
+            by sheet name if many sheets are selected)
+        :rtype: dict[str,....]
         """
 
-        # precompile filter regexes (kinda speeds up the processing)
-        for (rule, rule_args, rule_kwargs,) in self.rules:
-            for (key, value,) in rule_kwargs.items():
-                if key in self.__available_filters and \
-                        isinstance(value, six.string_types):
-                    rule_kwargs[key] = regex.compile(value)
+        assert engine in self.__available_engines, (
+            'engine expected one of {self._SandPaper__available_engines}, '
+            'received "{engine}"'
+        ).format(**locals())
+        assert batch_size > 0, (
+            'batch_size expected a positive integer, received "{batch_size}"'
+        ).format(**locals())
+        assert memoize is None or memoize > 0, (
+            'memoize expected a positive integer, received "{memoize}"'
+        ).format(**locals())
+        assert not isinstance(sheet_name, (list, tuple,)) or (
+            len(sheet_name) > 0 and len(set(sheet_name)) == len(sheet_name)
+        ), (
+            'sheet_name expected a list of unique sheet names, received '
+            '"{sheet_name}"'
+        ).format(**locals())
+        assert checkpoint_size is None or checkpoint_size > 0, (
+            'checkpoint_size expected a positive integer, received '
+            '"{checkpoint_size}"'
+        ).format(**locals())
+        assert reader in self.__available_readers, (
+            'reader expected one of {self._SandPaper__available_readers}, '
+            'received "{reader}"'
+        ).format(**locals())
+        assert pipeline is None or pipeline > 0, (
+            'pipeline expected a positive integer, received "{pipeline}"'
+        ).format(**locals())
+        if sheet_name == ALL or isinstance(sheet_name, (list, tuple,)):
+            unsupported = [
+                name
+                for (name, given,) in (
+                    ('checkpoint_path', checkpoint_path is not None,),
+                    ('pipeline', pipeline is not None,),
+                    ('reader', reader != 'stream',),
+                    ('stream_xlsx', stream_xlsx,),
+                )
+                if given
+            ]
+            if len(unsupported) > 0:
+                raise ValueError((
+                    '{unsupported!r} cannot be applied to many sheets, '
+                    'received sheet_name "{sheet_name}"'
+                ).format(**locals()))
+
+        kwargs = dict(self.__default_apply, **kwargs)
+
+        cache_key = None
+        if cache_dir is not None and not collect_metrics and \
+                os.path.isfile(from_file):
+            cache_key = manifest.build_key(
+                manifest.hash_file(from_file), self.uid,
+                os.path.splitext(to_file)[-1],
+                dict(
+                    sheet_name=sheet_name, row_filter=row_filter,
+                    monitor_rules=monitor_rules, stream_xlsx=stream_xlsx,
+                    **kwargs
+                ),
+                rule_arguments=[
+                    (rule_args, rule_kwargs,)
+                    for (_, rule_args, rule_kwargs,) in self.rules
+                ]
+            )
+            if cache_key is not None:
+                (restored, result,) = manifest.restore(
+                    cache_dir, cache_key, to_file
+                )
+                if restored:
+                    return result
 
         try:
-            return self._apply_to(
+            result = self._apply_to(
                 from_file, to_file,
                 sheet_name=sheet_name, row_filter=row_filter,
-                monitor_rules=monitor_rules,
-                **dict(self.__default_apply, **kwargs)
+                monitor_rules=monitor_rules, copy_records=copy_records,
+                engine=engine, batch_size=batch_size, memoize=memoize,
+                workers=workers, collect_metrics=collect_metrics,
+                checkpoint_path=checkpoint_path,
+                checkpoint_size=checkpoint_size, reader=reader,
+                pipeline=pipeline, stream_xlsx=stream_xlsx,
+                **kwargs
             )
         finally:
             pyexcel.free_resources()
 
+        if cache_key is not None:
+            manifest.store(cache_dir, cache_key, to_file, result)
+        return result
+
+    def _schedule_files(self, pattern_or_paths, output_dir):
+        """ Gathers and schedules the files of a batch of applications.
+
+        .. note:: Files are scheduled largest first so that workers stay busy
+            until the end. The ``output_dir`` is created if it is missing.
+
+        :param pattern_or_paths: A glob pattern or a list of glob patterns and
+            paths of the files to apply the rules to
+        :type pattern_or_paths: str or list[str]
+        :param str output_dir: The path of the directory to write to
+        :returns: A tuple of (``results``, ``scheduled``) where ``results`` is
+            a dictionary of the ``to_file`` and input ``size`` keyed by input
+            path and ``scheduled`` the input paths in the order to apply them
+        :rtype: tuple(collections.OrderedDict[str, dict[str,....]], list[str])
+        """
+
+        if isinstance(pattern_or_paths, six.string_types):
+            pattern_or_paths = [pattern_or_paths]
+
+        results = collections.OrderedDict()
+        for pattern in pattern_or_paths:
+            for from_file in (sorted(glob.glob(pattern)) or [pattern]):
+                results[from_file] = {
+                    'to_file': os.path.join(
+                        output_dir, os.path.basename(from_file)
+                    ),
+                    'size': (
+                        os.path.getsize(from_file)
+                        if os.path.isfile(from_file) else
+                        0
+                    ),
+                }
+
+        to_files = [result['to_file'] for result in results.values()]
+        assert len(set(to_files)) == len(to_files), (
+            'pattern_or_paths expected files with unique names, received '
+            '"{pattern_or_paths}"'
+        ).format(**locals())
+        if not os.path.isdir(output_dir):
+            os.makedirs(output_dir)
+
+        # schedule largest files first to avoid a long tail of big files
+        scheduled = sorted(
+            results.keys(),
+            key=(lambda from_file: results[from_file]['size']),
+            reverse=True
+        )
+        return (results, scheduled,)
+
+    def apply_many(
+        self, pattern_or_paths, output_dir,
+        workers=None,
+        **kwargs
+    ):
+        """ Applies a SandPaper instance rules to many files in parallel.
+
+        .. note:: Files are fanned out over a pool of ``workers`` processes,
+            largest files first so that workers stay busy until the end.
+            Normalized files are written to ``output_dir`` under the same
+            file name as their input file.
+
+        .. important:: The SandPaper instance and ``kwargs`` are pickled for
+            the worker processes. Use ``workers=1`` to apply in the current
+            process if any callables (filters, additions, ``row_filter``) are
+            not picklable.
+
+        :param pattern_or_paths: A glob pattern or a list of glob patterns and
+            paths of the files to apply the rules to
+        :type pattern_or_paths: str or list[str]
+        :param str output_dir: The path of the directory to write to
+        :param int workers: The number of worker processes
+            (defaults to the number of available processors)
+        :param dict kwargs: Any named arguments, passed to ``apply``
+        :returns: A dictionary of results keyed by input path, each containing
+            the ``to_file``, input ``size``, ``elapsed`` seconds, ``stats``
+            returned by ``apply``, and the ``error`` and ``traceback`` if
+            applying to the file failed
+        :rtype: collections.OrderedDict[str, dict[str,....]]
+        """
+
+        (results, scheduled,) = self._schedule_files(
+            pattern_or_paths, output_dir
+        )
+        if workers == 1:
+            for from_file in scheduled:
+                results[from_file].update(_apply_file(
+                    self, from_file, results[from_file]['to_file'], kwargs
+                ))
+            return results
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers
+        ) as executor:
+            futures = dict((
+                executor.submit(
+                    _apply_file,
+                    self, from_file, results[from_file]['to_file'], kwargs
+                ),
+                from_file,
+            ) for from_file in scheduled)
+            for future in concurrent.futures.as_completed(futures):
+                result = results[futures[future]]
+                try:
+                    result.update(future.result())
+                except Exception as exc:
+                    # failures to transport the job or its result
+                    result.update({
+                        'stats': None,
+                        'elapsed': None,
+                        'error': exc,
+                        'traceback': traceback.format_exc(),
+                    })
+
+        return results
+
+    def apply_async(self, from_file, to_file, executor=None, **kwargs):
+        """ Applies a SandPaper instance rules to a file in an executor.
+
+        .. note:: Requires Python 3.5+. The application runs in ``executor``
+            (a thread or process pool executor) and the returned coroutine
+            awaits its result, so it can be awaited by asyncio tasks::
+
+                stats = await paper.apply_async(
+                    from_file, to_file, monitor_rules=True
+                )
+
+        .. note:: Cancelling the awaiting task cancels the application. In the
+            current process (thread pool executors), a running application
+            stops before its next record, leaving a partial ``to_file``
+            behind. Applications already running in a process pool executor
+            cannot be cancelled.
+
+        :param str from_file: The path of the file to apply the rules to
+        :param str to_file: The path of the file to write to
+        :param concurrent.futures.Executor executor: The executor to apply in
+            (defaults to the event loop's default executor)
+        :param dict kwargs: Any named arguments, passed to ``apply``
+        :returns: A coroutine returning the result of ``apply``
+        :rtype: collections.abc.Coroutine
+        """
+
+        from . import asynchronous
+        return asynchronous.apply(
+            self, from_file, to_file, executor=executor, **kwargs
+        )
+
+    def apply_many_async(
+        self, pattern_or_paths, output_dir,
+        concurrency=None, executor=None, progress=None,
+        **kwargs
+    ):
+        """ Applies a SandPaper instance rules to many files in an executor.
+
+        .. note:: Requires Python 3.5+. Files are scheduled largest first,
+            but at most ``concurrency`` of them are submitted to ``executor``
+            at once, so cancelling the awaiting task drops the files not
+            submitted yet and cancels the running ones (see
+            ``apply_async``). Errors are returned per file like
+            ``apply_many``.
+
+        .. note:: ``progress`` is called in the event loop as each file
+            completes, with the input path, its result, the number of
+            completed files and the total number of files. If it returns an
+            awaitable, the awaitable is awaited.
+
+        :param pattern_or_paths: A glob pattern or a list of glob patterns and
+            paths of the files to apply the rules to
+        :type pattern_or_paths: str or list[str]
+        :param str output_dir: The path of the directory to write to
+        :param int concurrency: The maximum number of files applied at once
+            (defaults to the number of available processors)
+        :param concurrent.futures.Executor executor: The executor to apply in
+            (defaults to the event loop's default executor)
+        :param callable progress: A callable receiving the progress of each
+            completed file
+        :param dict kwargs: Any named arguments, passed to ``apply``
+        :returns: A coroutine returning a dictionary of results keyed by input
+            path, as returned by ``apply_many``
+        :rtype: collections.abc.Coroutine
+        """
+
+        assert concurrency is None or concurrency > 0, (
+            'concurrency expected a positive integer, received '
+            '"{concurrency}"'
+        ).format(**locals())
+
+        from . import asynchronous
+        return asynchronous.apply_many(
+            self, pattern_or_paths, output_dir,
+            concurrency=concurrency, executor=executor, progress=progress,
+            **kwargs
+        )
+
     @classmethod
     def from_json(cls, serialization):
         """ Loads a SandPaper instance from a json serialization.
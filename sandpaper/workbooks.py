@@ -0,0 +1,460 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+""" Streaming readers and writers of ``.xlsx`` workbooks.
+
+.. note:: Sheets are read by parsing their XML incrementally from the zip
+    archive, dropping every row from the parsed tree once it is read, and
+    written with openpyxl's write-only mode, which serializes every appended
+    row to a temporary file before the archive is built. So, apart from the
+    shared strings table of the workbook read, memory stays flat as the
+    number of rows grows.
+"""
+
+import os
+import zipfile
+import posixpath
+import itertools
+from xml.etree import ElementTree
+
+import openpyxl
+from openpyxl.styles import numbers
+from openpyxl.utils.cell import column_index_from_string
+from openpyxl.utils.datetime import (
+    MAC_EPOCH, WINDOWS_EPOCH, from_excel, from_ISO8601,
+)
+from pyexcel_io import constants
+
+from .records import Header, Record, is_ordered
+
+XLSX_EXTENSIONS = ('.xlsx', '.xlsm',)
+DIGITS = '0123456789'
+TRUE = ('1', 'true',)
+
+
+def is_xlsx(path):
+    """ Checks if a path is a workbook openpyxl reads and writes.
+
+    :param str path: The path to check
+    :returns: True if the path has an ``.xlsx`` extension
+    :rtype: bool
+    """
+
+    return os.path.splitext(path)[-1].lower() in XLSX_EXTENSIONS
+
+
+def _local(tag):
+    """ Removes the namespace of a tag.
+
+    :param str tag: The tag of an element
+    :returns: The local name of the tag
+    :rtype: str
+    """
+
+    return tag.rsplit('}', 1)[-1]
+
+
+def _iterparse(source, tags):
+    """ Iterates the elements of an XML document as they are parsed.
+
+    .. note:: Yielded elements are detached from their parent once the
+        consumer resumes, so the parsed tree does not grow with the number of
+        elements yielded (clearing them would still keep every element as an
+        empty child of its parent).
+
+    :param file source: The binary stream of the XML document
+    :param tuple tags: The local names of the elements to yield, in the
+        namespace of the root element
+    :returns: A generator yielding parsed elements
+    """
+
+    parents = []
+    for (event, element,) in ElementTree.iterparse(
+        source, events=('start', 'end',)
+    ):
+        if event == 'start':
+            if len(parents) <= 0:
+                namespace = element.tag[:-len(_local(element.tag))]
+                tags = frozenset(namespace + tag for tag in tags)
+            parents.append(element)
+            continue
+
+        parents.pop()
+        if element.tag in tags:
+            yield element
+            if len(parents) > 0:
+                parents[-1].remove(element)
+
+
+def _relationships(archive, part):
+    """ Reads the relationships of a part of a workbook.
+
+    :param zipfile.ZipFile archive: The archive of the workbook
+    :param str part: The path of the part (``''`` for the package)
+    :returns: A dictionary of (``type``, ``path``) keyed by relationship id,
+        where ``type`` is the last segment of the relationship type
+    :rtype: dict[str, tuple(str, str)]
+    """
+
+    (directory, name,) = posixpath.split(part)
+    try:
+        root = ElementTree.fromstring(archive.read(
+            posixpath.join(directory, '_rels', (name + '.rels'))
+        ))
+    except KeyError:
+        return {}
+
+    relationships = {}
+    for element in root:
+        if element.get('TargetMode') == 'External':
+            continue
+        target = element.get('Target')
+        relationships[element.get('Id')] = (
+            element.get('Type').rsplit('/', 1)[-1],
+            (
+                target.lstrip('/')
+                if target.startswith('/') else
+                posixpath.normpath(posixpath.join(directory, target))
+            ),
+        )
+    return relationships
+
+
+def _text(element):
+    """ Gets the text of a shared or inline string.
+
+    :param xml.etree.ElementTree.Element element: The string element
+    :returns: The text of its plain and rich text runs (phonetic runs are
+        skipped)
+    :rtype: str
+    """
+
+    text = []
+    for child in element:
+        tag = _local(child.tag)
+        if tag == 't':
+            text.append(child.text or '')
+        elif tag == 'r':
+            text.extend(
+                (run.text or '')
+                for run in child
+                if _local(run.tag) == 't'
+            )
+    return ''.join(text)
+
+
+def _read_book(archive):
+    """ Reads the sheets and value formats of a workbook.
+
+    :param zipfile.ZipFile archive: The archive of the workbook
+    :returns: A tuple of (``sheets``, ``shared_strings``, ``dates``,
+        ``timedeltas``, ``epoch``) where ``sheets`` are the visible
+        (``name``, ``path``) sheets in order and ``dates`` and
+        ``timedeltas`` are the indices of the cell styles formatting numbers
+        as dates and durations
+    :rtype: tuple(list[tuple(str, str)], list[str], set[int], set[int],
+        datetime.datetime)
+    """
+
+    workbook = [
+        path
+        for (kind, path,) in _relationships(archive, '').values()
+        if kind == 'officeDocument'
+    ][0]
+    relationships = _relationships(archive, workbook)
+    parts = dict(relationships.values())
+
+    (sheets, epoch,) = ([], WINDOWS_EPOCH,)
+    for element in ElementTree.fromstring(archive.read(workbook)).iter():
+        tag = _local(element.tag)
+        if tag == 'workbookPr' and element.get('date1904') in TRUE:
+            epoch = MAC_EPOCH
+        elif tag == 'sheet' and element.get('state') != 'hidden':
+            # pyexcel skips hidden sheets (but not very hidden ones)
+            relationship = [
+                value
+                for (key, value,) in element.attrib.items()
+                if _local(key) == 'id'
+            ][0]
+            sheets.append(
+                (element.get('name'), relationships[relationship][1],)
+            )
+
+    shared_strings = []
+    if 'sharedStrings' in parts:
+        with archive.open(parts['sharedStrings']) as source:
+            shared_strings = [
+                _text(element) for element in _iterparse(source, ('si',))
+            ]
+
+    (dates, timedeltas,) = (set(), set(),)
+    if 'styles' in parts:
+        (custom, styles,) = ({}, [],)
+        for element in ElementTree.fromstring(archive.read(parts['styles'])):
+            tag = _local(element.tag)
+            if tag == 'numFmts':
+                custom.update(
+                    (int(child.get('numFmtId')), child.get('formatCode'),)
+                    for child in element
+                )
+            elif tag == 'cellXfs':
+                styles = [int(child.get('numFmtId', 0)) for child in element]
+        for (index, format_id,) in enumerate(styles):
+            code = custom.get(
+                format_id, numbers.BUILTIN_FORMATS.get(format_id)
+            )
+            if numbers.is_date_format(code):
+                dates.add(index)
+            if numbers.is_timedelta_format(code):
+                timedeltas.add(index)
+    return (sheets, shared_strings, dates, timedeltas, epoch,)
+
+
+def _cell_value(cell, tags, shared_strings, dates, timedeltas, epoch):
+    """ Reads the value of a cell just like openpyxl's read-only mode.
+
+    :param xml.etree.ElementTree.Element cell: The cell element
+    :param dict tags: The full tags of the ``v`` and ``is`` elements
+    :param list[str] shared_strings: The shared strings of the workbook
+    :param set[int] dates: The styles formatting numbers as dates
+    :param set[int] timedeltas: The styles formatting numbers as durations
+    :param datetime.datetime epoch: The epoch of dates in the workbook
+    :returns: The value of the cell (None if it is empty)
+    """
+
+    kind = cell.get('t', 'n')
+    if kind == 'inlineStr':
+        element = cell.find(tags['is'])
+        return (None if element is None else _text(element))
+
+    value = cell.findtext(tags['v'])
+    if not value:
+        return None
+    elif kind == 'n':
+        value = (
+            float(value)
+            if '.' in value or 'E' in value or 'e' in value else
+            int(value)
+        )
+        style = int(cell.get('s', 0))
+        if style in dates:
+            try:
+                return from_excel(
+                    value, epoch, timedelta=(style in timedeltas)
+                )
+            except (OverflowError, ValueError):
+                return '#VALUE!'
+        return value
+    elif kind == 's':
+        return shared_strings[int(value)]
+    elif kind == 'b':
+        return bool(int(value))
+    elif kind == 'd':
+        return from_ISO8601(value)
+    # formula strings and errors
+    return value
+
+
+def _iter_rows(source, shared_strings, dates, timedeltas, epoch):
+    """ Iterates the rows of a sheet.
+
+    .. note:: Rows are the rows pyexcel reads: hidden rows and columns are
+        skipped, empty cells are ``''`` and trailing empty cells are trimmed.
+        Rows are read up to the last row with a cell element (even if its
+        value is empty), so only trailing rows without any are skipped. Only
+        the count of empty rows is kept until such a row follows them.
+
+    :param file source: The binary stream of the sheet XML
+    :param list[str] shared_strings: The shared strings of the workbook
+    :param set[int] dates: The styles formatting numbers as dates
+    :param set[int] timedeltas: The styles formatting numbers as durations
+    :param datetime.datetime epoch: The epoch of dates in the workbook
+    :returns: A generator yielding lists of values
+    """
+
+    (hidden, positions, tags, expected, empty,) = (set(), {}, None, 1, 0,)
+    for element in _iterparse(source, ('col', 'row',)):
+        if tags is None:
+            namespace = element.tag[:-len(_local(element.tag))]
+            tags = dict((tag, namespace + tag,) for tag in ('v', 'is',))
+        if _local(element.tag) == 'col':
+            if element.get('hidden') in TRUE:
+                hidden.update(range(
+                    int(element.get('min')), int(element.get('max')) + 1
+                ))
+            continue
+
+        index = int(element.get('r', expected))
+        # missing rows are empty rows
+        empty += max(index - expected, 0)
+        expected = index + 1
+        # openpyxl sizes the sheet by every cell element, even empty ones
+        present = any(_local(cell.tag) == 'c' for cell in element)
+        if element.get('hidden') in TRUE:
+            if present:
+                for _ in range(empty):
+                    yield []
+                empty = 0
+            continue
+
+        (row, column,) = ([], 0,)
+        for cell in element:
+            reference = cell.get('r')
+            column = (
+                column_index_from_string(reference.rstrip(DIGITS))
+                if reference else
+                column + 1
+            )
+            if column in hidden:
+                continue
+            position = positions.get(column)
+            if position is None:
+                position = positions[column] = (
+                    column - 1 - len([
+                        other for other in hidden if other < column
+                    ])
+                )
+
+            value = _cell_value(
+                cell, tags, shared_strings, dates, timedeltas, epoch
+            )
+            if value is None or value == '':
+                continue
+            elif position < len(row):
+                row[position] = value
+            else:
+                row.extend([''] * (position - len(row)))
+                row.append(value)
+
+        if len(row) <= 0 and not present:
+            empty += 1
+            continue
+        for _ in range(empty):
+            yield []
+        empty = 0
+        yield row
+
+
+def _build_records(rows, columns=None):
+    """ Builds records from rows of values.
+
+    :param rows: An iterable of trimmed lists of values
+    :param columns: The column names to read (defaults to every column)
+    :returns: A generator yielding records
+    """
+
+    (header, layout, long_layout,) = (None, None, None,)
+    for row in rows:
+        if header is None:
+            header = row
+            layout = Header.layout(header, columns)
+            continue
+
+        if len(row) > len(header):
+            if long_layout is None:
+                # extra cells are all named '', the last one wins
+                (long_header, long_indices,) = Header.layout(
+                    header + [''], columns
+                )
+                long_layout = (
+                    long_header,
+                    [
+                        (-1 if index == len(header) else index)
+                        for index in long_indices
+                    ],
+                )
+            (record_header, indices,) = long_layout
+        else:
+            (record_header, indices,) = layout
+
+        yield Record(record_header, [
+            (row[index] if index < len(row) else '')
+            for index in indices
+        ])
+
+
+def read_records(path, sheet_name=None, columns=None):
+    """ Reads records from a sheet of a workbook row by row.
+
+    .. note:: Records are the records ``pyexcel.iget_records`` reads from
+        the sheet, except that merged cells only have a value in their top
+        left cell.
+
+    :param str path: The path of the workbook
+    :param str sheet_name: The name of the sheet to read (defaults to the
+        first visible sheet)
+    :param columns: The column names to read (defaults to every column)
+    :raises ValueError: If the sheet does not exist
+    :returns: A generator yielding records
+    """
+
+    with zipfile.ZipFile(path) as archive:
+        (sheets, shared_strings, dates, timedeltas, epoch,) = _read_book(
+            archive
+        )
+        if sheet_name is not None:
+            sheets = [sheet for sheet in sheets if sheet[0] == sheet_name]
+        if len(sheets) <= 0:
+            raise ValueError((
+                'sheet {sheet_name!r} does not exist in {path!r}'
+            ).format(**locals()))
+
+        with archive.open(sheets[0][1]) as source:
+            for record in _build_records(
+                _iter_rows(source, shared_strings, dates, timedeltas, epoch),
+                columns=columns
+            ):
+                yield record
+
+
+def write_records(
+    path, records, sheet_name=constants.DEFAULT_SHEET_NAME, header=None,
+):
+    """ Writes records to a workbook row by row.
+
+    .. note:: Records are written like ``pyexcel.isave_as`` writes them.
+        The column names of the first record are the header (sorted if the
+        record is not ordered), empty values are not written as cells and an
+        empty iterable of records writes an empty sheet.
+
+    :param str path: The path of the workbook
+    :param records: An iterable of records
+    :param str sheet_name: The name of the sheet to write
+    :param list header: The column names to write records with
+        (defaults to the column names of the first record)
+    :returns: The header the records were written with or None if there were
+        no records
+    :rtype: list
+    """
+
+    book = openpyxl.Workbook(write_only=True)
+    sheet = book.create_sheet(title=sheet_name)
+
+    records = iter(records)
+    first = next(records, None)
+    if first is not None:
+        if header is None:
+            header = (
+                list(first.keys())
+                if is_ordered(first) else
+                sorted(first.keys())
+            )
+        shared = Header.intern(header)
+
+        sheet.append([(None if name == '' else name) for name in header])
+        for record in itertools.chain([first], records):
+            # records sharing the header are written without key lookups
+            sheet.append([
+                (None if value == '' else value)
+                for value in (
+                    record.row
+                    if isinstance(record, Record) and
+                    record.header is shared else
+                    [record.get(key, '') for key in header]
+                )
+            ])
+    book.save(path)
+    return (header if first is not None else None)
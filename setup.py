@@ -18,6 +18,7 @@ REQUIRES = [
     'pyexcel-io',
     'pyexcel-xls',
     'pyexcel-xlsx',
+    'futures; python_version < "3.2"',
 ]
 RELEASE = {}
 
@@ -15,6 +15,7 @@ from .increment import (IncrementRuleTest,)
 from .decrement import (DecrementRuleTest,)
 from .translate_text import (TranslateTextRuleTest,)
 from .translate_date import (TranslateDateRuleTest,)
+from .replace import (ReplaceRuleTest,)
 
 from .add_columns import (AddColumnsRuleTest,)
 from .remove_columns import (RemoveColumnsRuleTest,)
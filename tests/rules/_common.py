@@ -102,8 +102,8 @@ class BaseRuleTest(six.with_metaclass(abc.ABCMeta, unittest.TestCase)):
 
         del self.paper.rules[:]
 
-    def test_application(self):
-        """ Tests the implementation of the rule.
+    def _assert_application(self, **kwargs):
+        """ Asserts the rule's application matches the static post files.
         """
 
         getattr(self.paper, self.rule_name)(
@@ -122,5 +122,17 @@ class BaseRuleTest(six.with_metaclass(abc.ABCMeta, unittest.TestCase)):
 
         for (from_file, to_file, result_file,) in \
                 zip(pre_paths, sanded_paths, post_paths):
-            applied = self.paper.apply(from_file, to_file)
+            applied = self.paper.apply(from_file, to_file, **kwargs)
             self.assertTrue(filecmp.cmp(to_file, result_file))
+
+    def test_application(self):
+        """ Tests the implementation of the rule.
+        """
+
+        self._assert_application()
+
+    def test_columnar_application(self):
+        """ Tests the implementation of the rule with the columnar engine.
+        """
+
+        self._assert_application(engine='columnar')
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+#
+# Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
+# MIT License <https://opensource.org/licenses/MIT>
+
+import collections
+
+import sandpaper
+
+from ._common import BaseRuleTest
+
+
+class ReplaceRuleTest(BaseRuleTest):
+    """ Tests the ``replace`` rule.
+    """
+
+    @property
+    def rule_name(self):
+        """ The name of the rule.
+        """
+
+        return 'replace'
+
+    @property
+    def rule_arguments(self):
+        """ The arguments for this rule's application.
+        """
+
+        return ([{'L': 'Y'}], {},)
+
+    @property
+    def rule_group(self):
+        """ The group type of the rule.
+        """
+
+        return 'value_rules'
+
+    def test_replace_modes(self):
+        """ Tests sequential and leftmost longest replacement semantics.
+        """
+
+        replacements = collections.OrderedDict([
+            ('ab', 'x'), ('abc', 'y'), ('b', 'ab'), ('', ''),
+        ])
+        rule = sandpaper.SandPaper.replace.__wrapped__
+        for (mode, value, expected,) in (
+            ('sequential', 'abc', 'xc'),
+            ('sequential', 'bab', 'abx'),
+            ('leftmost_longest', 'abc', 'y'),
+            ('leftmost_longest', 'bab', 'abx'),
+            ('leftmost_longest', 12, 12),
+        ):
+            for compiled in (
+                replacements,
+                sandpaper.matchers.Replacements(replacements),
+            ):
+                self.assertEqual(
+                    rule(
+                        self.paper, {'column': value}, 'column',
+                        compiled, mode=mode
+                    ),
+                    expected
+                )
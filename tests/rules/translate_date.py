@@ -4,6 +4,11 @@
 # Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
 # MIT License <https://opensource.org/licenses/MIT>
 
+import datetime
+import collections
+
+import sandpaper
+
 from ._common import BaseRuleTest
 
 
@@ -44,3 +49,43 @@ class TranslateDateRuleTest(BaseRuleTest):
         """
 
         return record['id'] in (2,)
+
+    def test_translation_order(self):
+        """ Tests the first parsing date format translates a value.
+        """
+
+        translations = sandpaper.matchers.DateTranslations(
+            collections.OrderedDict([
+                ('%d/%m/%Y', 'day first %Y-%m-%d'),
+                ('%m/%d/%Y', 'month first %Y-%m-%d'),
+                ('%Y-%m-%d', 'iso %Y-%m-%d'),
+            ])
+        )
+        for (value, expected,) in (
+            ('12/31/2017', 'month first 2017-12-31'),
+            ('01/02/2017', 'day first 2017-02-01'),
+            ('2017-02-01', 'iso 2017-02-01'),
+            ('2017-02-30', '2017-02-30'),
+            ('2017-02-01\n', '2017-02-01\n'),
+            ('01/02/2017', 'day first 2017-02-01'),
+        ):
+            self.assertEqual(
+                translations.translate(value, column='column'), expected
+            )
+
+    def test_strptime_patterns(self):
+        """ Tests date format patterns match every value strptime parses.
+        """
+
+        for (date_format, values,) in (
+            ('%d/%m/%Y', ('1/2/2017', '01/02/2017', ' 1/02/2017',)),
+            ('%d %B %Y', ('01 february 2017', '1  February 2017',)),
+            ('%I:%M %p', ('1:05 pm', '01:05 AM',)),
+            ('%Y-%m-%d %%', ('2017-02-01 %',)),
+        ):
+            pattern = sandpaper.matchers._strptime_pattern(date_format)
+            for value in values:
+                datetime.datetime.strptime(value, date_format)
+                self.assertIsNotNone(pattern.match(value))
+            self.assertIsNone(pattern.match('2017/02/01'))
+        self.assertIsNone(sandpaper.matchers._strptime_pattern('%Y %z'))
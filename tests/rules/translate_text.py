@@ -4,6 +4,10 @@
 # Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
 # MIT License <https://opensource.org/licenses/MIT>
 
+import collections
+
+import sandpaper
+
 from ._common import BaseRuleTest
 
 
@@ -34,3 +38,20 @@ class TranslateTextRuleTest(BaseRuleTest):
         """
 
         return 'value_rules'
+
+    def test_translation_order(self):
+        """ Tests translations apply in order to the previous translation.
+        """
+
+        translations = collections.OrderedDict([
+            (r'^b(\w)$', 'a{0}'),
+            (r'^a(?P<rest>\w+)$', 'c{rest}'),
+            (r'^(c)\1?x$', 'b{0}'),
+            (r'^b(?P<rest>.*)$', 'done {rest}'),
+        ])
+        rule = sandpaper.SandPaper.translate_text.__wrapped__
+        for (value, expected,) in (('bx', 'done c'), ('zz', 'zz'), (12, 12),):
+            self.assertEqual(
+                rule(self.paper, {'column': value}, 'column', translations),
+                expected
+            )
@@ -4,11 +4,22 @@
 # Copyright (c) 2017 Stephen Bunn (stephen@bunn.io)
 # MIT License <https://opensource.org/licenses/MIT>
 
+import os
+import json
+import shutil
+import filecmp
+import datetime
+import tempfile
 import unittest
+import warnings
+import threading
+import collections
 
 import sandpaper
 
 import six
+import pyexcel
+import openpyxl
 
 
 class SandPaperTest(unittest.TestCase):
@@ -112,6 +123,56 @@ class SandPaperTest(unittest.TestCase):
             self.blank_paper.__repr__()
         )
 
+    def test_uid(self):
+        """ Tests the cached uid follows changes to the rules.
+        """
+
+        self.named_paper.lower().upper()
+        uid = self.named_paper.uid
+        self.assertEqual(self.named_paper.uid, uid)
+
+        # appended rules update the cached uid
+        self.named_paper.strip()
+        self.blank_paper.lower().upper().strip()
+        self.assertNotEqual(self.named_paper.uid, uid)
+        self.assertEqual(self.named_paper.uid, self.blank_paper.uid)
+
+        # directly mutated rules rebuild the cached uid
+        self.named_paper.rules.reverse()
+        self.assertNotEqual(self.named_paper.uid, self.blank_paper.uid)
+        self.named_paper.rules.reverse()
+        del self.named_paper.rules[-1]
+        self.assertEqual(self.named_paper.uid, uid)
+        del self.named_paper.rules[:]
+        del self.blank_paper.rules[:]
+
+        # applying never changes the rules (or their cached uid)
+        static_dir = os.path.join(
+            os.path.dirname(__file__), 'static', 'rules', 'lower'
+        )
+        output_dir = tempfile.mkdtemp()
+        try:
+            for paper in (self.named_paper, self.blank_paper,):
+                paper.lower(column_filter=r'^name$', value_filter=r'.*')
+            uid = self.named_paper.uid
+            for paper in (self.named_paper, self.blank_paper,):
+                paper.apply(
+                    os.path.join(static_dir, 'pre.csv'),
+                    os.path.join(output_dir, 'post.csv')
+                )
+            self.assertEqual(self.named_paper, self.blank_paper)
+            self.assertEqual(self.named_paper.uid, uid)
+            self.assertEqual(self.blank_paper.uid, uid)
+            self.assertEqual(
+                self.blank_paper.rules[0][-1]['column_filter'], r'^name$'
+            )
+        finally:
+            shutil.rmtree(output_dir)
+            del self.named_paper.rules[:]
+            del self.blank_paper.rules[:]
+            self.named_paper.value_rules.clear()
+            self.blank_paper.value_rules.clear()
+
     def test_serialization(self):
         """ Tests instance exporting and loading.
         """
@@ -149,3 +210,1032 @@ class SandPaperTest(unittest.TestCase):
         del self.named_paper.rules[:]
         self.named_paper.record_rules.clear()
         self.named_paper.value_rules.clear()
+
+    def test_copy_on_write_record(self):
+        """ Tests copy-on-write record proxies given to rules.
+        """
+
+        record = collections.OrderedDict([('id', 1), ('name', ' Test ')])
+        view = sandpaper.sandpaper.CopyOnWriteRecord(record)
+        self.assertEqual(view['name'], ' Test ')
+        self.assertEqual(list(view.items()), list(record.items()))
+
+        # built-in value rules only read from the record
+        self.blank_paper.strip().lower().increment()
+        for (rule, rule_args, rule_kwargs,) in self.blank_paper.rules:
+            rule(self.blank_paper, view, 'name', *rule_args, **rule_kwargs)
+        self.assertFalse(view.copied)
+        self.assertIs(view.record, record)
+
+        # mutations copy the proxied record before being applied
+        view['name'] = 'mutated'
+        del view['id']
+        self.assertTrue(view.copied)
+        self.assertEqual(record['name'], ' Test ')
+        self.assertIn('id', record)
+        self.assertEqual(list(view.keys()), ['name'])
+
+        del self.blank_paper.rules[:]
+        self.blank_paper.value_rules.clear()
+
+    def test_apply_many(self):
+        """ Tests parallel application to many files.
+        """
+
+        static_dir = os.path.join(
+            os.path.dirname(__file__), 'static', 'rules', 'lower'
+        )
+        input_dir = tempfile.mkdtemp()
+        output_dir = os.path.join(input_dir, 'sanded')
+        try:
+            for index in range(4):
+                shutil.copyfile(
+                    os.path.join(static_dir, 'pre.csv'),
+                    os.path.join(input_dir, ('{0}.csv').format(index))
+                )
+            missing = os.path.join(input_dir, 'missing.csv')
+
+            results = self.blank_paper.lower().apply_many(
+                [os.path.join(input_dir, '*.csv'), missing], output_dir,
+                workers=2, monitor_rules=True
+            )
+            self.assertEqual(len(results), 5)
+            for (from_file, result,) in results.items():
+                if from_file == missing:
+                    self.assertIsNotNone(result['error'])
+                    continue
+                self.assertIsNone(result['error'])
+                self.assertGreater(result['stats']['lower'], 0)
+                self.assertTrue(filecmp.cmp(
+                    result['to_file'], os.path.join(static_dir, 'post.csv')
+                ))
+        finally:
+            shutil.rmtree(input_dir)
+            del self.blank_paper.rules[:]
+            self.blank_paper.value_rules.clear()
+
+    @unittest.skipIf(six.PY2, 'asyncio requires Python 3.5+')
+    def test_apply_async(self):
+        """ Tests asynchronous application, progress and cancellation.
+        """
+
+        import asyncio
+        import threading
+        import concurrent.futures
+
+        static_dir = os.path.join(
+            os.path.dirname(__file__), 'static', 'rules', 'lower'
+        )
+        input_dir = tempfile.mkdtemp()
+        output_dir = os.path.join(input_dir, 'sanded')
+        loop = asyncio.new_event_loop()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        try:
+            for index in range(4):
+                shutil.copyfile(
+                    os.path.join(static_dir, 'pre.csv'),
+                    os.path.join(input_dir, ('{0}.csv').format(index))
+                )
+            paper = self.blank_paper.lower()
+
+            stats = loop.run_until_complete(paper.apply_async(
+                os.path.join(input_dir, '0.csv'),
+                os.path.join(input_dir, 'sanded.csv'),
+                executor=executor, monitor_rules=True
+            ))
+            self.assertGreater(stats['lower'], 0)
+            self.assertTrue(filecmp.cmp(
+                os.path.join(input_dir, 'sanded.csv'),
+                os.path.join(static_dir, 'post.csv')
+            ))
+
+            (progress, filtered,) = ([], [0],)
+
+            def row_filter(record, normalized=False):
+                # callables are not pickled for thread pool executors
+                return True
+
+            async def report(from_file, result, completed, total):
+                progress.append((completed, total, result['error'],))
+
+            results = loop.run_until_complete(paper.apply_many_async(
+                os.path.join(input_dir, '*.csv'), output_dir,
+                concurrency=2, executor=executor, progress=report,
+                row_filter=row_filter, monitor_rules=True
+            ))
+            self.assertEqual(len(results), 5)
+            self.assertEqual(
+                [(completed, total,) for (completed, total, _,) in progress],
+                [(index, 5,) for index in range(1, 6)]
+            )
+            for result in results.values():
+                self.assertIsNone(result['error'])
+                self.assertGreater(result['stats']['lower'], 0)
+                self.assertTrue(filecmp.cmp(
+                    result['to_file'], os.path.join(static_dir, 'post.csv')
+                ))
+
+            large_file = os.path.join(input_dir, 'large.csv')
+            with open(large_file, 'w') as fp:
+                fp.write('id,name\n')
+                for index in range(100000):
+                    fp.write(('{index},Name {index}\n').format(**locals()))
+            started = threading.Event()
+
+            def blocking_filter(record, normalized=False):
+                started.set()
+                filtered[0] += 1
+                return True
+
+            async def cancel():
+                task = asyncio.ensure_future(paper.apply_async(
+                    large_file, os.path.join(input_dir, 'cancelled.csv'),
+                    executor=executor, row_filter=blocking_filter
+                ))
+                while not started.is_set():
+                    await asyncio.sleep(0.001)
+                task.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+
+            loop.run_until_complete(cancel())
+            executor.shutdown(wait=True)
+            self.assertLess(filtered[0], 200000)
+            self.assertEqual(paper._SandPaper__rule_stats, {})
+        finally:
+            executor.shutdown(wait=True)
+            loop.close()
+            shutil.rmtree(input_dir)
+            del self.blank_paper.rules[:]
+            self.blank_paper.value_rules.clear()
+
+    def test_apply_sheets(self):
+        """ Tests applying to many sheets of a workbook at once.
+        """
+
+        input_dir = tempfile.mkdtemp()
+        from_file = os.path.join(input_dir, 'pre.xlsx')
+        try:
+            pyexcel.save_book_as(
+                bookdict=collections.OrderedDict([
+                    ('First', [['id', 'name'], [1, ' A '], [2, 'B']]),
+                    ('Second', [['key', 'value'], ['C', ' D ']]),
+                    ('Third', [['id'], [3]]),
+                ]),
+                dest_file_name=from_file
+            )
+            self.blank_paper.strip().lower()
+
+            to_file = os.path.join(input_dir, 'post.xlsx')
+            for workers in (None, 2,):
+                stats = self.blank_paper.apply(
+                    from_file, to_file,
+                    sheet_name=sandpaper.ALL, workers=workers,
+                    monitor_rules=True
+                )
+                self.assertEqual(list(stats.keys()), [
+                    'First', 'Second', 'Third',
+                ])
+                self.assertEqual(stats['Second'], {'strip': 2, 'lower': 2})
+                self.assertEqual(
+                    pyexcel.get_book_dict(file_name=to_file),
+                    collections.OrderedDict([
+                        ('First', [['id', 'name'], [1, 'a'], [2, 'b']]),
+                        ('Second', [['key', 'value'], ['c', 'd']]),
+                        ('Third', [['id'], [3]]),
+                    ])
+                )
+                pyexcel.free_resources()
+
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                self.blank_paper.apply(
+                    from_file, to_file,
+                    sheet_name=sandpaper.ALL, workers=2,
+                    row_filter=(lambda record, normalized=False: True)
+                )
+            self.assertTrue(any(
+                'applying serially' in str(warning.message)
+                for warning in caught
+            ))
+            self.assertEqual(
+                pyexcel.get_book_dict(file_name=to_file)['Second'],
+                [['key', 'value'], ['c', 'd']]
+            )
+            pyexcel.free_resources()
+
+            to_file = os.path.join(input_dir, 'post.csv')
+            self.assertIsNone(self.blank_paper.apply(
+                from_file, to_file, sheet_name=['Third', 'First']
+            ))
+            self.assertEqual(
+                sorted(os.listdir(input_dir)),
+                sorted([
+                    'pre.xlsx', 'post.xlsx',
+                    'post__Third__0.csv', 'post__First__1.csv',
+                ])
+            )
+            with self.assertRaises(ValueError):
+                self.blank_paper.apply(
+                    from_file, to_file, sheet_name=['Fourth']
+                )
+            for apply_kwargs in (
+                {'checkpoint_path': os.path.join(input_dir, 'checkpoint')},
+                {'pipeline': 2},
+                {'reader': 'mmap'},
+                {'stream_xlsx': True},
+            ):
+                with self.assertRaises(ValueError):
+                    self.blank_paper.apply(
+                        from_file, os.path.join(input_dir, 'post.xlsx'),
+                        sheet_name=sandpaper.ALL, **apply_kwargs
+                    )
+        finally:
+            shutil.rmtree(input_dir)
+            del self.blank_paper.rules[:]
+            self.blank_paper.value_rules.clear()
+
+    def test_apply_stream_xlsx(self):
+        """ Tests applying to workbooks read and written row by row.
+        """
+
+        input_dir = tempfile.mkdtemp()
+        from_file = os.path.join(input_dir, 'pre.xlsx')
+        try:
+            book = openpyxl.Workbook()
+            sheet = book.active
+            sheet.title = 'First'
+            for row in (
+                ['id', 'name', 'hidden', 'added'],
+                [0, ' A ', 'x', datetime.datetime(2017, 1, 2, 3, 4)],
+                [1.5, 'B', None, None, 'extra'],
+                [None, None, None, None],
+                [True, ' hidden ', 'y'],
+                [2, 'C '],
+                [None, None],
+            ):
+                sheet.append(row)
+            sheet.row_dimensions[5].hidden = True
+            sheet.column_dimensions['C'].hidden = True
+            book.create_sheet('Second').append(['key'])
+            book.save(from_file)
+            self.blank_paper.strip().lower()
+
+            for sheet_name in (None, 'Second',):
+                expected = [
+                    dict(record)
+                    for record in pyexcel.iget_records(
+                        file_name=from_file, sheet_name=sheet_name
+                    )
+                ]
+                pyexcel.free_resources()
+                self.assertEqual(
+                    [
+                        dict(record)
+                        for record in sandpaper.workbooks.read_records(
+                            from_file, sheet_name=sheet_name
+                        )
+                    ],
+                    expected
+                )
+
+            (stats, outputs,) = ([], [],)
+            for stream_xlsx in (False, True,):
+                to_file = os.path.join(
+                    input_dir, ('post.{stream_xlsx}.xlsx').format(**locals())
+                )
+                stats.append(self.blank_paper.apply(
+                    from_file, to_file,
+                    monitor_rules=True, stream_xlsx=stream_xlsx
+                ))
+                outputs.append(pyexcel.get_book_dict(file_name=to_file))
+                pyexcel.free_resources()
+            self.assertEqual(stats[0], stats[1])
+            self.assertEqual(outputs[0], outputs[1])
+            # hidden rows and columns are skipped
+            self.assertEqual(outputs[1]['pyexcel_sheet1'], [
+                ['id', 'name', 'added'],
+                [0, 'a', datetime.datetime(2017, 1, 2, 3, 4)],
+                [1.5, 'b', ''],
+                ['', '', ''],
+                [2, 'c', ''],
+            ])
+
+            # empty strings are cells, rows of them are never trailing rows
+            for extension in ('xlsx', 'xls',):
+                empty_file = os.path.join(
+                    input_dir, ('empty.{extension}').format(**locals())
+                )
+                pyexcel.save_as(
+                    array=[
+                        ['id', 'name'], [' X ', ''], ['', ''], ['Y', ' Z '],
+                        ['', ''], ['', ''],
+                    ],
+                    dest_file_name=empty_file
+                )
+                if extension == 'xlsx':
+                    expected = [
+                        dict(record)
+                        for record in pyexcel.iget_records(
+                            file_name=empty_file
+                        )
+                    ]
+                    pyexcel.free_resources()
+                    self.assertEqual(len(expected), 5)
+                    self.assertEqual([
+                        dict(record)
+                        for record in sandpaper.workbooks.read_records(
+                            empty_file
+                        )
+                    ], expected)
+
+                outputs = []
+                for stream_xlsx in (False, True,):
+                    to_file = os.path.join(
+                        input_dir,
+                        ('post.{extension}.{stream_xlsx}.xlsx').format(
+                            **locals()
+                        )
+                    )
+                    self.blank_paper.apply(
+                        empty_file, to_file, stream_xlsx=stream_xlsx
+                    )
+                    outputs.append(pyexcel.get_array(file_name=to_file))
+                    pyexcel.free_resources()
+                self.assertEqual(outputs[0], outputs[1])
+
+            with self.assertRaises(ValueError):
+                list(sandpaper.workbooks.read_records(
+                    from_file, sheet_name='Third'
+                ))
+        finally:
+            shutil.rmtree(input_dir)
+            del self.blank_paper.rules[:]
+            self.blank_paper.value_rules.clear()
+
+    def test_apply_workers(self):
+        """ Tests parallel application to byte ranges of a single file.
+        """
+
+        input_dir = tempfile.mkdtemp()
+        from_file = os.path.join(input_dir, 'pre.csv')
+        minimum_size = sandpaper.delimited.MINIMUM_RANGE_SIZE
+        try:
+            with open(from_file, 'w') as fp:
+                fp.write('id,name,note\n')
+                for index in range(200):
+                    fp.write((
+                        '{index},Name {index},"Line, ""One""\nLine Two"\n'
+                    ).format(**locals()))
+
+            sandpaper.delimited.MINIMUM_RANGE_SIZE = 256
+            self.assertGreater(len(sandpaper.delimited.split_records(
+                from_file, 8
+            )[-1]), 1)
+
+            self.blank_paper.lower().increment(column_filter='id')
+            serial_file = os.path.join(input_dir, 'serial.csv')
+            parallel_file = os.path.join(input_dir, 'parallel.csv')
+            serial_stats = self.blank_paper.apply(
+                from_file, serial_file, monitor_rules=True
+            )
+            parallel_stats = self.blank_paper.apply(
+                from_file, parallel_file, monitor_rules=True, workers=2
+            )
+            self.assertEqual(serial_stats, parallel_stats)
+            self.assertEqual(parallel_stats['increment'], 200)
+            self.assertTrue(filecmp.cmp(
+                serial_file, parallel_file, shallow=False
+            ))
+            self.assertEqual(
+                sorted(os.listdir(input_dir)),
+                ['parallel.csv', 'pre.csv', 'serial.csv']
+            )
+
+            # lambdas cannot be pickled for worker processes
+            row_filter = (
+                lambda record, normalized=False: int(record['id']) % 2 == 0
+            )
+            self.blank_paper.apply(
+                from_file, serial_file, row_filter=row_filter
+            )
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                self.blank_paper.apply(
+                    from_file, parallel_file, row_filter=row_filter,
+                    workers=2
+                )
+            self.assertTrue(any(
+                'applying serially' in str(warning.message)
+                for warning in caught
+            ))
+            self.assertTrue(filecmp.cmp(
+                serial_file, parallel_file, shallow=False
+            ))
+        finally:
+            sandpaper.delimited.MINIMUM_RANGE_SIZE = minimum_size
+            shutil.rmtree(input_dir)
+            del self.blank_paper.rules[:]
+            self.blank_paper.value_rules.clear()
+
+    def test_apply_checkpoint(self):
+        """ Tests resuming an interrupted application from a checkpoint.
+        """
+
+        input_dir = tempfile.mkdtemp()
+        (from_file, checkpoint_path,) = (
+            os.path.join(input_dir, 'pre.csv'),
+            os.path.join(input_dir, 'checkpoint.json'),
+        )
+        (serial_file, resumed_file,) = (
+            os.path.join(input_dir, 'serial.csv'),
+            os.path.join(input_dir, 'resumed.csv'),
+        )
+        try:
+            with open(from_file, 'w') as fp:
+                fp.write('id,name,note\n')
+                for index in range(200):
+                    fp.write((
+                        '{index},Name {index},"Line, ""One""\nLine Two"\n'
+                    ).format(**locals()))
+
+            self.blank_paper.lower().increment(column_filter='id')
+            serial_stats = self.blank_paper.apply(
+                from_file, serial_file, monitor_rules=True
+            )
+
+            def interrupt(record, normalized=False):
+                if record['id'] == 150:
+                    raise KeyboardInterrupt()
+                return True
+
+            with self.assertRaises(KeyboardInterrupt):
+                self.blank_paper.apply(
+                    from_file, resumed_file,
+                    row_filter=interrupt, checkpoint_path=checkpoint_path,
+                    checkpoint_size=512
+                )
+            self.assertTrue(os.path.isfile(checkpoint_path))
+
+            # changed rules refuse to resume
+            with self.assertRaises(ValueError):
+                sandpaper.SandPaper().lower().apply(
+                    from_file, resumed_file, checkpoint_path=checkpoint_path
+                )
+
+            resumed_stats = self.blank_paper.apply(
+                from_file, resumed_file,
+                monitor_rules=True, checkpoint_path=checkpoint_path,
+                checkpoint_size=512
+            )
+            self.assertEqual(serial_stats, resumed_stats)
+            self.assertTrue(filecmp.cmp(
+                serial_file, resumed_file, shallow=False
+            ))
+            self.assertFalse(os.path.isfile(checkpoint_path))
+
+            # headers are stored as json, keeping converted column names
+            header = [
+                'id', 1, 2.5, None, datetime.datetime(2017, 1, 2, 3, 4),
+                datetime.date(2017, 1, 2), datetime.time(1, 2),
+                datetime.datetime(1899, 12, 31, 1, 2, 3, 4),
+                datetime.time(1, 2, 3, 4),
+            ]
+            decoded = sandpaper.checkpoints.decode_header(json.loads(
+                json.dumps(sandpaper.checkpoints.encode_header(header))
+            ))
+            self.assertEqual(decoded, header)
+            self.assertEqual(
+                [type(column) for column in decoded],
+                [type(column) for column in header]
+            )
+            with self.assertRaises(ValueError):
+                sandpaper.checkpoints.decode_header([{'type': 'object'}])
+            with self.assertRaises(ValueError):
+                sandpaper.checkpoints.decode_header([
+                    {'type': 'date', 'value': '2017-01-02T03:04:05'},
+                ])
+        finally:
+            shutil.rmtree(input_dir)
+            del self.blank_paper.rules[:]
+            self.blank_paper.value_rules.clear()
+
+    def test_apply_cache(self):
+        """ Tests skipping applications with cached outputs.
+        """
+
+        input_dir = tempfile.mkdtemp()
+        (from_file, to_file, cache_dir,) = (
+            os.path.join(input_dir, 'pre.csv'),
+            os.path.join(input_dir, 'post.csv'),
+            os.path.join(input_dir, 'cache'),
+        )
+        try:
+            with open(from_file, 'w') as fp:
+                fp.write('id,name\n1, Name \n2,Other\n')
+
+            self.blank_paper.strip().upper()
+            stats = self.blank_paper.apply(
+                from_file, to_file, monitor_rules=True, cache_dir=cache_dir
+            )
+            with open(to_file, 'r') as fp:
+                expected = fp.read()
+
+            # cached applications leave an unchanged output as is
+            cached_paper = sandpaper.SandPaper().strip().upper()
+            os.utime(to_file, (0, 0,))
+            self.assertEqual(cached_paper.apply(
+                from_file, to_file, monitor_rules=True, cache_dir=cache_dir
+            ), stats)
+            self.assertEqual(os.path.getmtime(to_file), 0)
+
+            # and restore a changed output from the cache
+            with open(to_file, 'w') as fp:
+                fp.write('modified')
+            self.assertEqual(cached_paper.apply(
+                from_file, to_file, monitor_rules=True, cache_dir=cache_dir
+            ), stats)
+            with open(to_file, 'r') as fp:
+                self.assertEqual(fp.read(), expected)
+
+            # rules given callables are never cached
+            for (column, output,) in (
+                ('name', 'id,name\n1, NAME \n2,OTHER\n',),
+                ('id', 'id,name\n1, Name \n2,Other\n',),
+            ):
+                callable_paper = sandpaper.SandPaper().upper(
+                    callable_filter=(
+                        lambda record, name, column=column, **kwargs:
+                        name == column
+                    )
+                )
+                callable_paper.apply(from_file, to_file, cache_dir=cache_dir)
+                with open(to_file, 'r') as fp:
+                    self.assertEqual(
+                        fp.read().replace(os.linesep, '\n'), output
+                    )
+
+            with open(from_file, 'a') as fp:
+                fp.write('3,Third\n')
+            self.assertEqual(self.blank_paper.apply(
+                from_file, to_file, monitor_rules=True, cache_dir=cache_dir
+            )['strip'], 6)
+        finally:
+            shutil.rmtree(input_dir)
+            del self.blank_paper.rules[:]
+            self.blank_paper.value_rules.clear()
+
+    def test_delimited_records(self):
+        """ Tests native delimited records match pyexcel records.
+        """
+
+        input_dir = tempfile.mkdtemp()
+        try:
+            for file_type in ('csv', 'tsv',):
+                from_file = os.path.join(input_dir, ('pre.' + file_type))
+                with open(from_file, 'w') as fp:
+                    fp.write((
+                        'id,name,,note,\n'
+                        '1,Name,,"Line, ""One""\nLine Two",\n'
+                        '007,1_000,3.5,inf,nan,extra\n'
+                        '1,234\n'
+                        '\n'
+                    ).replace(',', {'csv': ',', 'tsv': '\t'}[file_type]))
+
+                expected = list(pyexcel.iget_records(
+                    file_name=from_file, auto_detect_datetime=False
+                ))
+                pyexcel.free_resources()
+                with open(from_file, 'r') as fp:
+                    records = list(sandpaper.delimited.read_records(
+                        fp, file_type=file_type, auto_detect_datetime=False
+                    ))
+                self.assertEqual(records, expected)
+
+                (expected_file, to_file,) = (
+                    os.path.join(input_dir, ('expected.' + file_type)),
+                    os.path.join(input_dir, ('post.' + file_type)),
+                )
+                pyexcel.isave_as(
+                    records=iter(expected), dest_file_name=expected_file,
+                    dest_lineterminator=os.linesep
+                )
+                with open(to_file, 'w', newline='', encoding='utf-8') as fp:
+                    sandpaper.delimited.write_records(
+                        fp, iter(records), file_type=file_type
+                    )
+                self.assertTrue(filecmp.cmp(
+                    expected_file, to_file, shallow=False
+                ))
+        finally:
+            shutil.rmtree(input_dir)
+
+    def test_mapped_records(self):
+        """ Tests memory mapped delimited records match streamed records.
+        """
+
+        input_dir = tempfile.mkdtemp()
+        block_size = sandpaper.delimited.BLOCK_SIZE
+        try:
+            sandpaper.delimited.BLOCK_SIZE = 8
+            for file_type in ('csv', 'tsv',):
+                from_file = os.path.join(input_dir, ('pre.' + file_type))
+                with open(from_file, 'w', newline='') as fp:
+                    fp.write((
+                        'id,name,,note,\r\n'
+                        '1,Name,,"Line, ""One""\nLine Two",\r\n'
+                        '007,1_000,3.5,inf,nan,extra\n'
+                        '1,234\n'
+                        '\n'
+                        '2,Name,,plain,\n'
+                        '3,Name\r'
+                        '4,Näme,,"quoted",\n'
+                    ).replace(',', {'csv': ',', 'tsv': '\t'}[file_type]))
+
+                with open(from_file, 'r') as fp:
+                    expected = list(sandpaper.delimited.read_records(
+                        fp, file_type=file_type, auto_detect_datetime=False
+                    ))
+                self.assertEqual(list(sandpaper.delimited.read_mapped(
+                    from_file, file_type=file_type, auto_detect_datetime=False
+                )), expected)
+
+                (header_range, ranges,) = sandpaper.delimited.split_records(
+                    from_file, 4, minimum_size=1
+                )
+                self.assertGreater(len(ranges), 1)
+                mapped = []
+                for record_range in ranges:
+                    mapped.extend(sandpaper.delimited.read_mapped(
+                        from_file, ranges=[header_range, record_range],
+                        file_type=file_type, auto_detect_datetime=False,
+                        columns=set(['id', 'note'])
+                    ))
+                self.assertEqual(mapped, [
+                    collections.OrderedDict(
+                        (column, record[column],)
+                        for column in ('id', 'note',)
+                        if column in record
+                    )
+                    for record in expected
+                ])
+
+                self.blank_paper.lower().keep_columns(['id', 'name'])
+                for reader in ('stream', 'mmap',):
+                    self.blank_paper.apply(
+                        from_file,
+                        os.path.join(input_dir, (reader + '.' + file_type)),
+                        reader=reader
+                    )
+                self.assertTrue(filecmp.cmp(
+                    os.path.join(input_dir, ('stream.' + file_type)),
+                    os.path.join(input_dir, ('mmap.' + file_type)),
+                    shallow=False
+                ))
+                del self.blank_paper.rules[:]
+                self.blank_paper.value_rules.clear()
+                self.blank_paper.record_rules.clear()
+        finally:
+            sandpaper.delimited.BLOCK_SIZE = block_size
+            shutil.rmtree(input_dir)
+            del self.blank_paper.rules[:]
+            self.blank_paper.value_rules.clear()
+            self.blank_paper.record_rules.clear()
+
+    def test_apply_pipeline(self):
+        """ Tests applying with separate reading and writing threads.
+        """
+
+        static_dir = os.path.join(
+            os.path.dirname(__file__), 'static', 'rules', 'lower'
+        )
+        input_dir = tempfile.mkdtemp()
+        try:
+            self.blank_paper.lower()
+            for extension in ('.csv', '.xlsx',):
+                (serial_file, pipelined_file,) = (
+                    os.path.join(input_dir, ('serial' + extension)),
+                    os.path.join(input_dir, ('pipelined' + extension)),
+                )
+                self.blank_paper.apply(
+                    os.path.join(static_dir, 'pre.csv'), serial_file
+                )
+                report = self.blank_paper.apply(
+                    os.path.join(static_dir, 'pre.csv'), pipelined_file,
+                    pipeline=1, batch_size=2, collect_metrics=True
+                )
+                self.assertEqual(report['rows_written'], report['rows_read'])
+                self.assertEqual(
+                    pyexcel.get_array(file_name=pipelined_file),
+                    pyexcel.get_array(file_name=serial_file)
+                )
+                pyexcel.free_resources()
+
+            with self.assertRaises(IOError):
+                self.blank_paper.apply(
+                    os.path.join(input_dir, 'missing.csv'),
+                    os.path.join(input_dir, 'missing.sanded.csv'),
+                    pipeline=1
+                )
+            with self.assertRaises(IOError):
+                self.blank_paper.apply(
+                    os.path.join(static_dir, 'pre.csv'),
+                    os.path.join(input_dir, 'missing', 'pre.sanded.csv'),
+                    pipeline=1, batch_size=1
+                )
+
+            # failed writers never leave the reading thread behind
+            from_file = os.path.join(input_dir, 'many.csv')
+            with open(from_file, 'w') as fp:
+                fp.write('id,name\n')
+                for index in range(100):
+                    fp.write(('{index},Name\n').format(**locals()))
+            errors = []
+            for _ in range(3):
+                try:
+                    self.blank_paper.apply(
+                        from_file,
+                        os.path.join(input_dir, 'missing', 'many.csv'),
+                        pipeline=1, batch_size=1
+                    )
+                except IOError as error:
+                    # callers keeping the error keep its traceback alive
+                    errors.append(error)
+            self.assertEqual(len(errors), 3)
+            self.assertFalse(any(
+                thread.name == 'sandpaper-read'
+                for thread in threading.enumerate()
+            ))
+
+            read = []
+            items = sandpaper.pipelining.read_ahead(
+                (read.append(item) or item for item in range(100)),
+                batch_size=2, depth=1
+            )
+            self.assertEqual(next(items), 0)
+            items.close()
+            self.assertLess(len(read), 100)
+        finally:
+            shutil.rmtree(input_dir)
+            del self.blank_paper.rules[:]
+            self.blank_paper.value_rules.clear()
+
+    def test_collect_metrics(self):
+        """ Tests the performance report of an application.
+        """
+
+        static_dir = os.path.join(
+            os.path.dirname(__file__), 'static', 'rules', 'lower'
+        )
+        output_dir = tempfile.mkdtemp()
+        try:
+            for engine in ('row', 'columnar',):
+                report = self.blank_paper.lower().upper(
+                    column_filter='value'
+                ).lower().apply(
+                    os.path.join(static_dir, 'pre.csv'),
+                    os.path.join(output_dir, 'post.csv'),
+                    row_filter=(
+                        lambda record, normalized=False:
+                        record['id'] != (3 if normalized else 1)
+                    ),
+                    engine=engine, collect_metrics=True
+                )
+                self.assertEqual(
+                    (
+                        report['rows_read'], report['rows_written'],
+                        report['rows_dropped']['pre'],
+                        report['rows_dropped']['post'],
+                    ),
+                    (3, 1, 1, 1,)
+                )
+                self.assertEqual(
+                    [
+                        (rule['position'], rule['rule'], rule['count'],)
+                        for rule in report['rules']
+                    ],
+                    [(0, 'lower', 6,), (1, 'upper', 2,), (2, 'lower', 6,)]
+                )
+                self.assertEqual(
+                    list(report['rules'][1]['columns'].keys()), ['value']
+                )
+                for key in (
+                    'read_time', 'normalize_time', 'write_time', 'elapsed',
+                ):
+                    self.assertGreaterEqual(report[key], 0.0)
+                del self.blank_paper.rules[:]
+                self.blank_paper.value_rules.clear()
+        finally:
+            shutil.rmtree(output_dir)
+
+    def test_fused_value_rules(self):
+        """ Tests fusing consecutive built-in value rules.
+        """
+
+        self.blank_paper.strip().upper(value_filter='A').lower(
+            callable_filter=lambda record, column, **kwargs: True
+        ).lower().title(column_filter='b')
+        (steps, _,) = self.blank_paper._resolve_rules(
+            self.blank_paper._compile_rules(), 0, ('a', 'b',)
+        )
+        self.assertIsInstance(steps[0][1], sandpaper.sandpaper.FusedValueRules)
+        self.assertEqual(
+            [rule.__name__ for (_, rule, _, _, _,) in steps[0][1].steps],
+            ['strip', 'upper']
+        )
+        self.assertEqual(
+            [rule.__name__ for (_, rule, _, _, _,) in steps[1:]],
+            ['lower', 'lower', 'title']
+        )
+
+        record = collections.OrderedDict([('a', ' ab '), ('b', ' bA ')])
+        self.assertEqual(
+            self.blank_paper._run_steps(record, steps),
+            collections.OrderedDict([('a', 'ab'), ('b', 'Ba')])
+        )
+
+    def test_records(self):
+        """ Tests records sharing interned headers.
+        """
+
+        Header = sandpaper.records.Header
+        header = Header.intern(('a', 'b', 'c',))
+        self.assertIs(Header.intern(['a', 'b', 'c']), header)
+        record = sandpaper.records.Record(header, [1, 2, 3])
+        self.assertEqual(
+            record, collections.OrderedDict([('a', 1), ('b', 2), ('c', 3)])
+        )
+
+        record['d'] = 4
+        del record['a']
+        self.assertEqual(list(record.items()), [('b', 2), ('c', 3), ('d', 4)])
+        self.assertIs(record.header, Header.intern(('b', 'c', 'd',)))
+        self.assertEqual(record.copy().row, [2, 3, 4])
+
+        renames = {'b': 'c', 'd': 'e'}
+        for _ in range(2):
+            renamed = self.blank_paper.rename_columns.__wrapped__(
+                self.blank_paper, record.copy(), renames
+            )
+            self.assertEqual(list(renamed.items()), [('c', 3), ('e', 4)])
+            self.assertIs(renamed.header, Header.intern(('c', 'e',)))
+
+        ordered = self.blank_paper.order_columns.__wrapped__(
+            self.blank_paper,
+            sandpaper.sandpaper.CopyOnWriteRecord(record), ['d', 'x', 'b']
+        )
+        self.assertEqual(list(ordered.items()), [('d', 4), ('b', 2), ('c', 3)])
+        self.assertEqual(list(record.items()), [('b', 2), ('c', 3), ('d', 4)])
+
+    def test_transform(self):
+        """ Tests lazily applying rules to records in memory.
+        """
+
+        records = [
+            collections.OrderedDict([('id', str(index)), ('name', ' A ')])
+            for index in range(4)
+        ]
+        self.blank_paper.strip().lower().rename_columns({'name': 'key'})
+        try:
+            for engine in ('row', 'columnar',):
+                stats = {}
+                transformed = self.blank_paper.transform(
+                    records, stats=stats, engine=engine, batch_size=3,
+                    row_filter=(lambda record, normalized=False: (
+                        record['id'] != '2'
+                    ))
+                )
+                self.assertEqual(stats, {})
+                self.assertEqual(
+                    [list(record.items()) for record in transformed],
+                    [
+                        [('id', str(index)), ('key', 'a')]
+                        for index in (0, 1, 3,)
+                    ]
+                )
+                self.assertEqual(
+                    stats, {'strip': 6, 'lower': 6, 'rename_columns': 3}
+                )
+                self.assertEqual(list(records[0].items()), [
+                    ('id', '0'), ('name', ' A '),
+                ])
+
+                copied = [record.copy() for record in records]
+                transformed = list(self.blank_paper.transform(
+                    copied, engine=engine, copy_records=False, in_place=True
+                ))
+                self.assertEqual(len(transformed), 4)
+                for (record, source,) in zip(transformed, copied):
+                    self.assertIs(record, source)
+                    self.assertEqual(list(record.items()), [
+                        ('id', record['id']), ('key', 'a'),
+                    ])
+            self.assertEqual(self.blank_paper._SandPaper__rule_stats, {})
+        finally:
+            del self.blank_paper.rules[:]
+            self.blank_paper.value_rules.clear()
+            self.blank_paper.record_rules.clear()
+
+    def test_column_mapping(self):
+        """ Tests resolving built-in column rules against a header.
+        """
+
+        self.blank_paper.rename_columns({'a': 'x'}).upper().keep_columns(
+            ['x', 'c']
+        ).order_columns(['c'])
+        (steps, start,) = self.blank_paper._resolve_rules(
+            self.blank_paper._compile_rules(), 0, ('a', 'b', 'c',)
+        )
+        self.assertIsNone(start)
+        ColumnMapping = sandpaper.sandpaper.ColumnMapping
+        self.assertEqual(
+            [isinstance(rule, ColumnMapping) for (_, rule, _, _, _,) in steps],
+            [True, False, True, True]
+        )
+        self.assertEqual(steps[1][-1][0], ('x', 'c',))
+
+        record = sandpaper.records.Record(
+            sandpaper.records.Header.intern(('a', 'b', 'c',)), ['a', 'b', 'c']
+        )
+        for argument in (
+            record, collections.OrderedDict(record.items()),
+        ):
+            self.assertEqual(
+                list(self.blank_paper._run_steps(argument, steps).items()),
+                [('c', 'C'), ('x', 'A')]
+            )
+
+        # records with other columns fall back to the rule itself
+        other = collections.OrderedDict([('b', 'b'), ('a', 'a')])
+        self.assertIsNone(steps[0][1].map(other))
+        self.assertEqual(
+            self.blank_paper._run_steps(other, steps[:1]),
+            collections.OrderedDict([('b', 'b'), ('x', 'a')])
+        )
+
+    def test_projection(self):
+        """ Tests finding the columns needed by the rules.
+        """
+
+        paper = self.blank_paper.strip().add_columns({
+            'full': '{first} {last!s:>{width}}',
+        }).lower().rename_columns({'id': 'key'}).keep_columns(['key', 'full'])
+        (read, live,) = sandpaper.projection.live_columns(
+            paper._compile_rules(), paper._is_builtin_rule
+        )
+        # key is needed as it is only replaced if there is an id column
+        self.assertEqual(
+            read.names, {'first', 'last', 'width', 'id', 'key', 'full'}
+        )
+        self.assertFalse(read.complement)
+        self.assertEqual(live[2].names, {'id', 'key', 'full'})
+        self.assertNotIn('first', live[2])
+        self.assertTrue(live[-1].everything)
+
+        (steps, _,) = paper._resolve_rules(
+            paper._compile_rules(), 0, ('id', 'first', 'extra',)
+        )
+        self.assertEqual(steps[0][-1][0], ('id', 'first',))
+
+        # columns read by callables could be any column
+        paper = sandpaper.SandPaper().add_columns({
+            'other': lambda record: record['extra'],
+        }).keep_columns(['other'])
+        (read, _,) = sandpaper.projection.live_columns(
+            paper._compile_rules(), paper._is_builtin_rule
+        )
+        self.assertTrue(read.everything)
+
+    def test_memoize(self):
+        """ Tests memoized application of built-in value rules.
+        """
+
+        cache = sandpaper.caching.LRUCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual((cache.get('a'), cache.get('c'),), (1, 3,))
+
+        static_dir = os.path.join(
+            os.path.dirname(__file__), 'static', 'rules', 'lower'
+        )
+        output_dir = tempfile.mkdtemp()
+        try:
+            to_file = os.path.join(output_dir, 'post.csv')
+            stats = self.blank_paper.lower().apply(
+                os.path.join(static_dir, 'pre.csv'), to_file,
+                monitor_rules=True, memoize=16
+            )
+            self.assertTrue(filecmp.cmp(
+                to_file, os.path.join(static_dir, 'post.csv')
+            ))
+            self.assertEqual(
+                stats['lower.memo_hits'] + stats['lower.memo_misses'],
+                stats['lower']
+            )
+        finally:
+            shutil.rmtree(output_dir)
+            del self.blank_paper.rules[:]
+            self.blank_paper.value_rules.clear()